@@ -11,8 +11,11 @@ This module handles:
 import argparse
 import sys
 import logging
+from functools import cached_property
 from typing import Any, Optional
 
+from core.config import DATA_MODES
+
 logger = logging.getLogger(__name__)
 
 # Default output filenames
@@ -20,10 +23,122 @@ STANDARD_TRADES_CSV = "trades.csv"
 DETAILED_TRADES_CSV = "detailed_trades.csv"
 CONSOLIDATED_TRADES_CSV = "consolidated_trades.csv"
 
+MAX_WEEKS = 1000  # Upper bound on --weeks
+
+# Log formatters, shared by every handler configure_logging sets up
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_VERBOSE_LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
+)
+
+# Help text, built once at import
+_EXAMPLES_TEXT = """
+Examples:
+  # Run with default configuration
+  python main.py --backtest
+  
+  # Run only wheel strategy with live data
+  python main.py --wheel --no-rotator --data-mode live
+  
+  # Run with custom configuration and verbose output
+  python main.py --config custom.yaml --backtest -vv
+  
+  # Check data source health
+  python main.py --health-check
+  
+  # Dry run to validate configuration
+  python main.py --dry-run --config config/config.yaml
+  
+  # Run with custom capital and output files
+  python main.py --backtest --initial-capital 250000 --output my_trades.csv
+  
+  # Run specific strategies for different durations
+  python main.py --backtest --wheel --weeks 26 --verbose
+  
+Configuration:
+  Edit config/config.yaml to customize:
+  - Strategy parameters and allocations
+  - Market data sources and API keys
+  - Symbol lists and trading parameters
+  
+Data Modes:
+  - mock: Uses deterministic mock data for reproducible testing
+  - live: Fetches real market data from configured APIs
+  - hybrid: Falls back to mock data when APIs are unavailable
+  
+Environment Variables:
+  Set API keys in .env file:
+  - COINGECKO_API_KEY: For cryptocurrency data
+  - ALPHA_VANTAGE_API_KEY: For backup ETF data
+  
+For more information, see documentation in README.md
+""".strip()
+
+# Strategy on/off switches, each registered as a single --x/--no-x option
+_STRATEGY_TOGGLES = (
+    ('wheel', 'Force enable/disable options wheel strategy (overrides config file). '
+              'Trades SPY, QQQ, IWM using cash-secured puts and covered calls'),
+    ('rotator', 'Force enable/disable crypto rotator strategy (overrides config file). '
+                'Rotates between BTC, ETH, SOL based on weekly performance'),
+)
+
+_VERSION_TAGLINE = "Multi-strategy trading simulation with live market data support"
+
+_CONFIG_HELP_TEXT = "\n".join([
+    "Configuration Help:",
+    "==================",
+    "",
+    "The configuration file (config/config.yaml) supports these sections:",
+    "",
+    "Basic Settings:",
+    "  initial_capital: 100000",
+    "  data_mode: 'mock'  # or 'live', 'hybrid'",
+    "",
+    "Strategy Configuration:",
+    "  strategies:",
+    "    wheel: true",
+    "    rotator: true",
+    "",
+    "Capital Allocation:",
+    "  allocation:",
+    "    wheel: 0.5",
+    "    rotator: 0.5",
+    "",
+    "Symbol Lists:",
+    "  wheel_symbols: ['SPY', 'QQQ', 'IWM']",
+    "  rotator_symbols: ['BTC', 'ETH', 'SOL']",
+    "",
+    "For full configuration reference, see config/config.yaml"
+])
+
 
 class CLIError(Exception):
     """Exception raised for CLI errors."""
-    pass
+    __slots__ = ()
+
+
+def _weeks(value: str) -> int:
+    """argparse type for --weeks: a positive, bounded week count."""
+    try:
+        weeks = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if weeks <= 0:
+        raise argparse.ArgumentTypeError("Number of weeks must be positive")
+    if weeks > MAX_WEEKS:
+        raise argparse.ArgumentTypeError(f"Number of weeks seems unreasonably large (max: {MAX_WEEKS})")
+    return weeks
+
+
+def _initial_capital(value: str) -> float:
+    """argparse type for --initial-capital: a positive amount."""
+    try:
+        capital = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: {value!r}")
+    if capital <= 0:
+        raise argparse.ArgumentTypeError("Initial capital must be positive")
+    return capital
 
 
 class TradingCLI:
@@ -36,7 +151,11 @@ class TradingCLI:
             prog_name: Program name for help text
         """
         self.prog_name = prog_name
-        self.parser = self._create_parser()
+    
+    @cached_property
+    def parser(self) -> argparse.ArgumentParser:
+        """Argument parser, built on first use so importing the module stays cheap."""
+        return self._create_parser()
     
     def _create_parser(self) -> argparse.ArgumentParser:
         """Create argument parser with all options.
@@ -47,7 +166,8 @@ class TradingCLI:
         parser = argparse.ArgumentParser(
             description=f'{self.prog_name} - Multi-strategy trading simulation with live data support',
             formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog=self._get_examples_text()
+            epilog=self._get_examples_text(),
+            exit_on_error=False  # Surface type errors as CLIError with their message
         )
         
         # Main execution mode
@@ -71,35 +191,13 @@ class TradingCLI:
             'Override which strategies to run (overrides config file settings)'
         )
         
-        strategy_group.add_argument(
-            '--wheel',
-            dest='wheel',
-            action='store_true',
-            help='Force enable options wheel strategy (overrides config file). '
-                 'Trades SPY, QQQ, IWM using cash-secured puts and covered calls'
-        )
-        
-        strategy_group.add_argument(
-            '--no-wheel',
-            dest='wheel',
-            action='store_false',
-            help='Force disable options wheel strategy (overrides config file)'
-        )
-        
-        strategy_group.add_argument(
-            '--rotator',
-            dest='rotator',
-            action='store_true',
-            help='Force enable crypto rotator strategy (overrides config file). '
-                 'Rotates between BTC, ETH, SOL based on weekly performance'
-        )
-        
-        strategy_group.add_argument(
-            '--no-rotator',
-            dest='rotator',
-            action='store_false',
-            help='Force disable crypto rotator strategy (overrides config file)'
-        )
+        for flag, help_text in _STRATEGY_TOGGLES:
+            strategy_group.add_argument(
+                f'--{flag}',
+                action=argparse.BooleanOptionalAction,
+                default=None,
+                help=help_text
+            )
         
         # Output options
         output_group = parser.add_argument_group(
@@ -173,7 +271,7 @@ class TradingCLI:
         
         data_group.add_argument(
             '--data-mode',
-            choices=['mock', 'live', 'hybrid'],
+            choices=DATA_MODES,
             help='Override data mode from config (mock=deterministic, live=real APIs, hybrid=fallback)'
         )
         
@@ -197,14 +295,14 @@ class TradingCLI:
         
         sim_group.add_argument(
             '--weeks',
-            type=int,
+            type=_weeks,
             default=52,
             help='Number of weeks to simulate (default: 52)'
         )
         
         sim_group.add_argument(
             '--initial-capital',
-            type=float,
+            type=_initial_capital,
             help='Override initial capital from config file'
         )
         
@@ -214,9 +312,6 @@ class TradingCLI:
             help='Validate configuration and show execution plan without running'
         )
         
-        # Set defaults to None for strategy flags so unspecified flags don't override config
-        parser.set_defaults(wheel=None, rotator=None)
-        
         return parser
     
     def parse_args(self, args: Optional[list] = None) -> Any:
@@ -245,6 +340,9 @@ class TradingCLI:
     def _validate_args(self, args: Any) -> None:
         """Validate parsed arguments for consistency.
         
+        Per-value range checks live in the argparse type callables; this
+        only covers checks that span several arguments.
+        
         Args:
             args: Parsed arguments
             
@@ -255,18 +353,6 @@ class TradingCLI:
         if args.quiet and args.verbose > 0:
             raise CLIError("Cannot use both --quiet and --verbose flags")
         
-        # Validate weeks parameter
-        if hasattr(args, 'weeks') and args.weeks is not None:
-            if args.weeks <= 0:
-                raise CLIError("Number of weeks must be positive")
-            if args.weeks > 1000:
-                raise CLIError("Number of weeks seems unreasonably large (max: 1000)")
-        
-        # Validate initial capital
-        if hasattr(args, 'initial_capital') and args.initial_capital is not None:
-            if args.initial_capital <= 0:
-                raise CLIError("Initial capital must be positive")
-        
         # Validate conflicting strategy flags
         if hasattr(args, 'wheel') and hasattr(args, 'rotator'):
             if args.wheel is False and args.rotator is False:
@@ -275,6 +361,9 @@ class TradingCLI:
     def configure_logging(self, args: Any) -> None:
         """Configure logging based on CLI arguments.
         
+        Calling it again reconfigures the handlers it added earlier instead of
+        stacking new ones, and leaves other handlers on the root logger alone.
+        
         Args:
             args: Parsed arguments
         """
@@ -288,26 +377,36 @@ class TradingCLI:
         else:
             log_level = logging.INFO
         
-        # Configure format
-        if args.verbose >= 2:
-            log_format = '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
-        else:
-            log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        
-        # Configure root logger
-        logging.basicConfig(
-            level=log_level,
-            format=log_format,
-            force=True  # Override any existing configuration
-        )
+        formatter = _VERBOSE_LOG_FORMATTER if args.verbose >= 2 else _LOG_FORMATTER
+        root_logger = logging.getLogger()
+        root_logger.setLevel(log_level)
+        
+        # Reconfigure handlers from an earlier call in place; drop old log files
+        console_handler = None
+        for handler in root_logger.handlers[:]:
+            if not getattr(handler, '_trading_mvp', False):
+                continue
+            if isinstance(handler, logging.FileHandler):
+                root_logger.removeHandler(handler)
+                handler.close()
+            elif console_handler is None:
+                console_handler = handler
+        
+        if console_handler is None:
+            console_handler = logging.StreamHandler()
+            console_handler._trading_mvp = True
+            root_logger.addHandler(console_handler)
+        console_handler.setLevel(log_level)
+        console_handler.setFormatter(formatter)
         
         # Add file handler if specified
         if hasattr(args, 'log_file') and args.log_file:
             try:
                 file_handler = logging.FileHandler(args.log_file)
+                file_handler._trading_mvp = True
                 file_handler.setLevel(log_level)
-                file_handler.setFormatter(logging.Formatter(log_format))
-                logging.getLogger().addHandler(file_handler)
+                file_handler.setFormatter(formatter)
+                root_logger.addHandler(file_handler)
                 logger.info(f"Logging to file: {args.log_file}")
             except Exception as e:
                 logger.warning(f"Could not set up file logging: {e}")
@@ -318,79 +417,15 @@ class TradingCLI:
         Returns:
             str: Examples section text
         """
-        return """
-Examples:
-  # Run with default configuration
-  python main.py --backtest
-  
-  # Run only wheel strategy with live data
-  python main.py --wheel --no-rotator --data-mode live
-  
-  # Run with custom configuration and verbose output
-  python main.py --config custom.yaml --backtest -vv
-  
-  # Check data source health
-  python main.py --health-check
-  
-  # Dry run to validate configuration
-  python main.py --dry-run --config config/config.yaml
-  
-  # Run with custom capital and output files
-  python main.py --backtest --initial-capital 250000 --output my_trades.csv
-  
-  # Run specific strategies for different durations
-  python main.py --backtest --wheel --weeks 26 --verbose
-  
-Configuration:
-  Edit config/config.yaml to customize:
-  - Strategy parameters and allocations
-  - Market data sources and API keys
-  - Symbol lists and trading parameters
-  
-Data Modes:
-  - mock: Uses deterministic mock data for reproducible testing
-  - live: Fetches real market data from configured APIs
-  - hybrid: Falls back to mock data when APIs are unavailable
-  
-Environment Variables:
-  Set API keys in .env file:
-  - COINGECKO_API_KEY: For cryptocurrency data
-  - ALPHA_VANTAGE_API_KEY: For backup ETF data
-  
-For more information, see documentation in README.md
-        """.strip()
+        return _EXAMPLES_TEXT
     
     def print_version(self) -> None:
         """Print version information."""
-        print(f"{self.prog_name} v1.0.0")
-        print("Multi-strategy trading simulation with live market data support")
+        print(f"{self.prog_name} v1.0.0\n{_VERSION_TAGLINE}")
     
     def print_config_help(self) -> None:
         """Print configuration help."""
-        print("Configuration Help:")
-        print("==================")
-        print()
-        print("The configuration file (config/config.yaml) supports these sections:")
-        print()
-        print("Basic Settings:")
-        print("  initial_capital: 100000")
-        print("  data_mode: 'mock'  # or 'live', 'hybrid'")
-        print()
-        print("Strategy Configuration:")
-        print("  strategies:")
-        print("    wheel: true")
-        print("    rotator: true")
-        print()
-        print("Capital Allocation:")
-        print("  allocation:")
-        print("    wheel: 0.5")
-        print("    rotator: 0.5")
-        print()
-        print("Symbol Lists:")
-        print("  wheel_symbols: ['SPY', 'QQQ', 'IWM']")
-        print("  rotator_symbols: ['BTC', 'ETH', 'SOL']")
-        print()
-        print("For full configuration reference, see config/config.yaml")
+        print(_CONFIG_HELP_TEXT)
 
 
 # Global CLI instance
@@ -8,9 +8,10 @@ This module handles:
 - Configuration validation and error handling
 """
 
+import copy
 import os
-import yaml
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -20,11 +21,44 @@ logger = logging.getLogger(__name__)
 ALLOCATION_TOLERANCE = 0.01  # Allow small floating point errors in allocation percentages
 DEFAULT_INITIAL_CAPITAL = 100000
 DEFAULT_CONFIG_PATH = "config/config.yaml"
+DATA_MODES = ('mock', 'live', 'hybrid')  # Valid values of data_mode
+CLI_STRATEGY_FLAGS = ('wheel', 'rotator')  # CLI flags that override strategies.*
+REQUIRED_FIELDS = ('initial_capital', 'strategies', 'allocation')  # Top-level keys a config must set
+
+# Set forms of the above for membership checks
+_REQUIRED_FIELDS = frozenset(REQUIRED_FIELDS)
+_VALID_DATA_MODES = frozenset(DATA_MODES)
+
+
+@lru_cache(maxsize=None)
+def _yaml_loader() -> Any:
+    """Return PyYAML's safe loader, importing yaml on first use.
+    
+    Deferring the import keeps it off the startup path of importers such
+    as the CLI that never read a config file.
+    """
+    import yaml
+    
+    # libyaml's C loader when available, pure Python otherwise
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, reusing the result while the file is unchanged.
+    
+    The modification time and size are part of the cache key so an edited
+    file is parsed again. Callers must not mutate the returned object.
+    """
+    import yaml
+    
+    with open(path, 'r') as file:
+        return yaml.load(file, Loader=_yaml_loader())
 
 
 class ConfigError(Exception):
     """Exception raised for configuration errors."""
-    pass
+    __slots__ = ()
 
 
 class ConfigManager:
@@ -97,6 +131,8 @@ class ConfigManager:
         Raises:
             ConfigError: If configuration loading or validation fails
         """
+        import yaml
+        
         self._config_path = config_path
         
         try:
@@ -104,8 +140,10 @@ class ConfigManager:
             if not config_file.exists():
                 raise ConfigError(f"Config file '{config_path}' not found.")
             
-            with open(config_path, 'r') as file:
-                config = yaml.safe_load(file)
+            stat = config_file.stat()
+            config = copy.deepcopy(_parse_yaml_cached(
+                str(config_file.resolve()), stat.st_mtime_ns, stat.st_size
+            ))
                 
         except yaml.YAMLError as e:
             raise ConfigError(f"Error parsing config file: {e}")
@@ -132,10 +170,11 @@ class ConfigManager:
             ConfigError: If validation fails
         """
         # Validate required fields in provided config before merging defaults
-        required_fields = ['initial_capital', 'strategies', 'allocation']
-        for field in required_fields:
-            if field not in config:
-                raise ConfigError(f"Missing required configuration field: {field}")
+        missing = _REQUIRED_FIELDS.difference(config)
+        if missing:
+            # Report in declaration order so the message is deterministic
+            field = next(f for f in REQUIRED_FIELDS if f in missing)
+            raise ConfigError(f"Missing required configuration field: {field}")
         
         # Start with defaults and update with provided config
         default_config = self.get_default_config()
@@ -174,10 +213,9 @@ class ConfigManager:
                     raise ConfigError(f"{symbol_field} cannot be empty")
         
         # Validate data mode
-        valid_data_modes = ['mock', 'live', 'hybrid']
         data_mode = validated_config.get('data_mode', 'mock')
-        if data_mode not in valid_data_modes:
-            raise ConfigError(f"data_mode must be one of {valid_data_modes}")
+        if not isinstance(data_mode, str) or data_mode not in _VALID_DATA_MODES:
+            raise ConfigError(f"data_mode must be one of {list(DATA_MODES)}")
         
         logger.debug("Configuration validation completed successfully")
         return validated_config
@@ -190,25 +228,29 @@ class ConfigManager:
             args: Parsed CLI arguments
             
         Returns:
-            dict: Configuration with CLI overrides applied
+            dict: Configuration with CLI overrides applied. The original is
+            never modified; it is returned as-is when nothing is overridden.
         """
-        # Create a deep copy to avoid modifying original
-        import copy
-        config = copy.deepcopy(config)
-        
-        # Override strategy enabling/disabling
-        if hasattr(args, 'wheel') and args.wheel is not None:
-            config['strategies']['wheel'] = args.wheel
-            logger.info(f"CLI override: wheel strategy {'enabled' if args.wheel else 'disabled'}")
-        
-        if hasattr(args, 'rotator') and args.rotator is not None:
-            config['strategies']['rotator'] = args.rotator
-            logger.info(f"CLI override: rotator strategy {'enabled' if args.rotator else 'disabled'}")
-        
         # Override config file path
         if hasattr(args, 'config') and args.config:
             self._config_path = args.config
         
+        strategy_overrides = {
+            name: getattr(args, name) for name in CLI_STRATEGY_FLAGS
+            if getattr(args, name, None) is not None
+        }
+        if not strategy_overrides:
+            return config
+        
+        # Copy only the parts being changed; everything else stays shared
+        config = dict(config)
+        config['strategies'] = dict(config['strategies'])
+        
+        # Override strategy enabling/disabling
+        for name, enabled in strategy_overrides.items():
+            config['strategies'][name] = enabled
+            logger.info(f"CLI override: {name} strategy {'enabled' if enabled else 'disabled'}")
+        
         return config
     
     def get_enabled_strategies(self, config: Dict[str, Any]) -> Dict[str, bool]:
@@ -241,12 +283,10 @@ class ConfigManager:
             return {strategy_name: 1.0}
         
         # Multiple strategies use configured allocations
-        strategy_allocations = {}
-        for strategy_name in enabled_strategies:
-            allocation = allocation_config.get(strategy_name, 0.0)
-            strategy_allocations[strategy_name] = allocation
-        
-        return strategy_allocations
+        return {
+            strategy_name: allocation_config.get(strategy_name, 0.0)
+            for strategy_name in enabled_strategies
+        }
     
     def get_strategy_capital(self, config: Dict[str, Any], strategy_name: str) -> float:
         """Get capital allocation for a specific strategy.
@@ -276,11 +316,18 @@ class ConfigManager:
         """
         result = base.copy()
         
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+        # Walk the override tree with an explicit stack; nested base dicts are
+        # copied only on the paths the override actually touches
+        stack = [(result, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    target[key] = current = current.copy()
+                    stack.append((current, value))
+                else:
+                    target[key] = value
         
         return result
     
@@ -0,0 +1,26 @@
+"""
+Optional JIT compilation support.
+
+Numba is an optional dependency. When it is installed, numeric simulation
+kernels are compiled to native code with ``njit``; otherwise the decorator
+is a no-op and the kernels run as plain Python/NumPy. ``prange`` marks loops
+that ``njit(parallel=True)`` may spread across cores; without numba it is
+plain ``range``.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback ``njit`` that returns the decorated function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
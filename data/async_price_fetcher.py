@@ -3,7 +3,7 @@ Asynchronous Market Data Fetcher
 
 This module provides async/await-based market data fetching with:
 - httpx.AsyncClient for non-blocking HTTP requests
-- Connection pooling and keep-alive
+- Connection pooling and keep-alive, with HTTP/2 multiplexing when h2 is installed
 - Concurrent API calls for multiple symbols
 - Integration with FastAPI BackgroundTasks
 - Backward compatibility with sync interfaces
@@ -11,9 +11,11 @@ This module provides async/await-based market data fetching with:
 
 import asyncio
 import aiofiles
+import inspect
 import json
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 import os
@@ -29,6 +31,28 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401  # enables httpx's HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when installed.
+    
+    Non-str dict keys are written as strings on both paths, as json.dumps does.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                            | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
 
 class AsyncPriceFetcher:
     """
@@ -75,18 +99,26 @@ class AsyncPriceFetcher:
         
         # HTTP client (will be initialized when needed)
         self._client: Optional[httpx.AsyncClient] = None
+        self._context_depth = 0
         
         logger.info(f"AsyncPriceFetcher initialized with {crypto_rate_limit} crypto, "
                    f"{etf_rate_limit} ETF rate limits")
     
     async def __aenter__(self):
-        """Async context manager entry."""
+        """Async context manager entry.
+        
+        Entries nest: re-entering an open fetcher reuses its client, and only
+        the outermost exit closes it.
+        """
+        self._context_depth += 1
         await self._ensure_client()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.close()
+        self._context_depth -= 1
+        if self._context_depth == 0:
+            await self.close()
     
     async def _ensure_client(self):
         """Ensure HTTP client is initialized."""
@@ -98,9 +130,13 @@ class AsyncPriceFetcher:
                 keepalive_expiry=30.0
             )
             
-            timeout = httpx.Timeout(self.timeout)
+            # Fail fast on unreachable hosts instead of waiting the full timeout
+            timeout = httpx.Timeout(self.timeout, connect=min(self.timeout, 3.0))
             
+            # HTTP/2 lets concurrent requests to one host share a single
+            # TLS connection instead of opening one each
             self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
                 limits=limits,
                 timeout=timeout,
                 headers={
@@ -108,7 +144,8 @@ class AsyncPriceFetcher:
                 }
             )
             
-            logger.debug("HTTP client initialized with connection pooling")
+            logger.debug("HTTP client initialized with connection pooling (HTTP/2: %s)",
+                         HTTP2_AVAILABLE)
     
     async def close(self):
         """Close HTTP client and cleanup resources."""
@@ -345,67 +382,79 @@ class AsyncPriceFetcher:
         try:
             cache_file.parent.mkdir(parents=True, exist_ok=True)
             
-            async with aiofiles.open(cache_file, 'w') as f:
-                await f.write(json.dumps(data, indent=2))
+            async with aiofiles.open(cache_file, 'wb') as f:
+                await f.write(_dump_json_bytes(data))
                 
             logger.debug(f"Cached data to {cache_file}")
             
         except Exception as e:
             logger.error(f"Failed to cache data to {cache_file}: {e}")
     
-    async def health_check_async(self) -> Dict[str, str]:
-        """
-        Perform async health check of all data sources.
-        
-        Returns:
-            Dictionary with status of each data source
-        """
-        await self._ensure_client()
-        
-        health_status = {}
-        
-        # Test CoinGecko
+    async def _check_coingecko(self) -> str:
+        """Probe the CoinGecko ping endpoint."""
         try:
             url = "https://api.coingecko.com/api/v3/ping"
             response = await self._client.get(url, timeout=10.0)
             if response.status_code == 200:
-                health_status['coingecko'] = '✅ Working'
-            else:
-                health_status['coingecko'] = f'❌ Status {response.status_code}'
+                return '✅ Working'
+            return f'❌ Status {response.status_code}'
         except Exception as e:
-            health_status['coingecko'] = f'❌ Error: {str(e)[:50]}'
-        
-        # Test Alpha Vantage (if API key available)
-        if self.alpha_vantage_api_key:
-            try:
-                url = "https://www.alphavantage.co/query"
-                params = {
-                    'function': 'GLOBAL_QUOTE',
-                    'symbol': 'SPY',
-                    'apikey': self.alpha_vantage_api_key
-                }
-                response = await self._client.get(url, params=params, timeout=10.0)
-                if response.status_code == 200:
-                    health_status['alpha_vantage'] = '✅ Working'
-                else:
-                    health_status['alpha_vantage'] = f'❌ Status {response.status_code}'
-            except Exception as e:
-                health_status['alpha_vantage'] = f'❌ Error: {str(e)[:50]}'
-        else:
-            health_status['alpha_vantage'] = '⚠️  No API key'
-        
-        # Test yfinance (run in thread)
+            return f'❌ Error: {str(e)[:50]}'
+    
+    async def _check_alpha_vantage(self) -> str:
+        """Probe Alpha Vantage with a SPY quote (if API key available)."""
+        if not self.alpha_vantage_api_key:
+            return '⚠️  No API key'
+        try:
+            url = "https://www.alphavantage.co/query"
+            params = {
+                'function': 'GLOBAL_QUOTE',
+                'symbol': 'SPY',
+                'apikey': self.alpha_vantage_api_key
+            }
+            response = await self._client.get(url, params=params, timeout=10.0)
+            if response.status_code == 200:
+                return '✅ Working'
+            return f'❌ Status {response.status_code}'
+        except Exception as e:
+            return f'❌ Error: {str(e)[:50]}'
+    
+    async def _check_yfinance(self) -> str:
+        """Probe yfinance with a one-day SPY history (run in thread)."""
         try:
             ticker = await asyncio.to_thread(yf.Ticker, 'SPY')
             hist = await asyncio.to_thread(ticker.history, period="1d")
             if not hist.empty:
-                health_status['yfinance'] = '✅ Working'
-            else:
-                health_status['yfinance'] = '❌ No data returned'
+                return '✅ Working'
+            return '❌ No data returned'
         except Exception as e:
-            health_status['yfinance'] = f'❌ Error: {str(e)[:50]}'
+            return f'❌ Error: {str(e)[:50]}'
+    
+    async def health_check_async(self) -> Dict[str, str]:
+        """
+        Perform async health check of all data sources.
+        
+        The sources are probed concurrently over the shared client, so the
+        check takes as long as the slowest source rather than their sum.
+        
+        Returns:
+            Dictionary with status of each data source
+        """
+        await self._ensure_client()
         
-        return health_status
+        sources = ['coingecko', 'alpha_vantage', 'yfinance']
+        results = await asyncio.gather(
+            self._check_coingecko(),
+            self._check_alpha_vantage(),
+            self._check_yfinance(),
+            return_exceptions=True
+        )
+        
+        # A probe that fails unexpectedly is reported without hiding the others
+        return {
+            source: f'❌ Error: {str(result)[:50]}' if isinstance(result, BaseException) else result
+            for source, result in zip(sources, results)
+        }
 
 
 class AsyncPriceFetcherWrapper:
@@ -470,29 +519,40 @@ class AsyncPriceFetcherWrapper:
 
 
 # Global instances for convenience
-_async_fetcher: Optional[AsyncPriceFetcher] = None
-_sync_wrapper: Optional[AsyncPriceFetcherWrapper] = None
+_FETCHER_SIGNATURE = inspect.signature(AsyncPriceFetcher)
+
+
+@lru_cache(maxsize=None)
+def _shared_async_fetcher(args: tuple) -> AsyncPriceFetcher:
+    """Create the shared fetcher for one normalized argument tuple."""
+    return AsyncPriceFetcher(**dict(args))
+
+
+@lru_cache(maxsize=None)
+def _shared_sync_wrapper(async_fetcher: AsyncPriceFetcher) -> AsyncPriceFetcherWrapper:
+    """Create the shared sync wrapper around one shared async fetcher."""
+    return AsyncPriceFetcherWrapper(async_fetcher)
 
 
 def get_async_price_fetcher(**kwargs) -> AsyncPriceFetcher:
-    """Get or create global async price fetcher instance."""
-    global _async_fetcher
+    """Get or create global async price fetcher instance.
     
-    if _async_fetcher is None:
-        _async_fetcher = AsyncPriceFetcher(**kwargs)
+    One instance is kept per distinct configuration, for the life of the
+    process, so its HTTP client is never dropped while still open. Omitted
+    arguments are filled with the constructor defaults first, so passing a
+    default explicitly returns the same instance as leaving it out.
     
-    return _async_fetcher
+    Raises:
+        TypeError: If an argument is not accepted by AsyncPriceFetcher
+    """
+    bound = _FETCHER_SIGNATURE.bind(**kwargs)
+    bound.apply_defaults()
+    return _shared_async_fetcher(tuple(bound.arguments.items()))
 
 
 def get_sync_price_fetcher(**kwargs) -> AsyncPriceFetcherWrapper:
     """Get sync wrapper for async price fetcher."""
-    global _sync_wrapper
-    
-    if _sync_wrapper is None:
-        async_fetcher = get_async_price_fetcher(**kwargs)
-        _sync_wrapper = AsyncPriceFetcherWrapper(async_fetcher)
-    
-    return _sync_wrapper
+    return _shared_sync_wrapper(get_async_price_fetcher(**kwargs))
 
 
 # Convenience functions for FastAPI integration
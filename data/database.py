@@ -19,12 +19,27 @@ import logging
 import threading
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Callable, Dict, List, Optional, Any, Union, Tuple
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
 
+_TRADE_REQUIRED_FIELDS = ('strategy', 'symbol', 'action', 'quantity', 'price', 'cash_flow')
+
+_INSERT_TRADE_SQL = """
+    INSERT INTO trades (
+        timestamp, week, strategy, symbol, action, 
+        quantity, price, cash_flow, strike, notes
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _utc_now() -> datetime:
+    """Current time in UTC; TradingDatabase's default clock."""
+    return datetime.now(timezone.utc)
+
+
 class DatabaseError(Exception):
     """Base exception for database operations."""
     pass
@@ -41,14 +56,17 @@ class TradingDatabase:
     - Portfolio snapshots
     """
     
-    def __init__(self, db_path: Union[str, Path] = "trading.db"):
+    def __init__(self, db_path: Union[str, Path] = "trading.db",
+                 clock: Callable[[], datetime] = _utc_now):
         """
         Initialize database connection and ensure tables exist.
         
         Args:
             db_path: Path to SQLite database file
+            clock: Returns the current time for generated timestamps
         """
         self.db_path = Path(db_path)
+        self.clock = clock
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Thread-safe connection handling
@@ -174,6 +192,30 @@ class TradingDatabase:
         
         logger.info("Database schema initialized successfully")
     
+    def _trade_row(self, trade_data: Dict[str, Any]) -> Tuple:
+        """Validate a trade dict and return its INSERT parameters."""
+        # Validate required fields
+        for field in _TRADE_REQUIRED_FIELDS:
+            if field not in trade_data:
+                raise DatabaseError(f"Missing required field: {field}")
+        
+        # Add timestamp if not provided
+        if 'timestamp' not in trade_data:
+            trade_data['timestamp'] = self.clock().isoformat()
+        
+        return (
+            trade_data['timestamp'],
+            trade_data.get('week'),
+            trade_data['strategy'],
+            trade_data['symbol'],
+            trade_data['action'],
+            trade_data['quantity'],
+            trade_data['price'],
+            trade_data['cash_flow'],
+            trade_data.get('strike'),
+            trade_data.get('notes')
+        )
+    
     def insert_trade(self, trade_data: Dict[str, Any]) -> int:
         """
         Insert a trade record into the database.
@@ -184,40 +226,36 @@ class TradingDatabase:
         Returns:
             int: ID of inserted trade record
         """
-        required_fields = ['strategy', 'symbol', 'action', 'quantity', 'price', 'cash_flow']
-        
-        # Validate required fields
-        for field in required_fields:
-            if field not in trade_data:
-                raise DatabaseError(f"Missing required field: {field}")
-        
-        # Add timestamp if not provided
-        if 'timestamp' not in trade_data:
-            trade_data['timestamp'] = datetime.now(timezone.utc).isoformat()
+        row = self._trade_row(trade_data)
         
         with self._transaction() as conn:
-            cursor = conn.execute("""
-                INSERT INTO trades (
-                    timestamp, week, strategy, symbol, action, 
-                    quantity, price, cash_flow, strike, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                trade_data['timestamp'],
-                trade_data.get('week'),
-                trade_data['strategy'],
-                trade_data['symbol'],
-                trade_data['action'],
-                trade_data['quantity'],
-                trade_data['price'],
-                trade_data['cash_flow'],
-                trade_data.get('strike'),
-                trade_data.get('notes')
-            ))
+            cursor = conn.execute(_INSERT_TRADE_SQL, row)
             
             trade_id = cursor.lastrowid
             logger.debug(f"Inserted trade {trade_id}: {trade_data['action']} {trade_data['symbol']}")
             return trade_id
     
+    def insert_trades_bulk(self, trades: List[Dict[str, Any]]) -> int:
+        """
+        Insert many trade records in a single transaction.
+        
+        Every trade is validated before anything is written, so a bad
+        record leaves the table unchanged.
+        
+        Args:
+            trades: Trade dictionaries, as accepted by insert_trade
+            
+        Returns:
+            int: Number of trades inserted
+        """
+        rows = [self._trade_row(trade_data) for trade_data in trades]
+        
+        with self._transaction() as conn:
+            conn.executemany(_INSERT_TRADE_SQL, rows)
+        
+        logger.debug(f"Inserted {len(rows)} trades")
+        return len(rows)
+    
     def insert_price_data(self, symbol: str, timestamp: str, price: float, 
                          volume: Optional[float] = None, source: str = "unknown") -> int:
         """
@@ -341,7 +379,7 @@ class TradingDatabase:
                 ) VALUES (?, ?, ?, ?, ?)
             """, (
                 run_id,
-                datetime.now(timezone.utc).isoformat(),
+                self.clock().isoformat(),
                 json.dumps(config),
                 json.dumps(strategies),
                 'running'
@@ -369,7 +407,7 @@ class TradingDatabase:
                     final_capital = ?, error_message = ?
                 WHERE run_id = ?
             """, (
-                datetime.now(timezone.utc).isoformat(),
+                self.clock().isoformat(),
                 status,
                 total_trades,
                 final_capital,
@@ -401,7 +439,7 @@ class TradingDatabase:
                     positions, unrealized_pnl, realized_pnl
                 ) VALUES (?, ?, ?, ?, ?, ?, ?)
             """, (
-                datetime.now(timezone.utc).isoformat(),
+                self.clock().isoformat(),
                 strategy,
                 total_value,
                 cash_balance,
@@ -451,7 +489,7 @@ class TradingDatabase:
         Args:
             days_to_keep: Number of days of data to retain
         """
-        cutoff_date = (datetime.now(timezone.utc) - 
+        cutoff_date = (self.clock() - 
                       timedelta(days=days_to_keep)).isoformat()
         
         with self._transaction() as conn:
@@ -540,8 +578,9 @@ def log_price_to_db(symbol: str, price: float, timestamp: Optional[str] = None,
         source: Data source name
         db_path: Path to database file
     """
+    db = get_database(db_path)
+    
     if timestamp is None:
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = db.clock().isoformat()
     
-    db = get_database(db_path)
     return db.insert_price_data(symbol, timestamp, price, volume, source)
\ No newline at end of file
@@ -159,8 +159,9 @@ def main():
             config['initial_capital'] = args.initial_capital
             logger.info(f"CLI override: initial_capital = ${args.initial_capital:,.2f}")
         
-        # Show configuration summary
-        logger.info(f"Configuration summary:\n{config_manager.get_config_summary(config)}")
+        # Show configuration summary; skip building it when INFO is filtered (e.g. --quiet)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Configuration summary:\n{config_manager.get_config_summary(config)}")
         
         # Initialize price fetcher
         price_fetcher = initialize_price_fetcher(config)
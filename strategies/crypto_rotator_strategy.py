@@ -12,18 +12,151 @@ Features:
 """
 
 import csv
-import pandas as pd
 from datetime import datetime
-import random
+import math
 import logging
-from typing import List, Dict, Optional
+import zlib
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+from core.jit import njit
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Weekly action codes emitted by the numeric rotation kernel
+ACTION_HOLD = 0
+ACTION_BUY = 1
+ACTION_SELL = 2
+ACTION_ROTATE = ACTION_BUY | ACTION_SELL  # Sell current holding, then buy
+
+# Write buffer for trade CSV exports (1 MB batches rows into few syscalls)
+CSV_BUFFER_SIZE = 1 << 20
+
+# Money formatter for log messages, e.g. _usd(1234.5) -> '$1,234.50'
+_usd = "${:,.2f}".format
+
+# Compact numeric trade records (see CryptoRotator.get_trade_array)
+TRADE_DTYPE = np.dtype([
+    ('week', np.int32),
+    ('action', np.int8),        # ACTION_BUY or ACTION_SELL
+    ('symbol_idx', np.int16),   # Index into coins, -1 if unknown
+    ('quantity', np.float64),
+    ('price', np.float64),
+    ('cash_flow', np.float64),
+])
+_TRADE_ACTION_CODES = {'BUY_CRYPTO': ACTION_BUY, 'SELL_CRYPTO': ACTION_SELL}
+
+# Column order of trade records and of the trades.csv export
+TRADE_FIELDNAMES = ('week', 'strategy', 'symbol', 'action', 'quantity', 'price', 'strike', 'cash_flow', 'notes', 'timestamp')
+_TRADE_ROW = itemgetter(*TRADE_FIELDNAMES)  # Trade dict -> CSV row tuple
+
+
+@lru_cache(maxsize=2048)
+def _week_label(week: int) -> str:
+    """Return the shared 'WeekN' label used in trade records."""
+    return f"Week{week}"
+
+
+def _week_number(label: str) -> int:
+    """Inverse of _week_label: 'Week3' -> 3."""
+    return int(label[len('Week'):])
+
+
+@njit(cache=True)
+def _run_rotation(prices, capital):
+    """Numeric core of the rotation strategy.
+
+    Mirrors ``CryptoRotator.run``: buy the first coin in week 0, then each week
+    rotate all-in into the coin with the best week-over-week return.
+
+    Args:
+        prices: float64 array of shape (n_coins, n_weeks); missing prices are 0.0
+        capital: Starting cash
+
+    Returns:
+        tuple: (holding_idx, value, cash_flow, action) arrays of length n_weeks.
+            ``holding_idx`` is -1 while in cash.
+    """
+    n_coins, n_weeks = prices.shape
+    holding_idx = np.full(n_weeks, -1, dtype=np.int64)
+    value = np.zeros(n_weeks)
+    cash_flow = np.zeros(n_weeks)
+    action = np.zeros(n_weeks, dtype=np.int64)
+
+    holding = -1
+    quantity = 0.0
+    cash = capital
+
+    for week in range(n_weeks):
+        if week == 0:
+            target = 0
+        else:
+            # First coin with the highest return wins ties, like max() over a dict
+            target = 0
+            best_return = -np.inf
+            for i in range(n_coins):
+                prev_price = prices[i, week - 1]
+                weekly_return = 0.0
+                if prev_price > 0:
+                    weekly_return = (prices[i, week] - prev_price) / prev_price
+                if weekly_return > best_return:
+                    best_return = weekly_return
+                    target = i
+
+        if holding != target:
+            if holding >= 0 and quantity > 0:
+                proceeds = quantity * prices[holding, week]
+                cash_flow[week] += proceeds
+                cash = proceeds
+                holding = -1
+                quantity = 0.0
+                action[week] |= ACTION_SELL
+
+            price = prices[target, week]
+            if price > 0:
+                quantity = cash / price
+                holding = target
+                cash_flow[week] -= cash
+                action[week] |= ACTION_BUY
+
+        holding_idx[week] = holding
+        if holding >= 0:
+            value[week] = quantity * prices[holding, week]
+        else:
+            value[week] = cash
+
+    return holding_idx, value, cash_flow, action
+
+
 class CryptoRotator:
     """Crypto Rotator Strategy for cryptocurrencies with live data support."""
     
+    # Settable properties accepted by load_state, and the caches it refuses
+    # to load directly, mapped to the attribute they are rebuilt from
+    _PROPERTY_STATE = ('prices', 'portfolio_history')
+    _DERIVED_STATE = {
+        '_returns_matrix': 'price_matrix', '_best_week': 'price_matrix',
+        '_trade_array': 'trades', '_trade_count': 'trades',
+        '_hist_week': 'portfolio_history', '_hist_holding': 'portfolio_history',
+        '_hist_quantity': 'portfolio_history', '_hist_price': 'portfolio_history',
+        '_hist_value': 'portfolio_history', '_changes': 'portfolio_history',
+    }
+    
+    # Templates for recurring simulation messages, formatted only when emitted
+    _PRICE_FMT = "{coin}: ${price:,.2f}"
+    _RETURN_FMT = "  {coin}: {return_pct:+.2%}"
+    _HOLDING_FMT = "Portfolio: {quantity:.4f} {coin} = ${value:,.2f} (Unrealized P&L: ${unrealized_pnl:+,.2f})"
+    _CASH_FMT = "Portfolio Value: ${value:,.2f} (Cash)"
+    _BOUGHT_FMT = "Bought {quantity:.4f} {coin} @ ${price:.2f} (${amount:,.2f})"
+    _SOLD_FMT = "Sold {quantity:.4f} {coin} @ ${price:.2f} (${amount:,.2f})"
+    _REALIZED_FMT = "Realized P&L: ${gain:+,.2f} (Cost: ${cost_basis:,.2f}, Proceeds: ${proceeds:,.2f})"
+    
     def __init__(self, capital, coins, config=None, price_fetcher=None):
         """Initialize the crypto rotator strategy.
         
@@ -39,11 +172,21 @@ class CryptoRotator:
         self.config = config or {}
         self.price_fetcher = price_fetcher
         self.trades = []
+        self._run_timestamp = datetime.now().isoformat()  # Shared by trades of one run/week
         
         # Data mode configuration
         self.data_mode = self.config.get('data_mode', 'mock')
         self.simulation_weeks = self.config.get('simulation', {}).get('weeks_to_simulate', 8)
         
+        # Numeric copy of the trade log, sized for a buy and a sell every week
+        self._trade_array = np.empty(2 * max(self.simulation_weeks, 1), dtype=TRADE_DTYPE)
+        self._trade_count = 0
+        
+        # Simulation narration goes to the logger when verbose, otherwise it is
+        # kept unformatted in memory (see get_log) and run() uses the numeric kernel
+        self.verbose = self.config.get('verbose', True)
+        self._log_records = []  # (message, fields) pairs, formatted by get_log
+        
         # Symbol mapping for APIs (BTC -> bitcoin, ETH -> ethereum, etc.)
         self.symbol_mapping = self.config.get('data_sources', {}).get('crypto', {}).get('symbols', {
             'BTC': 'bitcoin',
@@ -55,15 +198,23 @@ class CryptoRotator:
         self.current_holding = None  # Which crypto we currently hold
         self.current_quantity = 0.0  # How much of that crypto we own
         self.current_value = 0.0     # Current USD value of holdings
+        self._current_cost_basis = 0.0  # Amount paid for the current holding
         
-        # Price data (will be populated by _initialize_price_data)
-        self.prices = {}
+        # Price data as one (coins x weeks) matrix, populated by _initialize_price_data
+        self.coin_index = {coin: i for i, coin in enumerate(coins)}
+        self.price_matrix = np.zeros((len(coins), 0))
         self.current_week = 0
         
         # Performance tracking
         self.weekly_returns = {}  # Track weekly returns for each coin
         self.total_return = 0.0
-        self.portfolio_history = []  # Track portfolio value over time
+        # Portfolio value over time, stored column-wise (see portfolio_history)
+        self._hist_week = []
+        self._hist_holding = []
+        self._hist_quantity = []
+        self._hist_price = []
+        self._hist_value = []
+        self._changes = []  # Weekly value changes
         self.realized_pnl = 0.0      # Track realized gains/losses from trades
         
         # Initialize price data
@@ -78,11 +229,87 @@ class CryptoRotator:
                 logger.info(f"Successfully loaded live crypto data for {len(self.prices)} symbols")
             except Exception as e:
                 logger.warning(f"Failed to fetch live crypto data, falling back to mock data: {e}")
-                self.prices = self._generate_mock_prices()
+                self.price_matrix = self._generate_mock_price_matrix(self.coins)
         else:
             if self.data_mode == 'live':
                 logger.warning("Live mode requested but no price_fetcher provided, using mock data")
-            self.prices = self._generate_mock_prices()
+            self.price_matrix = self._generate_mock_price_matrix(self.coins)
+            logger.info(f"Generated mock crypto price data for {len(self.coins)} coins")
+        
+        self._precompute_returns()
+    
+    def _precompute_returns(self):
+        """Precompute every week's returns and best performer from ``price_matrix``.
+        
+        One extra week past the end of the data is included, where all prices
+        read as 0.0. Must be called again whenever ``price_matrix`` changes.
+        """
+        prices = np.pad(self.price_matrix, ((0, 0), (0, 1)))
+        prev_prices = prices[:, :-1]
+        
+        self._returns_matrix = np.zeros_like(prices)
+        np.divide(prices[:, 1:] - prev_prices, prev_prices,
+                  out=self._returns_matrix[:, 1:], where=prev_prices > 0)
+        if self.coins:
+            self._best_week = np.argmax(self._returns_matrix, axis=0).tolist()
+        else:
+            self._best_week = []
+    
+    @property
+    def prices(self) -> Mapping[str, Tuple[float, ...]]:
+        """Weekly prices per coin, as a read-only snapshot of ``price_matrix``.
+        
+        The mapping and its tuples are immutable, so in-place edits raise
+        instead of being lost; assign a new dict to change prices.
+        """
+        return MappingProxyType({coin: tuple(self.price_matrix[i].tolist())
+                                 for i, coin in enumerate(self.coins)})
+    
+    @prices.setter
+    def prices(self, prices: Dict[str, List[float]]):
+        """Load a dict of per-coin price lists into ``price_matrix``.
+        
+        Shorter series are padded with 0.0, which reads as a missing price.
+        """
+        weeks = max((len(coin_prices) for coin_prices in prices.values()), default=0)
+        matrix = np.zeros((len(self.coins), weeks))
+        for coin, coin_prices in prices.items():
+            if coin in self.coin_index:
+                matrix[self.coin_index[coin], :len(coin_prices)] = coin_prices
+        self.price_matrix = matrix
+        self._precompute_returns()
+    
+    def load_state(self, **state):
+        """Set several attributes at once, keeping derived data in sync.
+        
+        Every name is checked before anything is assigned. Loading ``prices``
+        or ``price_matrix`` recomputes the cached weekly returns, and loading
+        ``trades`` rebuilds the numeric trade array.
+        
+        Args:
+            **state: Attribute values, plus optionally ``prices`` as a dict
+                of per-coin price lists and ``portfolio_history`` as a list
+                of per-week dicts
+        
+        Raises:
+            AttributeError: If a name is not an attribute of the strategy, or
+                is a cache derived from another attribute
+        """
+        for name in state:
+            if name in self._DERIVED_STATE:
+                raise AttributeError(f"'{name}' is derived state of {type(self).__name__}; "
+                                     f"load '{self._DERIVED_STATE[name]}' instead")
+            if name not in self._PROPERTY_STATE and name not in vars(self):
+                raise AttributeError(f"{type(self).__name__} has no attribute '{name}'")
+        
+        properties = {name: state.pop(name) for name in self._PROPERTY_STATE if name in state}
+        vars(self).update(state)
+        for name, value in properties.items():
+            setattr(self, name, value)  # The setters rebuild their caches
+        if 'price_matrix' in state:
+            self._precompute_returns()
+        if 'trades' in state:
+            self._rebuild_trade_array()
     
     def _fetch_live_prices(self) -> Dict[str, List[float]]:
         """Fetch live cryptocurrency data for all coins."""
@@ -118,55 +345,76 @@ class CryptoRotator:
     
     def _generate_mock_prices_for_coin(self, coin_symbol: str) -> List[float]:
         """Generate mock prices for a single cryptocurrency."""
+        return self._generate_mock_price_matrix([coin_symbol])[0].tolist()
+    
+    def _generate_mock_price_matrix(self, coins: List[str]) -> np.ndarray:
+        """Generate mock weekly prices for several coins at once.
+        
+        Args:
+            coins (list): Crypto symbols, one matrix row each
+            
+        Returns:
+            np.ndarray: Prices with shape (len(coins), weeks)
+        """
         base_prices = {
             "BTC": 50000,
             "ETH": 3000,
             "SOL": 100
         }
         
-        base_price = base_prices.get(coin_symbol, 1000)
+        base = np.array([base_prices.get(coin, 1000) for coin in coins], dtype=np.float64)
         
         if self.config.get('test_mode', False) or self.config.get('simulation', {}).get('enable_deterministic_mode', False):
             # Optimized price sequences for profitable rotations
-            if coin_symbol == "BTC":
+            deterministic_multipliers = {
                 # BTC: Strong start, moderate finish for good initial rotation
-                multipliers = [1.0, 1.08, 1.05, 1.12, 1.15, 1.10, 1.18, 1.22]
-            elif coin_symbol == "ETH":
+                "BTC": [1.0, 1.08, 1.05, 1.12, 1.15, 1.10, 1.18, 1.22],
                 # ETH: Best mid-game performance to capture rotation profits
-                multipliers = [1.0, 1.02, 1.15, 1.18, 1.12, 1.25, 1.20, 1.28]
-            elif coin_symbol == "SOL":
+                "ETH": [1.0, 1.02, 1.15, 1.18, 1.12, 1.25, 1.20, 1.28],
                 # SOL: Strong early and late performance
-                multipliers = [1.0, 1.12, 1.08, 1.10, 1.05, 1.08, 1.30, 1.35]
-            else:
-                # Default positive pattern for unknown coins
-                multipliers = [1.0, 1.05, 1.08, 1.10, 1.12, 1.15, 1.18, 1.20]
+                "SOL": [1.0, 1.12, 1.08, 1.10, 1.05, 1.08, 1.30, 1.35],
+            }
+            # Default positive pattern for unknown coins
+            default_multipliers = [1.0, 1.05, 1.08, 1.10, 1.12, 1.15, 1.18, 1.20]
             
-            return [base_price * mult for mult in multipliers[:self.simulation_weeks]]
-        else:
-            # Random generation with positive bias and crypto-like volatility
-            random.seed(42 + hash(coin_symbol))
-            prices = [base_price]
-            
-            for week in range(self.simulation_weeks - 1):
-                # Positive bias with crypto volatility: -5% to +20% weekly
-                price_change = random.uniform(-0.05, 0.20)
-                new_price = prices[-1] * (1 + price_change)
-                prices.append(round(new_price, 2))
-            
-            return prices
+            multipliers = np.array([
+                deterministic_multipliers.get(coin, default_multipliers)[:self.simulation_weeks]
+                for coin in coins
+            ], dtype=np.float64)
+            return base[:, None] * multipliers
+        
+        # Random generation with positive bias and crypto-like volatility:
+        # -5% to +20% weekly, compounded in one cumulative product
+        changes = np.empty((len(coins), max(self.simulation_weeks - 1, 0)))
+        for row, coin in zip(changes, coins):
+            # Different seed per coin; crc32 (unlike hash()) is the same in every process
+            rng = np.random.default_rng(42 + zlib.crc32(coin.encode()))
+            row[:] = rng.uniform(-0.05, 0.20, size=row.shape)
+        factors = np.concatenate(
+            [np.ones((len(coins), 1)), np.cumprod(1 + changes, axis=1)], axis=1
+        )
+        return np.round(base[:, None] * factors, 2)
     
-    def _generate_mock_prices(self) -> Dict[str, List[float]]:
-        """Generate mock price data for crypto simulation.
-        
+    def simulate(self, num_weeks: Optional[int] = None) -> Tuple[np.ndarray, ...]:
+        """Run the rotation numerically, without logging or trade records.
+
+        Intended for parameter sweeps where only the weekly holdings and
+        values matter. Uses the JIT-compiled kernel when numba is installed.
+
+        Args:
+            num_weeks (int): Number of weeks to simulate. If None, uses config value.
+
         Returns:
-            dict: Weekly prices for each crypto
+            tuple: (holding_idx, value, cash_flow, action) arrays, see ``_run_rotation``
         """
-        prices = {}
-        
-        for coin in self.coins:
-            prices[coin] = self._generate_mock_prices_for_coin(coin)
-        
-        logger.info(f"Generated mock crypto price data for {len(prices)} coins")
+        weeks = num_weeks or self.simulation_weeks
+        return _run_rotation(self._kernel_prices(weeks), float(self.capital))
+    
+    def _kernel_prices(self, weeks: int) -> np.ndarray:
+        """Get ``price_matrix`` cut or zero-padded to exactly ``weeks`` columns."""
+        prices = np.zeros((len(self.coins), weeks))
+        available_weeks = min(weeks, self.price_matrix.shape[1])
+        prices[:, :available_weeks] = self.price_matrix[:, :available_weeks]
         return prices
     
     def get_data_source_info(self) -> Dict[str, str]:
@@ -174,7 +422,7 @@ class CryptoRotator:
         info = {
             'data_mode': self.data_mode,
             'price_fetcher_available': self.price_fetcher is not None,
-            'coins_loaded': list(self.prices.keys()),
+            'coins_loaded': list(self.coins),
             'symbol_mapping': self.symbol_mapping,
             'simulation_weeks': self.simulation_weeks
         }
@@ -186,6 +434,25 @@ class CryptoRotator:
         
         return info
     
+    def _log(self, message: str, **fields):
+        """Emit a simulation message, or buffer it when not verbose.
+        
+        Args:
+            message (str): Message text, or a ``str.format`` template when fields are given
+            **fields: Template values; formatting is deferred until the message is read
+        """
+        if self.verbose:
+            logger.info(message.format_map(fields) if fields else message)
+        else:
+            self._log_records.append((message, fields))
+    
+    def get_log(self) -> str:
+        """Get the simulation messages buffered while ``verbose`` was off."""
+        return ''.join(
+            (message.format_map(fields) if fields else message) + '\n'
+            for message, fields in self._log_records
+        )
+    
     def get_current_price(self, coin):
         """Get current price for a coin.
         
@@ -195,8 +462,9 @@ class CryptoRotator:
         Returns:
             float: Current price
         """
-        if coin in self.prices and self.current_week < len(self.prices[coin]):
-            return self.prices[coin][self.current_week]
+        idx = self.coin_index.get(coin)
+        if idx is not None and 0 <= self.current_week < self.price_matrix.shape[1]:
+            return float(self.price_matrix[idx, self.current_week])
         return 0.0
     
     def get_current_portfolio_value(self):
@@ -214,24 +482,43 @@ class CryptoRotator:
     
     def update_portfolio_value(self):
         """Update portfolio value based on current holdings and prices."""
-        previous_value = self.current_value if hasattr(self, 'current_value') else self.initial_capital
+        previous_value = self.current_value
         current_value = self.get_current_portfolio_value()
         
         # Track value change
         value_change = current_value - previous_value if previous_value > 0 else 0
         
         # Record portfolio history
-        self.portfolio_history.append({
-            'week': self.current_week,
-            'holding': self.current_holding,
-            'quantity': self.current_quantity,
-            'price': self.get_current_price(self.current_holding) if self.current_holding else 0,
-            'value': current_value,
-            'change': value_change
-        })
+        self._hist_week.append(self.current_week)
+        self._hist_holding.append(self.current_holding)
+        self._hist_quantity.append(self.current_quantity)
+        self._hist_price.append(self.get_current_price(self.current_holding) if self.current_holding else 0)
+        self._hist_value.append(current_value)
+        self._changes.append(value_change)
         
         return current_value
     
+    @property
+    def portfolio_history(self) -> List[Dict]:
+        """Portfolio history as one dict per recorded week, built on demand."""
+        return [
+            {'week': week, 'holding': holding, 'quantity': quantity,
+             'price': price, 'value': value, 'change': change}
+            for week, holding, quantity, price, value, change in zip(
+                self._hist_week, self._hist_holding, self._hist_quantity,
+                self._hist_price, self._hist_value, self._changes)
+        ]
+    
+    @portfolio_history.setter
+    def portfolio_history(self, history: List[Dict]):
+        """Load a list of per-week history dicts into the history columns."""
+        self._hist_week = [h['week'] for h in history]
+        self._hist_holding = [h['holding'] for h in history]
+        self._hist_quantity = [h['quantity'] for h in history]
+        self._hist_price = [h['price'] for h in history]
+        self._hist_value = [h['value'] for h in history]
+        self._changes = [h['change'] for h in history]
+    
     def get_unrealized_pnl(self):
         """Calculate unrealized P&L for current holdings.
         
@@ -241,14 +528,7 @@ class CryptoRotator:
         if self.current_holding is None:
             return 0.0
         
-        current_value = self.get_current_portfolio_value()
-        # Find the cost basis (last purchase amount)
-        for trade in reversed(self.trades):
-            if trade['action'] == 'BUY_CRYPTO' and trade['symbol'] == self.current_holding:
-                cost_basis = abs(trade['cash_flow'])
-                return current_value - cost_basis
-        
-        return 0.0
+        return self.get_current_portfolio_value() - self._current_cost_basis
     
     def calculate_weekly_returns(self):
         """Calculate weekly returns for all coins for current week.
@@ -258,21 +538,15 @@ class CryptoRotator:
         """
         if self.current_week == 0:
             # No prior week for comparison
-            return {coin: 0.0 for coin in self.coins}
+            return dict.fromkeys(self.coins, 0.0)
         
-        weekly_returns = {}
-        for coin in self.coins:
-            current_price = self.get_current_price(coin)
-            prev_price = self.prices[coin][self.current_week - 1]
-            
-            if prev_price > 0:
-                weekly_return = (current_price - prev_price) / prev_price
-                weekly_returns[coin] = weekly_return
-            else:
-                weekly_returns[coin] = 0.0
+        if self.current_week < self._returns_matrix.shape[1]:
+            returns = self._returns_matrix[:, self.current_week].tolist()
+        else:
+            returns = [0.0] * len(self.coins)
         
-        self.weekly_returns = weekly_returns
-        return weekly_returns
+        self.weekly_returns = dict(zip(self.coins, returns))
+        return self.weekly_returns
     
     def get_best_performer(self):
         """Identify the best performing coin from last week's returns.
@@ -284,29 +558,44 @@ class CryptoRotator:
             # First week - choose first coin as default
             return self.coins[0]
         
-        # Find coin with highest return
-        best_coin = max(self.weekly_returns.items(), key=lambda x: x[1])
-        return best_coin[0]
+        return self._best_performer_for_week(self.current_week)
+    
+    def _best_performer_for_week(self, week):
+        """Coin with the highest return in a week, from the precomputed argmax.
+        
+        Ties go to the first coin; weeks past the data default to the first coin.
+        """
+        if week < len(self._best_week):
+            return self.coins[self._best_week[week]]
+        return self.coins[0]
+    
+    def _log_week_prices(self):
+        """Log every coin's current price, read as one ``price_matrix`` column."""
+        if self.current_week < self.price_matrix.shape[1]:
+            week_prices = self.price_matrix[:, self.current_week].tolist()
+        else:
+            week_prices = [0.0] * len(self.coins)
+        
+        for coin, price in zip(self.coins, week_prices):
+            self._log(self._PRICE_FMT, coin=coin, price=price)
     
     def advance_week(self):
         """Advance to the next week in the simulation."""
         self.current_week += 1
-        logger.info(f"--- Week {self.current_week} ---")
+        self._log(f"--- Week {self.current_week} ---")
         
         # Display current prices
-        for coin in self.coins:
-            price = self.get_current_price(coin)
-            logger.info(f"{coin}: ${price:,.2f}")
+        self._log_week_prices()
         
         # Calculate and display weekly returns
         if self.current_week > 0:
             returns = self.calculate_weekly_returns()
-            logger.info("Weekly Returns:")
+            self._log("Weekly Returns:")
             for coin, return_pct in returns.items():
-                logger.info(f"  {coin}: {return_pct:+.2%}")
+                self._log(self._RETURN_FMT, coin=coin, return_pct=return_pct)
             
             best_performer = self.get_best_performer()
-            logger.info(f"Best Performer: {best_performer} ({returns[best_performer]:+.2%})")
+            self._log(f"Best Performer: {best_performer} ({returns[best_performer]:+.2%})")
     
     def run(self, backtest=True, num_weeks=None):
         """Run the crypto rotator strategy simulation.
@@ -318,49 +607,39 @@ class CryptoRotator:
         Returns:
             list: List of trade records
         """
-        logger.info(f"Executing Crypto Rotator Strategy with ${self.capital:,.2f}")
-        logger.info(f"Trading coins: {self.coins}")
+        # One wall-clock timestamp per run; the week field orders the trades
+        self._run_timestamp = datetime.now().isoformat()
+        
+        self._log(f"Executing Crypto Rotator Strategy with {_usd(self.capital)}")
+        self._log(f"Trading coins: {self.coins}")
         
         # Display initial prices
-        logger.info(f"--- Week {self.current_week} (Start) ---")
-        for coin in self.coins:
-            price = self.get_current_price(coin)
-            logger.info(f"{coin}: ${price:,.2f}")
+        self._log(f"--- Week {self.current_week} (Start) ---")
+        self._log_week_prices()
         
-        logger.info(f"Initial Portfolio: ${self.get_current_portfolio_value():,.2f}")
+        self._log(f"Initial Portfolio: {_usd(self.get_current_portfolio_value())}")
         
         # Get number of weeks from parameter or config
         weeks_to_simulate = num_weeks or self.config.get('simulation', {}).get('weeks_to_simulate', 52)
         
         # Run simulation for specified weeks
-        for week in range(weeks_to_simulate):
-            if week > 0:
-                self.advance_week()
-            
-            # Process rotation logic
-            self._process_weekly_rotation()
-            
-            # Update portfolio value and track changes
-            current_value = self.update_portfolio_value()
-            unrealized_pnl = self.get_unrealized_pnl()
-            
-            if self.current_holding:
-                logger.info(f"Portfolio: {self.current_quantity:.4f} {self.current_holding} = ${current_value:,.2f} (Unrealized P&L: ${unrealized_pnl:+,.2f})")
-            else:
-                logger.info(f"Portfolio Value: ${current_value:,.2f} (Cash)")
+        if self.verbose:
+            self._run_weekly_loop(weeks_to_simulate)
+        else:
+            self._run_with_kernel(weeks_to_simulate)
         
         # Final summary
         final_value = self.get_current_portfolio_value()
         total_return = ((final_value - self.initial_capital) / self.initial_capital) * 100
         final_unrealized = self.get_unrealized_pnl()
         
-        logger.info(f"=== ROTATOR SIMULATION COMPLETE ===")
-        logger.info(f"Initial Capital: ${self.initial_capital:,.2f}")
-        logger.info(f"Final Portfolio Value: ${final_value:,.2f}")
-        logger.info(f"Total Return: {total_return:+.2f}%")
-        logger.info(f"Realized P&L: ${self.realized_pnl:+,.2f}")
-        logger.info(f"Unrealized P&L: ${final_unrealized:+,.2f}")
-        logger.info(f"Total Trades: {len(self.trades)}")
+        self._log(f"=== ROTATOR SIMULATION COMPLETE ===")
+        self._log(f"Initial Capital: {_usd(self.initial_capital)}")
+        self._log(f"Final Portfolio Value: {_usd(final_value)}")
+        self._log(f"Total Return: {total_return:+.2f}%")
+        self._log(f"Realized P&L: ${self.realized_pnl:+,.2f}")
+        self._log(f"Unrealized P&L: ${final_unrealized:+,.2f}")
+        self._log(f"Total Trades: {len(self.trades)}")
         
         # Print portfolio evolution
         self._print_portfolio_summary()
@@ -372,22 +651,63 @@ class CryptoRotator:
         # Return trade list for main coordination
         return self.trades
     
+    def _run_weekly_loop(self, weeks):
+        """Simulate week by week, narrating prices, returns and decisions."""
+        for week in range(weeks):
+            if week > 0:
+                self.advance_week()
+            
+            # Process rotation logic
+            self._process_weekly_rotation()
+            
+            # Update portfolio value and track changes
+            current_value = self.update_portfolio_value()
+            unrealized_pnl = self.get_unrealized_pnl()
+            
+            if self.current_holding:
+                self._log(self._HOLDING_FMT, quantity=self.current_quantity, coin=self.current_holding,
+                          value=current_value, unrealized_pnl=unrealized_pnl)
+            else:
+                self._log(self._CASH_FMT, value=current_value)
+    
+    def _run_with_kernel(self, weeks):
+        """Simulate with the numeric kernel, then replay only its trades.
+        
+        Rotation decisions for all weeks come from one ``_run_rotation`` call.
+        Weeks without a trade only record portfolio history, so quiet batch
+        runs skip the per-week returns and narration of the verbose loop.
+        """
+        holding_idx, _, _, action = _run_rotation(self._kernel_prices(weeks), float(self.capital))
+        
+        for week in range(weeks):
+            self.current_week = week
+            if action[week] & ACTION_SELL:
+                self._sell_crypto()
+            if action[week] & ACTION_BUY:
+                self._buy_crypto(self.coins[holding_idx[week]])
+            self.update_portfolio_value()
+        
+        self.calculate_weekly_returns()
+    
     def _print_portfolio_summary(self):
         """Print a summary of portfolio value evolution."""
-        logger.info(f"=== PORTFOLIO EVOLUTION ===")
-        for entry in self.portfolio_history:
-            if entry['holding']:
-                change_str = f" ({entry['change']:+,.2f})" if entry['change'] != 0 else ""
-                logger.info(f"Week {entry['week']}: {entry['quantity']:.4f} {entry['holding']} @ ${entry['price']:.2f} = ${entry['value']:,.2f}{change_str}")
+        self._log(f"=== PORTFOLIO EVOLUTION ===")
+        for week, holding, quantity, price, value, change in zip(
+                self._hist_week, self._hist_holding, self._hist_quantity,
+                self._hist_price, self._hist_value, self._changes):
+            if holding:
+                change_str = f" ({change:+,.2f})" if change != 0 else ""
+                self._log(f"Week {week}: {quantity:.4f} {holding} @ ${price:.2f} = {_usd(value)}{change_str}")
             else:
-                logger.info(f"Week {entry['week']}: Cash = ${entry['value']:,.2f}")
+                self._log(f"Week {week}: Cash = {_usd(value)}")
         
         # Show best and worst weeks
-        if len(self.portfolio_history) > 1:
-            best_week = max(self.portfolio_history[1:], key=lambda x: x['change'])
-            worst_week = min(self.portfolio_history[1:], key=lambda x: x['change'])
-            logger.info(f"Best Week: Week {best_week['week']} (+${best_week['change']:,.2f})")
-            logger.info(f"Worst Week: Week {worst_week['week']} ({worst_week['change']:+,.2f})")
+        if len(self._changes) > 1:
+            changes = np.asarray(self._changes[1:])
+            best = int(changes.argmax()) + 1
+            worst = int(changes.argmin()) + 1
+            self._log(f"Best Week: Week {self._hist_week[best]} (+{_usd(self._changes[best])})")
+            self._log(f"Worst Week: Week {self._hist_week[worst]} ({self._changes[worst]:+,.2f})")
     
     def execute_week(self, week_number, prices=None):
         """Execute one week of the crypto rotator strategy.
@@ -403,15 +723,21 @@ class CryptoRotator:
         """
         week_trades = []
         self.current_week = week_number
+        self._run_timestamp = datetime.now().isoformat()
         
         # Update prices if provided
         if prices:
+            known_weeks = self.price_matrix.shape[1]
+            if week_number >= known_weeks:
+                # Ensure we have enough price data; new weeks start out missing
+                self.price_matrix = np.pad(self.price_matrix, ((0, 0), (0, week_number + 1 - known_weeks)))
+            first_new_week = min(known_weeks, week_number)
             for coin, price in prices.items():
-                if coin in self.prices:
-                    # Ensure we have enough price data
-                    while len(self.prices[coin]) <= week_number:
-                        self.prices[coin].append(price)
-                    self.prices[coin][week_number] = price
+                idx = self.coin_index.get(coin)
+                if idx is not None:
+                    # Backfill any skipped weeks with the provided price
+                    self.price_matrix[idx, first_new_week:week_number + 1] = price
+            self._precompute_returns()
         
         # Process rotation logic
         self._process_weekly_rotation()
@@ -420,7 +746,8 @@ class CryptoRotator:
         current_value = self.update_portfolio_value()
         
         # Collect trades from this week
-        week_trades = [t for t in self.trades if t.get('week') == f'Week{week_number}']
+        week_label = _week_label(week_number)
+        week_trades = [t for t in self.trades if t.get('week') == week_label]
         
         return week_trades
     
@@ -431,21 +758,22 @@ class CryptoRotator:
             initial_coin = self.coins[0]  # Default to BTC
             self._buy_crypto(initial_coin)
         else:
-            # Calculate performance and identify best performer
-            returns = self.calculate_weekly_returns()
-            best_performer = self.get_best_performer()
+            # Keep weekly_returns current (one precomputed column) and take the
+            # best performer straight from the precomputed argmax
+            self.calculate_weekly_returns()
+            best_performer = self._best_performer_for_week(self.current_week)
             
             if self.current_holding is None:
                 # No current holding, buy best performer
                 self._buy_crypto(best_performer)
             elif self.current_holding != best_performer:
                 # Rotate: sell current holding and buy best performer
-                logger.info(f"Rotating from {self.current_holding} to {best_performer}")
+                self._log(f"Rotating from {self.current_holding} to {best_performer}")
                 self._sell_crypto()
                 self._buy_crypto(best_performer)
             else:
                 # Stay with current holding
-                logger.info(f"Staying with {self.current_holding} (still top performer)")
+                self._log(f"Staying with {self.current_holding} (still top performer)")
     
     def _buy_crypto(self, coin):
         """Buy crypto with all available capital.
@@ -466,6 +794,7 @@ class CryptoRotator:
         self.current_holding = coin
         self.current_quantity = quantity
         self.current_value = available_capital
+        self._current_cost_basis = available_capital
         
         # Log the trade
         self.log_trade({
@@ -477,7 +806,7 @@ class CryptoRotator:
             'notes': f'Bought {quantity:.4f} {coin} @ ${price:.2f}'
         })
         
-        logger.info(f"Bought {quantity:.4f} {coin} @ ${price:.2f} (${available_capital:,.2f})")
+        self._log(self._BOUGHT_FMT, quantity=quantity, coin=coin, price=price, amount=available_capital)
     
     def _sell_crypto(self):
         """Sell all current crypto holdings."""
@@ -500,23 +829,20 @@ class CryptoRotator:
             'notes': f'Sold {quantity:.4f} {coin} @ ${price:.2f}'
         })
         
-        logger.info(f"Sold {quantity:.4f} {coin} @ ${price:.2f} (${proceeds:,.2f})")
+        self._log(self._SOLD_FMT, quantity=quantity, coin=coin, price=price, amount=proceeds)
         
-        # Calculate realized P&L from this trade
-        # Find the corresponding buy trade for this holding
-        for trade in reversed(self.trades):
-            if trade['action'] == 'BUY_CRYPTO' and trade['symbol'] == coin:
-                cost_basis = abs(trade['cash_flow'])
-                realized_gain = proceeds - cost_basis
-                self.realized_pnl += realized_gain
-                logger.info(f"Realized P&L: ${realized_gain:+,.2f} (Cost: ${cost_basis:,.2f}, Proceeds: ${proceeds:,.2f})")
-                break
+        # Calculate realized P&L from this trade against the holding's cost basis
+        cost_basis = self._current_cost_basis
+        realized_gain = proceeds - cost_basis
+        self.realized_pnl += realized_gain
+        self._log(self._REALIZED_FMT, gain=realized_gain, cost_basis=cost_basis, proceeds=proceeds)
         
         # Update holdings - convert to cash
         self.capital = proceeds
         self.current_holding = None
         self.current_quantity = 0.0
         self.current_value = proceeds
+        self._current_cost_basis = 0.0
         
     def log_trade(self, trade_data):
         """Log a trade to the trades list with standardized format.
@@ -524,72 +850,105 @@ class CryptoRotator:
         Args:
             trade_data (dict): Trade information
         """
-        # Standardized trade record structure
-        trade_record = {
-            'week': f"Week{self.current_week}",
-            'strategy': 'Rotator',
-            'symbol': trade_data.get('symbol', ''),
-            'action': trade_data.get('action', ''),
-            'quantity': trade_data.get('quantity', 0),
-            'price': trade_data.get('price', 0.0),
-            'strike': '',  # Not applicable for crypto
-            'cash_flow': trade_data.get('total_value', 0.0),
-            'notes': trade_data.get('notes', ''),
-            'timestamp': datetime.now().isoformat()
-        }
+        # Standardized trade record structure, in TRADE_FIELDNAMES order
+        trade_row = (
+            _week_label(self.current_week),
+            'Rotator',
+            trade_data.get('symbol', ''),
+            trade_data.get('action', ''),
+            trade_data.get('quantity', 0),
+            trade_data.get('price', 0.0),
+            '',  # Strike: not applicable for crypto
+            trade_data.get('total_value', 0.0),
+            trade_data.get('notes', ''),
+            self._run_timestamp
+        )
+        
+        trade = dict(zip(TRADE_FIELDNAMES, trade_row))
+        self.trades.append(trade)
+        self._append_trade_record(self.current_week, trade)
+    
+    def _append_trade_record(self, week, trade):
+        """Append one trade dict to the numeric trade array."""
+        if self._trade_count == len(self._trade_array):
+            self._trade_array = np.resize(self._trade_array, 2 * len(self._trade_array))
+        self._trade_array[self._trade_count] = (
+            week,
+            _TRADE_ACTION_CODES.get(trade['action'], ACTION_HOLD),
+            self.coin_index.get(trade['symbol'], -1),
+            trade['quantity'],
+            trade['price'],
+            trade['cash_flow'],
+        )
+        self._trade_count += 1
+    
+    def _rebuild_trade_array(self):
+        """Recreate the numeric trade array from ``trades``."""
+        self._trade_count = 0
+        for trade in self.trades:
+            self._append_trade_record(_week_number(trade['week']), trade)
+    
+    def get_trade_array(self) -> np.ndarray:
+        """Get the trades as a structured array with ``TRADE_DTYPE`` fields.
         
-        self.trades.append(trade_record)
+        Cheaper than the trade dicts for numeric analysis in parameter sweeps.
+        """
+        return self._trade_array[:self._trade_count]
     
-    def export_trades_to_csv(self, filename='trades.csv'):
+    def export_trades_to_csv(self, filename='trades.csv', mode='a', write_header=None):
         """Export trades to CSV file (append mode for multi-strategy).
         
         Args:
             filename (str): CSV filename
+            mode (str): File mode, 'a' to append or 'w' to overwrite
+            write_header (bool): Whether to write the header row. If None, it is
+                written when the file is new or empty.
         """
         if not self.trades:
             logger.info("No rotator trades to export.")
             return
         
-        fieldnames = ['week', 'strategy', 'symbol', 'action', 'quantity', 'price', 'strike', 'cash_flow', 'notes', 'timestamp']
-        
-        # Append to existing trades.csv (wheel strategy may have created it)
-        with open(filename, 'a', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        # Append to existing trades.csv by default (wheel strategy may have created it)
+        with open(filename, mode, newline='', buffering=CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
             
-            # Only write header if file is empty/new
-            csvfile.seek(0, 2)  # Go to end of file
-            if csvfile.tell() == 0:
-                writer.writeheader()
+            if write_header is None:
+                # Only write header if file is empty/new
+                if mode == 'w':
+                    write_header = True
+                else:
+                    csvfile.seek(0, 2)  # Go to end of file
+                    write_header = csvfile.tell() == 0
+            if write_header:
+                writer.writerow(TRADE_FIELDNAMES)
             
-            writer.writerows(self.trades)
+            # Rows are read from the trade dicts at export time, so edits to
+            # self.trades are exported; itemgetter is cheaper than DictWriter
+            writer.writerows(map(_TRADE_ROW, self.trades))
         
         logger.info(f"Exported {len(self.trades)} rotator trades to {filename}")
     
     def print_trades_summary(self):
         """Print a summary of all rotator trades."""
         if not self.trades:
-            logger.info("No rotator trades recorded.")
+            self._log("No rotator trades recorded.")
             return
         
-        logger.info(f"=== ROTATOR TRADES SUMMARY ({len(self.trades)} trades) ===")
+        self._log(f"=== ROTATOR TRADES SUMMARY ({len(self.trades)} trades) ===")
         for trade in self.trades:
             cash_flow_str = f"${trade['cash_flow']:+.2f}" if trade['cash_flow'] != 0 else ""
-            logger.info(f"{trade['week']}: {trade['action']} {trade['quantity']:.4f} {trade['symbol']} @ ${trade['price']:.2f} - {cash_flow_str}")
+            self._log(f"{trade['week']}: {trade['action']} {trade['quantity']:.4f} {trade['symbol']} @ ${trade['price']:.2f} - {cash_flow_str}")
             if trade['notes']:
-                logger.info(f"    Note: {trade['notes']}")
+                self._log(f"    Note: {trade['notes']}")
         
         # Summary by action type
-        actions = {}
-        total_cash_flow = 0
-        for trade in self.trades:
-            action = trade['action']
-            actions[action] = actions.get(action, 0) + 1
-            total_cash_flow += trade['cash_flow']
+        actions = Counter(trade['action'] for trade in self.trades)
+        total_cash_flow = math.fsum(trade['cash_flow'] for trade in self.trades)
         
-        logger.info(f"ROTATOR ACTION SUMMARY:")
+        self._log(f"ROTATOR ACTION SUMMARY:")
         for action, count in actions.items():
-            logger.info(f"  {action}: {count}")
-        logger.info(f"Net Cash Flow: ${total_cash_flow:.2f}")
+            self._log(f"  {action}: {count}")
+        self._log(f"Net Cash Flow: ${total_cash_flow:.2f}")
 
 
 # For backward compatibility with old import
@@ -11,26 +11,411 @@ Features:
 - Comprehensive trade logging
 """
 
-import csv
-import pandas as pd
 from datetime import datetime
-from enum import Enum
-import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from enum import IntEnum
+from functools import lru_cache
 import logging
-from typing import List, Dict, Optional
+import math
+import multiprocessing
+from operator import itemgetter
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Tuple
+import zlib
+
+import numpy as np
+
+from core.jit import njit, prange
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-class WheelState(Enum):
-    """Wheel strategy states for each symbol."""
-    CASH_SECURED_PUT = "csp"
-    HOLDING_SHARES = "holding"
-    COVERED_CALL = "cc"
+# Upper bound on concurrent PriceFetcher requests when loading live prices
+MAX_FETCH_WORKERS = 8
+
+# Shares per option contract
+CONTRACT_SIZE = 100
+
+# Write buffer for trade CSV exports (1 MB batches rows into few syscalls)
+CSV_BUFFER_SIZE = 1 << 20
+
+# Column order of exported trade records
+TRADE_FIELDNAMES = ('week', 'strategy', 'symbol', 'action', 'quantity', 'price', 'strike', 'cash_flow', 'notes', 'timestamp')
+
+# Integer state codes, as stored in the position arrays and used by the numeric kernel
+STATE_CSP = 0
+STATE_HOLDING = 1
+STATE_CC = 2
+
+
+class WheelState(IntEnum):
+    """Wheel strategy states for each symbol; equal to the STATE_* codes."""
+    CASH_SECURED_PUT = STATE_CSP
+    HOLDING_SHARES = STATE_HOLDING
+    COVERED_CALL = STATE_CC
+
+
+# Short state names shown in simulation narration
+_STATE_LABELS = {STATE_CSP: 'csp', STATE_HOLDING: 'holding', STATE_CC: 'cc'}
+
+# Trade action codes emitted by the numeric wheel kernel
+ACTION_SELL_PUT = 1
+ACTION_BUY_SHARES = 2
+ACTION_SELL_CALL = 3
+ACTION_SELL_SHARES = 4
+ACTION_NAMES = {
+    ACTION_SELL_PUT: 'SELL_PUT',
+    ACTION_BUY_SHARES: 'BUY_SHARES',
+    ACTION_SELL_CALL: 'SELL_CALL',
+    ACTION_SELL_SHARES: 'SELL_SHARES',
+}
+_TRADE_ACTION_CODES = {name: code for code, name in ACTION_NAMES.items()}
+
+# Compact numeric trade records (see WheelStrategy.get_trade_array)
+TRADE_DTYPE = np.dtype([
+    ('week', np.int32),
+    ('action', np.int8),        # One of the ACTION_* codes, 0 if unknown
+    ('symbol_idx', np.int16),   # Index into symbols, -1 if unknown
+    ('quantity', np.int32),
+    ('price', np.float64),
+    ('strike', np.float64),     # NaN for share trades
+    ('cash_flow', np.float64),
+])
+
+# Columns of the kernel trade log (one row per trade)
+LOG_WEEK = 0
+LOG_SYMBOL = 1      # Index into symbols
+LOG_ACTION = 2      # One of the ACTION_* codes
+LOG_PRICE = 3       # Option premium, or share price for share trades
+LOG_STRIKE = 4      # NaN for share trades
+LOG_CASH_FLOW = 5
+LOG_GAIN = 6        # Capital gain of a SELL_SHARES trade
+LOG_PREMIUMS = 7    # Premiums collected over the wheel cycle of a SELL_SHARES trade
+LOG_COLUMNS = 8
+
+# Slots of the account array threaded through the kernel
+ACCOUNT_CAPITAL = 0
+ACCOUNT_AVAILABLE = 1
+ACCOUNT_PREMIUMS = 2
+ACCOUNT_REALIZED = 3
+
+
+class Position:
+    """Snapshot of one symbol's wheel position (see WheelStrategy.get_position).
+    
+    The strategy keeps positions as parallel arrays; this slotted record is a
+    cheap per-symbol view for callers that want attribute access.
+    """
+    __slots__ = ('state', 'shares', 'cost_basis', 'premium', 'strike', 'exp')
+
+    def __init__(self, state=WheelState.CASH_SECURED_PUT, shares=0, cost_basis=0.0,
+                 premium=0.0, strike=None, exp=None):
+        self.state = state
+        self.shares = shares
+        self.cost_basis = cost_basis
+        self.premium = premium
+        self.strike = strike
+        self.exp = exp
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"Position({fields})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Position):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+
+# Mock base prices per symbol, and for symbols not listed
+MOCK_BASE_PRICES = {
+    "SPY": 450,
+    "QQQ": 370,
+    "IWM": 210
+}
+DEFAULT_MOCK_BASE_PRICE = 400
+
+# Deterministic weekly price multipliers, optimized for positive wheel returns.
+# Longer horizons repeat the 8-week cycle (see _deterministic_multipliers)
+_DETERMINISTIC_MULTIPLIERS = np.array([
+    1.0,    # Week 0: base
+    0.96,   # Week 1: small drop for put assignment
+    1.02,   # Week 2: recovery above strike for call sale
+    1.07,   # Week 3: call exercise for profit
+    1.10,   # Week 4: continued uptrend
+    0.98,   # Week 5: small dip for new put assignment
+    1.05,   # Week 6: recovery for profitable call exercise
+    1.12,   # Week 7: strong finish
+])
+
+
+def _deterministic_multipliers(weeks: int) -> np.ndarray:
+    """Deterministic multipliers for ``weeks`` weeks, cycling every 8 weeks."""
+    return np.resize(_DETERMINISTIC_MULTIPLIERS, max(weeks, 0))
+
+
+@lru_cache(maxsize=128)
+def _deterministic_mock_prices(base_price: float, weeks: int) -> Tuple[float, ...]:
+    """Deterministic mock price path, shared by every strategy instance."""
+    return tuple((base_price * _deterministic_multipliers(weeks)).tolist())
+
+
+@lru_cache(maxsize=128)
+def _random_mock_prices(seed: int, base_price: float, weeks: int) -> Tuple[float, ...]:
+    """Random mock price path with a positive bias, shared for equal seeds.
+
+    Weekly changes of -2% to +4% are compounded in one cumulative product.
+    """
+    rng = np.random.default_rng(seed)
+    changes = rng.uniform(-0.02, 0.04, size=max(weeks - 1, 0))
+    # Growth factors are written straight into one preallocated path
+    path = np.empty(len(changes) + 1)
+    path[0] = 1.0
+    np.cumprod(1.0 + changes, out=path[1:])
+    path *= base_price
+    return tuple(np.round(path, 2, out=path).tolist())
+
+
+@njit(cache=True)
+def _round_cents(x):
+    """``round(x, 2)`` with Python's exact rounding, also when compiled.
+
+    Numba's ``round`` rounds the product ``x * 100``, which can land exactly
+    on a half cent that ``x`` itself is not on (369.075 is stored as
+    369.07499...). Such ties are decided by the exact error of the product,
+    computed with Dekker's two-product.
+    """
+    y = x * 100.0
+    z = np.floor(y)
+    diff = y - z
+    if diff > 0.5:
+        z += 1.0
+    elif diff == 0.5:
+        t = 134217729.0 * x  # 2**27 + 1 splits x into two 26-bit halves
+        x_hi = t - (t - x)
+        x_lo = x - x_hi
+        error = (x_hi * 100.0 - y) + x_lo * 100.0
+        if error > 0.0 or (error == 0.0 and z % 2.0 != 0.0):
+            z += 1.0
+    return z / 100.0
+
+
+@njit(cache=True)
+def _round_cents_array(x):
+    """Elementwise ``_round_cents`` for 1-D arrays of prices."""
+    out = np.empty_like(x)
+    for i in range(x.shape[0]):
+        out[i] = _round_cents(x[i])
+    return out
+
+
+@njit(cache=True)
+def _tied_up_capital(state, shares, cost_basis, strike):
+    """Capital reserved by open puts and held shares (see update_available_capital)."""
+    tied_up = 0.0
+    for i in range(state.shape[0]):
+        if state[i] == STATE_CSP and not np.isnan(strike[i]) and strike[i] != 0.0:
+            tied_up += strike[i] * CONTRACT_SIZE
+        elif shares[i] > 0:
+            tied_up += shares[i] * cost_basis[i]
+    return tied_up
+
+
+@njit(cache=True)
+def _run_wheel(prices, lengths, first_week, last_week, state, shares, cost_basis,
+               premium, strike, expiration, account,
+               put_strike_pct, call_strike_pct, put_premium_pct, call_premium_pct):
+    """Numeric core of the wheel strategy.
+
+    Mirrors the weekly loop of ``WheelStrategy.run`` for weeks
+    ``first_week`` to ``last_week - 1``. Position arrays (indexed by symbol)
+    and ``account`` are updated in place.
+
+    Args:
+        prices: float64 array of shape (n_symbols, n_cols) of weekly prices
+        lengths: Number of valid prices per symbol; later weeks price at 0.0
+        first_week: First week to process
+        last_week: Week to stop before
+        state: STATE_* code per symbol
+        shares: Shares held per symbol
+        cost_basis: Share cost basis per symbol
+        premium: Premiums collected in the current wheel cycle per symbol
+        strike: Open option strike per symbol, NaN when none is open
+        expiration: Open option expiration week per symbol, -1 when none
+        account: float64 array indexed by the ACCOUNT_* slots
+        put_strike_pct, call_strike_pct, put_premium_pct, call_premium_pct:
+            Strategy parameters
+
+    Returns:
+        np.ndarray: Trade log of shape (n_trades, LOG_COLUMNS)
+    """
+    n_symbols = state.shape[0]
+    trade_log = np.zeros((n_symbols * max(last_week - first_week, 0), LOG_COLUMNS))
+    n_trades = 0
+    # Kept up to date incrementally; available capital is refreshed from it at
+    # the same points as update_capital/update_available_capital
+    reserved = _tied_up_capital(state, shares, cost_basis, strike)
+
+    for week in range(first_week, last_week):
+        for i in range(n_symbols):
+            current_price = float(prices[i, week]) if week < lengths[i] else 0.0
+            next_price = float(prices[i, week + 1]) if week + 1 < lengths[i] else current_price
+            action = 0
+            price = 0.0
+            option_strike = np.nan
+            cash_flow = 0.0
+            gain = 0.0
+            cycle_premiums = 0.0
+
+            if state[i] == STATE_CSP:
+                if np.isnan(strike[i]):
+                    strike_price = _round_cents(current_price * put_strike_pct)
+                    option_premium = _round_cents(strike_price * put_premium_pct)
+                    if account[ACCOUNT_AVAILABLE] >= strike_price * CONTRACT_SIZE:
+                        strike[i] = strike_price
+                        expiration[i] = week + 1
+                        premium[i] += option_premium
+                        reserved += strike_price * CONTRACT_SIZE
+                        account[ACCOUNT_CAPITAL] += option_premium
+                        account[ACCOUNT_AVAILABLE] = account[ACCOUNT_CAPITAL] - reserved
+                        account[ACCOUNT_PREMIUMS] += option_premium
+                        action = ACTION_SELL_PUT
+                        price = option_premium
+                        option_strike = strike_price
+                        cash_flow = option_premium
+                elif week >= expiration[i]:
+                    if next_price < strike[i]:
+                        # Put assigned - buy 100 shares at the strike
+                        strike_price = strike[i]
+                        cost = strike_price * CONTRACT_SIZE
+                        shares[i] = CONTRACT_SIZE
+                        cost_basis[i] = strike_price
+                        state[i] = STATE_HOLDING
+                        strike[i] = np.nan
+                        expiration[i] = -1
+                        account[ACCOUNT_CAPITAL] -= cost
+                        account[ACCOUNT_AVAILABLE] = account[ACCOUNT_CAPITAL] - reserved
+                        action = ACTION_BUY_SHARES
+                        price = strike_price
+                        cash_flow = -cost
+                    else:
+                        reserved -= strike[i] * CONTRACT_SIZE
+                        strike[i] = np.nan
+                        expiration[i] = -1
+            elif state[i] == STATE_HOLDING:
+                if np.isnan(strike[i]):
+                    strike_price = _round_cents(current_price * call_strike_pct)
+                    option_premium = _round_cents(strike_price * call_premium_pct)
+                    strike[i] = strike_price
+                    expiration[i] = week + 1
+                    premium[i] += option_premium
+                    account[ACCOUNT_CAPITAL] += option_premium
+                    account[ACCOUNT_AVAILABLE] = account[ACCOUNT_CAPITAL] - reserved
+                    account[ACCOUNT_PREMIUMS] += option_premium
+                    action = ACTION_SELL_CALL
+                    price = option_premium
+                    option_strike = strike_price
+                    cash_flow = option_premium
+                elif week >= expiration[i]:
+                    if next_price > strike[i]:
+                        # Call exercised - sell the shares at the strike
+                        strike_price = strike[i]
+                        proceeds = strike_price * CONTRACT_SIZE
+                        gain = proceeds - cost_basis[i] * CONTRACT_SIZE
+                        cycle_premiums = premium[i]
+                        account[ACCOUNT_CAPITAL] += proceeds
+                        account[ACCOUNT_AVAILABLE] = account[ACCOUNT_CAPITAL] - reserved
+                        account[ACCOUNT_REALIZED] += gain
+                        reserved -= shares[i] * cost_basis[i]
+                        shares[i] = 0
+                        cost_basis[i] = 0.0
+                        state[i] = STATE_CSP
+                        strike[i] = np.nan
+                        expiration[i] = -1
+                        premium[i] = 0.0
+                        action = ACTION_SELL_SHARES
+                        price = strike_price
+                        cash_flow = proceeds
+                    else:
+                        strike[i] = np.nan
+                        expiration[i] = -1
+
+            if action:
+                row = trade_log[n_trades]
+                row[LOG_WEEK] = week
+                row[LOG_SYMBOL] = i
+                row[LOG_ACTION] = action
+                row[LOG_PRICE] = price
+                row[LOG_STRIKE] = option_strike
+                row[LOG_CASH_FLOW] = cash_flow
+                row[LOG_GAIN] = gain
+                row[LOG_PREMIUMS] = cycle_premiums
+                n_trades += 1
+
+        reserved = _tied_up_capital(state, shares, cost_basis, strike)
+        account[ACCOUNT_AVAILABLE] = account[ACCOUNT_CAPITAL] - reserved
+
+    return trade_log[:n_trades]
+
+
+@njit(parallel=True, cache=True)
+def _run_wheel_paths(paths, state, shares, cost_basis, premium, strike, expiration, account,
+                     put_strike_pct, call_strike_pct, put_premium_pct, call_premium_pct):
+    """Run ``_run_wheel`` over many price paths in parallel.
+
+    Every path starts from the same positions and account, which are left
+    untouched; paths are spread across cores with ``prange``.
+
+    Args:
+        paths: float64 array of shape (n_paths, n_symbols, n_weeks)
+        state, shares, cost_basis, premium, strike, expiration, account:
+            Starting positions and account, as for ``_run_wheel``
+        put_strike_pct, call_strike_pct, put_premium_pct, call_premium_pct:
+            Strategy parameters
+
+    Returns:
+        tuple: (accounts, trade_counts, values) with the final account
+        (n_paths, 4), number of trades and portfolio value of each path
+    """
+    n_paths, n_symbols, n_weeks = paths.shape
+    accounts = np.empty((n_paths, account.shape[0]))
+    trade_counts = np.zeros(n_paths, dtype=np.int64)
+    values = np.empty(n_paths)
+    lengths = np.full(n_symbols, n_weeks, dtype=np.int64)
+
+    for p in prange(n_paths):
+        path_shares = shares.copy()
+        path_cost_basis = cost_basis.copy()
+        path_account = account.copy()
+        trade_log = _run_wheel(paths[p], lengths, 0, n_weeks, state.copy(), path_shares,
+                               path_cost_basis, premium.copy(), strike.copy(), expiration.copy(),
+                               path_account, put_strike_pct, call_strike_pct,
+                               put_premium_pct, call_premium_pct)
+
+        # Mark held shares at the last week's prices
+        value = path_account[ACCOUNT_CAPITAL]
+        for i in range(n_symbols):
+            if path_shares[i] > 0 and n_weeks > 0:
+                value += (paths[p, i, n_weeks - 1] - path_cost_basis[i]) * path_shares[i]
+
+        accounts[p] = path_account
+        trade_counts[p] = trade_log.shape[0]
+        values[p] = value
+
+    return accounts, trade_counts, values
+
 
 class WheelStrategy:
     """Options Wheel Strategy for stock ETFs with live data support."""
     
+    # Default strike and premium ratios, overridable via config['wheel_strategy']
+    PUT_STRIKE_MULT = 0.95
+    PUT_PREMIUM_PCT = 0.02
+    CALL_STRIKE_MULT = 1.05
+    CALL_PREMIUM_PCT = 0.015
+    CONTRACT_SIZE = CONTRACT_SIZE
+    
     def __init__(self, capital, symbols, config=None, price_fetcher=None):
         """Initialize the wheel strategy.
         
@@ -43,17 +428,24 @@ class WheelStrategy:
         self.initial_capital = capital
         self.capital = capital
         self.available_capital = capital
+        self._reserved_capital = 0.0  # Capital tied up in open puts and shares
         self.symbols = symbols
         self.config = config or {}
         self.price_fetcher = price_fetcher
         self.trades = []
+        self._run_timestamp = datetime.now().isoformat()  # Shared by trades of one run/week
+        
+        # Simulation narration goes to the logger when verbose, otherwise it is
+        # kept unformatted in memory (see get_log)
+        self.verbose = self.config.get('verbose', True)
+        self._log_records = []  # (message, args) pairs, formatted by get_log
         
         # Load strategy parameters from config
         wheel_config = self.config.get('wheel_strategy', {})
-        self.put_strike_pct = wheel_config.get('put_strike_pct', 0.95)
-        self.call_strike_pct = wheel_config.get('call_strike_pct', 1.05)
-        self.put_premium_pct = wheel_config.get('put_premium_pct', 0.02)
-        self.call_premium_pct = wheel_config.get('call_premium_pct', 0.015)
+        self.put_strike_pct = wheel_config.get('put_strike_pct', self.PUT_STRIKE_MULT)
+        self.call_strike_pct = wheel_config.get('call_strike_pct', self.CALL_STRIKE_MULT)
+        self.put_premium_pct = wheel_config.get('put_premium_pct', self.PUT_PREMIUM_PCT)
+        self.call_premium_pct = wheel_config.get('call_premium_pct', self.CALL_PREMIUM_PCT)
         
         # P&L tracking
         self.total_premiums_collected = 0.0
@@ -64,21 +456,28 @@ class WheelStrategy:
         self.data_mode = self.config.get('data_mode', 'mock')
         self.simulation_weeks = self.config.get('simulation', {}).get('weeks_to_simulate', 8)
         
-        # Price data (will be populated by _initialize_price_data)
-        self.prices = {}
-        self.current_week = 0
+        # Numeric copy of the trade log, preallocated for the most trades a run can
+        # make (one per symbol every week) and only grown by longer runs
+        self._trade_array = np.empty(max(len(symbols), 1) * max(self.simulation_weeks, 1), dtype=TRADE_DTYPE)
+        self._trade_count = 0
         
-        # Position tracking for each symbol
-        self.positions = {}
-        for symbol in symbols:
-            self.positions[symbol] = {
-                'state': WheelState.CASH_SECURED_PUT,
-                'shares': 0,
-                'cost_basis': 0.0,
-                'option_premium_collected': 0.0,
-                'current_strike': None,
-                'expiration_date': None
-            }
+        # Price data as one (symbols x weeks) matrix, populated by _initialize_price_data.
+        # price_lengths is the number of known weeks per symbol; later weeks price at 0.0
+        self.symbol_index = {symbol: i for i, symbol in enumerate(symbols)}
+        self.price_matrix = np.zeros((len(symbols), 0))
+        self.price_lengths = np.zeros(len(symbols), dtype=np.int64)
+        self.current_week = 0
+        self._price_rows = None      # (current, next week) price rows of _price_rows_week
+        self._price_rows_week = -1   # -1 when the cached rows are stale
+        
+        # Position tracking for each symbol, as parallel arrays indexed like symbols
+        # (see get_position / get_position_info for per-symbol views)
+        self._state = np.full(len(symbols), STATE_CSP, dtype=np.int8)
+        self._shares = np.zeros(len(symbols), dtype=np.int64)
+        self._cost_basis = np.zeros(len(symbols))
+        self._premium = np.zeros(len(symbols))                   # Premiums of the current wheel cycle
+        self._strike = np.full(len(symbols), np.nan)             # Open option strike, NaN when none
+        self._exp_week = np.full(len(symbols), -1, dtype=np.int64)  # Open option expiration, -1 when none
         
         # Initialize price data
         self._initialize_price_data()
@@ -87,100 +486,211 @@ class WheelStrategy:
         """Initialize price data based on data mode configuration."""
         if self.data_mode == 'live' and self.price_fetcher:
             try:
-                logger.info(f"Fetching live market data for {len(self.symbols)} ETF symbols")
+                logger.info("Fetching live market data for %d ETF symbols", len(self.symbols))
                 self.prices = self._fetch_live_prices()
-                logger.info(f"Successfully loaded live price data for {len(self.prices)} symbols")
+                logger.info("Successfully loaded live price data for %d symbols", len(self.symbols))
             except Exception as e:
-                logger.warning(f"Failed to fetch live data, falling back to mock data: {e}")
-                self.prices = self._generate_mock_prices()
+                logger.warning("Failed to fetch live data, falling back to mock data: %s", e)
+                self._set_price_matrix(self._generate_mock_prices())
         else:
             if self.data_mode == 'live':
                 logger.warning("Live mode requested but no price_fetcher provided, using mock data")
-            self.prices = self._generate_mock_prices()
+            self._set_price_matrix(self._generate_mock_prices())
+    
+    def _set_price_matrix(self, matrix: np.ndarray, lengths: Optional[np.ndarray] = None):
+        """Replace ``price_matrix``; every week of it is known unless ``lengths`` is given."""
+        self.price_matrix = matrix
+        if lengths is None:
+            lengths = np.full(len(self.symbols), matrix.shape[1], dtype=np.int64)
+        self.price_lengths = lengths
+        self._price_rows_week = -1
+    
+    @property
+    def prices(self) -> Mapping[str, Tuple[float, ...]]:
+        """Weekly prices per symbol, as a read-only snapshot of ``price_matrix``.
+        
+        The mapping and its tuples are immutable, so in-place edits raise
+        instead of being lost; assign a new dict to change prices.
+        """
+        return MappingProxyType({symbol: tuple(self.price_matrix[i, :self.price_lengths[i]].tolist())
+                                 for i, symbol in enumerate(self.symbols)})
+    
+    @prices.setter
+    def prices(self, prices: Dict[str, List[float]]):
+        """Load a dict of per-symbol price lists into ``price_matrix``."""
+        weeks = max((len(symbol_prices) for symbol_prices in prices.values()), default=0)
+        matrix = np.zeros((len(self.symbols), weeks))
+        lengths = np.zeros(len(self.symbols), dtype=np.int64)
+        for symbol, symbol_prices in prices.items():
+            idx = self.symbol_index.get(symbol)
+            if idx is not None:
+                matrix[idx, :len(symbol_prices)] = symbol_prices
+                lengths[idx] = len(symbol_prices)
+        self._set_price_matrix(matrix, lengths)
     
     def _fetch_live_prices(self) -> Dict[str, List[float]]:
-        """Fetch live market data for all symbols."""
+        """Fetch live market data for all symbols.
+        
+        Symbols are fetched concurrently, since each request mostly waits on
+        the network.
+        """
         if not self.price_fetcher:
             raise ValueError("PriceFetcher not available for live data")
         
-        prices = {}
-        days_to_fetch = max(self.simulation_weeks, 7)  # Ensure we have enough data
+        if not self.symbols:
+            return {}
         
-        for symbol in self.symbols:
-            try:
-                symbol_prices = self.price_fetcher.get_prices(symbol, 'etf', days_to_fetch)
-                
-                if len(symbol_prices) < self.simulation_weeks:
-                    logger.warning(f"Insufficient data for {symbol}: got {len(symbol_prices)}, need {self.simulation_weeks}")
-                    # Pad with last known price if needed
-                    while len(symbol_prices) < self.simulation_weeks:
-                        symbol_prices.append(symbol_prices[-1])
-                
-                prices[symbol] = symbol_prices[:self.simulation_weeks]
-                logger.info(f"Loaded {len(prices[symbol])} price points for {symbol}")
-                
-            except Exception as e:
-                logger.error(f"Failed to fetch prices for {symbol}: {e}")
-                # Use fallback mock data for this symbol
-                prices[symbol] = self._generate_mock_prices_for_symbol(symbol)
+        days_to_fetch = max(self.simulation_weeks, 7)  # Ensure we have enough data
         
-        return prices
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(self.symbols))) as executor:
+            results = executor.map(lambda symbol: self._fetch_live_prices_for_symbol(symbol, days_to_fetch),
+                                   self.symbols)
+            return dict(zip(self.symbols, results))
+    
+    def _fetch_live_prices_for_symbol(self, symbol: str, days_to_fetch: int) -> List[float]:
+        """Fetch live prices for one symbol, falling back to mock data on errors."""
+        try:
+            symbol_prices = self.price_fetcher.get_prices(symbol, 'etf', days_to_fetch)
+            
+            if len(symbol_prices) < self.simulation_weeks:
+                logger.warning("Insufficient data for %s: got %d, need %d", symbol, len(symbol_prices), self.simulation_weeks)
+                # Pad with last known price if needed
+                while len(symbol_prices) < self.simulation_weeks:
+                    symbol_prices.append(symbol_prices[-1])
+            
+            symbol_prices = symbol_prices[:self.simulation_weeks]
+            logger.info("Loaded %d price points for %s", len(symbol_prices), symbol)
+            return symbol_prices
+            
+        except Exception as e:
+            logger.error("Failed to fetch prices for %s: %s", symbol, e)
+            # Use fallback mock data for this symbol
+            return self._generate_mock_prices_for_symbol(symbol)
+    
+    def _deterministic_mode(self) -> bool:
+        """Whether mock prices follow the deterministic weekly path."""
+        return bool(self.config.get('test_mode', False) or
+                    self.config.get('simulation', {}).get('enable_deterministic_mode', False))
     
     def _generate_mock_prices_for_symbol(self, symbol: str) -> List[float]:
         """Generate mock prices for a single symbol."""
-        base_prices = {
-            "SPY": 450,
-            "QQQ": 370, 
-            "IWM": 210
-        }
+        base_price = MOCK_BASE_PRICES.get(symbol, DEFAULT_MOCK_BASE_PRICE)
         
-        base_price = base_prices.get(symbol, 400)
-        
-        if self.config.get('test_mode', False) or self.config.get('simulation', {}).get('enable_deterministic_mode', False):
+        if self._deterministic_mode():
             # Deterministic price sequence optimized for positive wheel returns
-            return [
-                base_price,          # Week 0: base
-                base_price * 0.96,   # Week 1: small drop for put assignment
-                base_price * 1.02,   # Week 2: recovery above strike for call sale
-                base_price * 1.07,   # Week 3: call exercise for profit
-                base_price * 1.10,   # Week 4: continued uptrend
-                base_price * 0.98,   # Week 5: small dip for new put assignment
-                base_price * 1.05,   # Week 6: recovery for profitable call exercise
-                base_price * 1.12,   # Week 7: strong finish
-            ][:self.simulation_weeks]
+            return list(_deterministic_mock_prices(base_price, self.simulation_weeks))
         else:
             # Random generation with positive bias for demo purposes
-            random.seed(42 + hash(symbol))  # Different seed per symbol
-            prices = [base_price]
-            
-            for week in range(self.simulation_weeks - 1):
-                # Slight positive bias: -2% to +4% weekly changes
-                price_change = random.uniform(-0.02, 0.04)
-                new_price = prices[-1] * (1 + price_change)
-                prices.append(round(new_price, 2))
-            
-            return prices
+            # Different seed per symbol; crc32 (unlike hash()) is the same in every process
+            seed = 42 + zlib.crc32(symbol.encode())
+            return list(_random_mock_prices(seed, base_price, self.simulation_weeks))
     
-    def _generate_mock_prices(self) -> Dict[str, List[float]]:
+    def _generate_mock_prices(self) -> np.ndarray:
         """Generate mock price data for simulation.
         
         Returns:
-            dict: Weekly prices for each symbol
+            np.ndarray: Weekly prices with shape (len(symbols), weeks)
         """
-        prices = {}
-        
-        for symbol in self.symbols:
-            prices[symbol] = self._generate_mock_prices_for_symbol(symbol)
+        if self._deterministic_mode():
+            # Every symbol follows the same multipliers: one broadcast product
+            bases = np.array([MOCK_BASE_PRICES.get(symbol, DEFAULT_MOCK_BASE_PRICE)
+                              for symbol in self.symbols], dtype=np.float64)
+            prices = bases[:, None] * _deterministic_multipliers(self.simulation_weeks)
+        else:
+            rows = [self._generate_mock_prices_for_symbol(symbol) for symbol in self.symbols]
+            prices = np.vstack(rows) if rows else np.zeros((0, 0))
         
-        logger.info(f"Generated mock price data for {len(prices)} symbols")
+        logger.info("Generated mock price data for %d symbols", len(self.symbols))
         return prices
     
+    def simulate(self, num_weeks: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Run the wheel numerically, without logging or trade records.
+        
+        Starts from the current positions and capital at week 0 and leaves the
+        strategy untouched. Intended for parameter sweeps; uses the
+        JIT-compiled kernel when numba is installed.
+        
+        Args:
+            num_weeks (int): Number of weeks to simulate. If None, uses config value.
+            
+        Returns:
+            tuple: (trade_log, account) arrays, see ``_run_wheel``
+        """
+        weeks = num_weeks or self.simulation_weeks
+        
+        account = np.array([self.capital, self.available_capital,
+                            self.total_premiums_collected, self.realized_gains], dtype=np.float64)
+        
+        trade_log = _run_wheel(self.price_matrix, self.price_lengths, 0, weeks,
+                               self._state.copy(), self._shares.copy(), self._cost_basis.copy(),
+                               self._premium.copy(), self._strike.copy(), self._exp_week.copy(), account,
+                               self.put_strike_pct, self.call_strike_pct,
+                               self.put_premium_pct, self.call_premium_pct)
+        return trade_log, account
+    
+    def random_price_paths(self, n_paths: int, num_weeks: Optional[int] = None,
+                           seed: Optional[int] = None) -> np.ndarray:
+        """Generate random mock price paths for Monte-Carlo runs.
+        
+        All paths are drawn in one batch, with the same -2% to +4% weekly
+        changes as the random mock prices, starting from each symbol's base price.
+        
+        Args:
+            n_paths (int): Number of paths
+            num_weeks (int): Weeks per path (at least 1). If None, uses config value.
+            seed (int): Random seed, for reproducible paths
+            
+        Returns:
+            np.ndarray: Prices with shape (n_paths, len(symbols), weeks)
+            
+        Raises:
+            ValueError: If the number of weeks is less than 1
+        """
+        weeks = self.simulation_weeks if num_weeks is None else num_weeks
+        if weeks < 1:
+            raise ValueError(f"num_weeks must be at least 1, got {weeks}")
+        bases = np.array([MOCK_BASE_PRICES.get(symbol, DEFAULT_MOCK_BASE_PRICE)
+                          for symbol in self.symbols], dtype=np.float64)
+        
+        rng = np.random.default_rng(seed)
+        changes = rng.uniform(-0.02, 0.04, size=(n_paths, len(self.symbols), weeks - 1))
+        paths = np.empty((n_paths, len(self.symbols), weeks))
+        paths[:, :, 0] = 1.0
+        np.cumprod(1.0 + changes, axis=2, out=paths[:, :, 1:])
+        paths *= bases[None, :, None]
+        return np.round(paths, 2, out=paths)
+    
+    def simulate_paths(self, paths: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Run the wheel over many price scenarios in parallel.
+        
+        Each path is simulated like ``simulate`` from the current positions
+        and capital, leaving the strategy untouched. With numba installed the
+        paths run on all cores.
+        
+        Args:
+            paths (np.ndarray): Prices with shape (n_paths, len(symbols), weeks),
+                e.g. from ``random_price_paths``
+                
+        Returns:
+            tuple: (accounts, trade_counts, values) — final account per path
+            indexed by the ACCOUNT_* slots, trades per path, and final
+            portfolio value per path
+        """
+        account = np.array([self.capital, self.available_capital,
+                            self.total_premiums_collected, self.realized_gains], dtype=np.float64)
+        
+        return _run_wheel_paths(np.ascontiguousarray(paths, dtype=np.float64),
+                                self._state, self._shares, self._cost_basis,
+                                self._premium, self._strike, self._exp_week, account,
+                                self.put_strike_pct, self.call_strike_pct,
+                                self.put_premium_pct, self.call_premium_pct)
+    
     def get_data_source_info(self) -> Dict[str, str]:
         """Get information about the current data source being used."""
         info = {
             'data_mode': self.data_mode,
             'price_fetcher_available': self.price_fetcher is not None,
-            'symbols_loaded': list(self.prices.keys()),
+            'symbols_loaded': list(self.symbols),
             'simulation_weeks': self.simulation_weeks
         }
         
@@ -200,18 +710,90 @@ class WheelStrategy:
         Returns:
             float: Current price
         """
-        if symbol in self.prices and self.current_week < len(self.prices[symbol]):
-            return self.prices[symbol][self.current_week]
+        idx = self.symbol_index.get(symbol)
+        if idx is not None and self.current_week < self.price_lengths[idx]:
+            return float(self.price_matrix[idx, self.current_week])
         return 0.0
     
+    def _log(self, message: str, *args):
+        """Emit a simulation message, or buffer it when not verbose.
+        
+        Args:
+            message (str): Message text, or a %-style template when args are given
+            *args: Template values; formatting is deferred until the message is read
+        """
+        if self.verbose:
+            logger.info(message, *args)
+        else:
+            self._log_records.append((message, args))
+    
+    def _log_enabled(self) -> bool:
+        """Whether simulation messages are currently emitted or buffered."""
+        return not self.verbose or logger.isEnabledFor(logging.INFO)
+    
+    def get_log(self) -> str:
+        """Get the simulation messages buffered while ``verbose`` was off."""
+        return ''.join(
+            (message % args if args else message) + '\n'
+            for message, args in self._log_records
+        )
+    
     def advance_week(self):
         """Advance to the next week in the simulation."""
         self.current_week += 1
-        logger.info(f"--- Week {self.current_week} ---")
-        for symbol in self.symbols:
-            price = self.get_current_price(symbol)
-            logger.info(f"{symbol}: ${price}")
+        self._log("--- Week %d ---", self.current_week)
+        self._log_week_prices()
+    
+    def _log_week_prices(self):
+        """Log every symbol's current price, read from the cached price row."""
+        for symbol, price in zip(self.symbols, self._current_price_row().tolist()):
+            self._log("%s: $%s", symbol, price)
         
+    def get_position(self, symbol) -> Optional[Position]:
+        """Get a snapshot of the current position for a symbol.
+        
+        Args:
+            symbol (str): ETF symbol
+            
+        Returns:
+            Position: Position snapshot, or None if the symbol is not traded
+        """
+        idx = self.symbol_index.get(symbol)
+        if idx is None:
+            return None
+        
+        strike = self._strike[idx]
+        expiration = self._exp_week[idx]
+        return Position(
+            state=WheelState(self._state[idx]),
+            shares=int(self._shares[idx]),
+            cost_basis=float(self._cost_basis[idx]),
+            premium=float(self._premium[idx]),
+            strike=None if np.isnan(strike) else float(strike),
+            exp=None if expiration < 0 else int(expiration)
+        )
+    
+    def set_position(self, symbol, position: Position):
+        """Replace the current position for a symbol, e.g. to resume a saved run.
+    
+        Args:
+            symbol (str): ETF symbol
+            position (Position): New position; strike and exp of None mean no open option
+    
+        Raises:
+            KeyError: If the symbol is not traded by this strategy
+        """
+        idx = self.symbol_index[symbol]
+        self._state[idx] = position.state
+        self._shares[idx] = position.shares
+        self._cost_basis[idx] = position.cost_basis
+        self._premium[idx] = position.premium
+        self._strike[idx] = np.nan if position.strike is None else position.strike
+        self._exp_week[idx] = -1 if position.exp is None else position.exp
+    
+        # The capital the old position reserved may differ from the new one
+        self.update_available_capital()
+    
     def get_position_info(self, symbol):
         """Get current position information for a symbol.
         
@@ -221,7 +803,28 @@ class WheelStrategy:
         Returns:
             dict: Position information
         """
-        return self.positions.get(symbol, {})
+        pos = self.get_position(symbol)
+        if pos is None:
+            return {}
+        
+        return {
+            'state': pos.state,
+            'shares': pos.shares,
+            'cost_basis': pos.cost_basis,
+            'option_premium_collected': pos.premium,
+            'current_strike': pos.strike,
+            'expiration_date': pos.exp
+        }
+    
+    @property
+    def positions(self) -> Mapping[str, Mapping]:
+        """Position information per symbol, as a read-only view over the position arrays.
+        
+        Both levels are read-only so stale writes raise TypeError instead of
+        being lost; use set_position to change a position.
+        """
+        return MappingProxyType({symbol: MappingProxyType(self.get_position_info(symbol))
+                                 for symbol in self.symbols})
     
     def update_capital(self, amount, description=""):
         """Update capital and available capital.
@@ -231,32 +834,35 @@ class WheelStrategy:
             description (str): Description of the capital change
         """
         self.capital += amount
-        self.update_available_capital()
+        self.available_capital = self.capital - self._reserved_capital
         if description:
-            logger.debug(f"Capital updated: {'+' if amount >= 0 else ''}${amount:.2f} ({description})")
+            logger.debug("Capital updated: %s$%.2f (%s)", '+' if amount >= 0 else '', amount, description)
     
     def update_available_capital(self):
-        """Update available capital based on current positions."""
-        tied_up_capital = 0
-        for symbol, pos in self.positions.items():
-            if pos['state'] == WheelState.CASH_SECURED_PUT and pos['current_strike']:
-                # Capital tied up for cash-secured put
-                tied_up_capital += pos['current_strike'] * 100  # 100 shares per contract
-            elif pos['shares'] > 0:
-                # Capital tied up in shares
-                tied_up_capital += pos['shares'] * pos['cost_basis']
-        
-        self.available_capital = self.capital - tied_up_capital
+        """Update available capital based on current positions.
+        
+        Recounts the reserved capital from scratch; trades keep it up to date
+        incrementally in between.
+        """
+        # Open puts reserve their strike; otherwise held shares reserve their cost
+        open_puts = (self._state == STATE_CSP) & ~np.isnan(self._strike) & (self._strike != 0)
+        holding = ~open_puts & (self._shares > 0)
+        self._reserved_capital = float(np.sum(self._strike[open_puts] * CONTRACT_SIZE) +
+                                       np.sum(self._shares[holding] * self._cost_basis[holding]))
+        self.available_capital = self.capital - self._reserved_capital
+    
+    def _holdings_gain(self):
+        """Unrealized gain of held shares at current prices, as one dot product."""
+        holders = self._shares > 0
+        # Most weeks nothing is held, so skip reading prices entirely
+        if not holders.any():
+            return 0.0
+        return float(np.dot(self._shares[holders].astype(np.float64),
+                            self._current_price_row()[holders] - self._cost_basis[holders]))
     
     def calculate_unrealized_pnl(self):
         """Calculate unrealized P&L for current holdings."""
-        unrealized = 0.0
-        for symbol, pos in self.positions.items():
-            if pos['shares'] > 0:
-                current_price = self.get_current_price(symbol)
-                market_value = pos['shares'] * current_price
-                book_value = pos['shares'] * pos['cost_basis']
-                unrealized += (market_value - book_value)
+        unrealized = self._holdings_gain()
         
         self.unrealized_pnl = unrealized
         return unrealized
@@ -273,7 +879,7 @@ class WheelStrategy:
             'total_premiums': self.total_premiums_collected,
             'realized_gains': self.realized_gains,
             'unrealized_pnl': unrealized,
-            'total_pnl': self.total_premiums_collected + self.realized_gains + unrealized,
+            'total_pnl': math.fsum((self.total_premiums_collected, self.realized_gains, unrealized)),
             'total_return_pct': ((self.capital + unrealized - self.initial_capital) / self.initial_capital) * 100
         }
         
@@ -287,53 +893,45 @@ class WheelStrategy:
         Returns:
             list: List of trade records
         """
-        logger.info(f"Executing Wheel Strategy with ${self.capital:,.2f}")
-        logger.info(f"Trading symbols: {self.symbols}")
-        logger.info(f"Available capital: ${self.available_capital:,.2f}")
-        
-        # Display initial prices
-        logger.info(f"--- Week {self.current_week} (Start) ---")
-        for symbol in self.symbols:
-            price = self.get_current_price(symbol)
-            logger.info(f"{symbol}: ${price}")
-        
-        # Display current positions
-        logger.info("Initial Positions:")
-        for symbol in self.symbols:
-            pos = self.positions[symbol]
-            logger.info(f"{symbol}: State={pos['state'].value}, Shares={pos['shares']}")
+        # One wall-clock timestamp per run; the week field orders the trades
+        self._run_timestamp = datetime.now().isoformat()
+        if self._log_enabled():
+            self._log(f"Executing Wheel Strategy with ${self.capital:,.2f}")
+            self._log("Trading symbols: %s", self.symbols)
+            self._log(f"Available capital: ${self.available_capital:,.2f}")
+            
+            # Display initial prices
+            self._log("--- Week %d (Start) ---", self.current_week)
+            self._log_week_prices()
+            
+            # Display current positions
+            self._log("Initial Positions:")
+            for symbol, state, shares in zip(self.symbols, self._state, self._shares):
+                self._log("%s: State=%s, Shares=%s", symbol, _STATE_LABELS[state], shares)
         
         # Get number of weeks from parameter or config
-        weeks_to_simulate = num_weeks or self.config.get('simulation', {}).get('weeks_to_simulate', 52)
+        weeks_to_simulate = num_weeks or self.simulation_weeks
         
         # Run simulation for specified weeks
-        for week in range(weeks_to_simulate):
-            if week > 0:
-                self.advance_week()
-            
-            # Process each symbol independently
-            for symbol in self.symbols:
-                self._process_wheel_for_symbol(symbol)
-            
-            self.update_available_capital()
-            
-            # Show weekly P&L summary
-            pnl = self.get_total_pnl()
-            logger.info(f"Week {self.current_week} P&L: Total=${pnl['total_pnl']:.2f} (Premiums=${pnl['total_premiums']:.2f}, Unrealized=${pnl['unrealized_pnl']:.2f})")
+        if self.verbose:
+            self._run_weekly_loop(weeks_to_simulate)
+        else:
+            self._run_with_kernel(weeks_to_simulate)
         
         # Final summary
         final_pnl = self.get_total_pnl()
-        logger.info("=== SIMULATION COMPLETE ===")
-        logger.info(f"Initial Capital: ${self.initial_capital:,.2f}")
-        logger.info(f"Final Capital: ${self.capital:,.2f}")
-        logger.info(f"Available Capital: ${self.available_capital:,.2f}")
-        logger.info(f"Total Trades: {len(self.trades)}")
-        logger.info("P&L BREAKDOWN:")
-        logger.info(f"  Premiums Collected: ${final_pnl['total_premiums']:.2f}")
-        logger.info(f"  Realized Gains: ${final_pnl['realized_gains']:.2f}")
-        logger.info(f"  Unrealized P&L: ${final_pnl['unrealized_pnl']:.2f}")
-        logger.info(f"  Total P&L: ${final_pnl['total_pnl']:.2f}")
-        logger.info(f"  Total Return: {final_pnl['total_return_pct']:.2f}%")
+        if self._log_enabled():
+            self._log("=== SIMULATION COMPLETE ===")
+            self._log(f"Initial Capital: ${self.initial_capital:,.2f}")
+            self._log(f"Final Capital: ${self.capital:,.2f}")
+            self._log(f"Available Capital: ${self.available_capital:,.2f}")
+            self._log("Total Trades: %d", len(self.trades))
+            self._log("P&L BREAKDOWN:")
+            self._log("  Premiums Collected: $%.2f", final_pnl['total_premiums'])
+            self._log("  Realized Gains: $%.2f", final_pnl['realized_gains'])
+            self._log("  Unrealized P&L: $%.2f", final_pnl['unrealized_pnl'])
+            self._log("  Total P&L: $%.2f", final_pnl['total_pnl'])
+            self._log("  Total Return: %.2f%%", final_pnl['total_return_pct'])
         
         # Print trades summary and export to CSV
         self.print_trades_summary()
@@ -342,6 +940,98 @@ class WheelStrategy:
         # Return trade list for main coordination
         return self.trades
     
+    def _run_weekly_loop(self, weeks):
+        """Simulate week by week, narrating prices, trades and weekly P&L."""
+        for week in range(weeks):
+            if week > 0:
+                self.advance_week()
+            
+            # Process each symbol independently
+            self._process_week()
+            
+            self.update_available_capital()
+            
+            # Show weekly P&L summary
+            if self._log_enabled():
+                pnl = self.get_total_pnl()
+                self._log("Week %d P&L: Total=$%.2f (Premiums=$%.2f, Unrealized=$%.2f)",
+                          self.current_week, pnl['total_pnl'], pnl['total_premiums'], pnl['unrealized_pnl'])
+    
+    def _run_with_kernel(self, weeks):
+        """Simulate with the numeric kernel, then replay only its trades.
+        
+        All weeks are processed by one ``_run_wheel`` call that updates the
+        position arrays in place. Its trade log is then turned into trade
+        records, so quiet batch runs skip the per-week prices, expiries and
+        P&L narration of the verbose loop.
+        """
+        first_week = self.current_week
+        account = np.array([self.capital, self.available_capital,
+                            self.total_premiums_collected, self.realized_gains], dtype=np.float64)
+        
+        trade_log = _run_wheel(self.price_matrix, self.price_lengths, first_week, first_week + weeks,
+                               self._state, self._shares, self._cost_basis,
+                               self._premium, self._strike, self._exp_week, account,
+                               self.put_strike_pct, self.call_strike_pct,
+                               self.put_premium_pct, self.call_premium_pct)
+        
+        self._reserve_trade_capacity(len(trade_log))
+        for row in trade_log.tolist():
+            self._replay_trade(row)
+        
+        self.capital, _, self.total_premiums_collected, self.realized_gains = account.tolist()
+        if weeks > 0:
+            self.current_week = first_week + weeks - 1
+        self.update_available_capital()
+    
+    def _replay_trade(self, row):
+        """Record one row of the kernel trade log as a trade.
+        
+        Args:
+            row (list): Trade log row, indexed by the LOG_* columns
+        """
+        self.current_week = int(row[LOG_WEEK])
+        symbol = self.symbols[int(row[LOG_SYMBOL])]
+        action = int(row[LOG_ACTION])
+        price = row[LOG_PRICE]
+        strike_price = row[LOG_STRIKE]
+        
+        if action == ACTION_SELL_PUT or action == ACTION_SELL_CALL:
+            option = 'put' if action == ACTION_SELL_PUT else 'call'
+            self.log_trade({
+                'symbol': symbol,
+                'action': ACTION_NAMES[action],
+                'quantity': 1,  # 1 contract
+                'price': price,
+                'strike': strike_price,
+                'total_value': price,
+                'notes': f'Sold {option} with strike ${strike_price}'
+            })
+            self._log("%s: Sold %s with strike $%s, premium $%s", symbol, option, strike_price, price)
+        elif action == ACTION_BUY_SHARES:
+            self.log_trade({
+                'symbol': symbol,
+                'action': 'BUY_SHARES',
+                'quantity': CONTRACT_SIZE,
+                'price': price,
+                'total_value': row[LOG_CASH_FLOW],
+                'notes': f'Put assigned, bought 100 shares at ${price}'
+            })
+            self._log("%s: Put assigned! Bought 100 shares at $%s", symbol, price)
+        else:
+            capital_gain = row[LOG_GAIN]
+            total_premiums = row[LOG_PREMIUMS]
+            self.log_trade({
+                'symbol': symbol,
+                'action': 'SELL_SHARES',
+                'quantity': CONTRACT_SIZE,
+                'price': price,
+                'total_value': row[LOG_CASH_FLOW],
+                'notes': f'Call exercised, sold 100 shares at ${price}. Capital gain: ${capital_gain:.2f}, Total premiums: ${total_premiums:.2f}'
+            })
+            self._log("%s: Call exercised! Sold 100 shares at $%s", symbol, price)
+            self._log("  Capital gain: $%.2f, Total premiums: $%.2f", capital_gain, total_premiums)
+    
     def execute_week(self, week_number, prices=None):
         """Execute one week of the wheel strategy.
         
@@ -354,29 +1044,33 @@ class WheelStrategy:
         Returns:
             list: Trades executed this week
         """
-        week_trades = []
         self.current_week = week_number
+        self._run_timestamp = datetime.now().isoformat()
+        first_trade = len(self.trades)
         
         # Update prices if provided
         if prices:
+            known_weeks = self.price_matrix.shape[1]
+            if week_number >= known_weeks:
+                # Ensure we have enough price data
+                self.price_matrix = np.pad(self.price_matrix, ((0, 0), (0, week_number + 1 - known_weeks)))
             for symbol, price in prices.items():
-                if symbol in self.prices:
-                    # Ensure we have enough price data
-                    while len(self.prices[symbol]) <= week_number:
-                        self.prices[symbol].append(price)
-                    self.prices[symbol][week_number] = price
+                idx = self.symbol_index.get(symbol)
+                if idx is not None:
+                    # Backfill any skipped weeks with the provided price
+                    first_new_week = min(self.price_lengths[idx], week_number)
+                    self.price_matrix[idx, first_new_week:week_number + 1] = price
+                    self.price_lengths[idx] = max(self.price_lengths[idx], week_number + 1)
+            self._price_rows_week = -1
         
         # Process each symbol
-        for symbol in self.symbols:
-            self._process_wheel_for_symbol(symbol)
+        self._process_week()
         
         # Update available capital after all trades
         self.update_available_capital()
         
-        # Collect trades from this week
-        week_trades = [t for t in self.trades if t.get('week') == f'Week{week_number}']
-        
-        return week_trades
+        # Trades logged by this call
+        return self.trades[first_trade:]
     
     def get_current_portfolio_value(self):
         """Get the current total portfolio value including cash and positions.
@@ -387,97 +1081,137 @@ class WheelStrategy:
         total_value = self.capital
         
         # Add unrealized value of stock positions
-        for symbol, pos in self.positions.items():
-            if pos['shares'] > 0:
-                current_price = self.get_current_price(symbol)
-                total_value += (current_price - pos['cost_basis']) * pos['shares']
+        total_value += self._holdings_gain()
         
         return total_value
     
-    def _process_wheel_for_symbol(self, symbol):
-        """Process wheel strategy for a single symbol for current week.
+    def _current_price_row(self):
+        """Get this week's prices for all symbols, 0.0 where unknown.
         
-        Args:
-            symbol (str): ETF symbol to process
+        Returns:
+            np.ndarray: Current prices in symbol order (shared, do not modify)
         """
-        pos = self.positions[symbol]
-        current_price = self.get_current_price(symbol)
+        return self._week_price_rows()[0]
+    
+    def _week_price_rows(self):
+        """Get this week's and next week's prices for all symbols.
         
-        if pos['state'] == WheelState.CASH_SECURED_PUT:
-            self._handle_cash_secured_put(symbol, current_price)
-        elif pos['state'] == WheelState.HOLDING_SHARES:
-            self._handle_covered_call(symbol, current_price)
+        Symbols without a price for this week price at 0.0; without one for
+        next week, next week falls back to this week's price. The rows are
+        read once per week and cached until the week or the prices change.
+        
+        Returns:
+            tuple: (current_prices, next_week_prices) arrays in symbol order
+                (shared, do not modify)
+        """
+        week = self.current_week
+        if self._price_rows_week == week:
+            return self._price_rows
+        
+        current_prices = np.zeros(len(self.symbols))
+        if week < self.price_matrix.shape[1]:
+            current_prices = np.where(self.price_lengths > week, self.price_matrix[:, week], 0.0)
+        next_week_prices = current_prices
+        if week + 1 < self.price_matrix.shape[1]:
+            next_week_prices = np.where(self.price_lengths > week + 1,
+                                        self.price_matrix[:, week + 1], current_prices)
+        
+        self._price_rows = (current_prices, next_week_prices)
+        self._price_rows_week = week
+        return self._price_rows
     
-    def _handle_cash_secured_put(self, symbol, current_price):
-        """Handle cash-secured put logic.
+    def _process_week(self):
+        """Process the wheel for every symbol for the current week.
+        
+        Assignment and exercise of expiring options are decided for all
+        symbols at once by comparing next week's prices with the strikes, and
+        the strikes and premiums of new options are priced in one array pass.
+        Only symbols with an option to sell or settle are then handled one
+        by one, in symbol order so capital checks see earlier trades.
+        """
+        week = self.current_week
+        current_prices, next_week_prices = self._week_price_rows()
+        
+        in_csp = self._state == STATE_CSP
+        holding = self._state == STATE_HOLDING
+        has_option = ~np.isnan(self._strike)
+        expired = has_option & (in_csp | holding) & (week >= self._exp_week)
+        assigned = expired & in_csp & (next_week_prices < self._strike)
+        exercised = expired & holding & (next_week_prices > self._strike)
+        needs_option = ~has_option & (in_csp | holding)
+        
+        # Strikes and premiums of the options that would be sold this week
+        strike_pct = np.where(in_csp, self.put_strike_pct, self.call_strike_pct)
+        premium_pct = np.where(in_csp, self.put_premium_pct, self.call_premium_pct)
+        strikes = _round_cents_array(current_prices * strike_pct)
+        premiums = _round_cents_array(strikes * premium_pct)
+        strikes, premiums = strikes.tolist(), premiums.tolist()
+        
+        for i in np.flatnonzero(needs_option | expired).tolist():
+            if assigned[i]:
+                self._assign_put(i)
+            elif exercised[i]:
+                self._exercise_call(i)
+            elif expired[i]:
+                self._expire_option(i)
+            elif in_csp[i]:
+                self._sell_put(i, strikes[i], premiums[i])
+            else:
+                self._sell_call(i, strikes[i], premiums[i])
+    
+    def _sell_put(self, i, strike_price, premium):
+        """Sell a cash-secured put if there is enough capital to secure it.
         
         Args:
-            symbol (str): ETF symbol
-            current_price (float): Current price of the ETF
+            i (int): Symbol index
+            strike_price (float): Put strike, put_strike_pct of the current price
+            premium (float): Put premium, put_premium_pct of the strike
         """
-        pos = self.positions[symbol]
+        symbol = self.symbols[i]
+        
+        # Check if we have enough capital for cash-secured put
+        required_capital = strike_price * CONTRACT_SIZE
         
-        # If no current position, sell a new put
-        if pos['current_strike'] is None:
-            # Set strike price based on config (default 95% of current)
-            strike_price = round(current_price * self.put_strike_pct, 2)
-            premium = round(strike_price * self.put_premium_pct, 2)  # Premium from config
+        if self.available_capital >= required_capital:
+            # Sell the put
+            self._strike[i] = strike_price
+            self._exp_week[i] = self.current_week + 1
+            self._premium[i] += premium
+            self._reserved_capital += required_capital
             
-            # Check if we have enough capital for cash-secured put
-            required_capital = strike_price * 100  # 100 shares per contract
+            # Update capital with premium received
+            self.update_capital(premium, "Put premium collected")
+            self.total_premiums_collected += premium
             
-            if self.available_capital >= required_capital:
-                # Sell the put
-                pos['current_strike'] = strike_price
-                pos['expiration_date'] = self.current_week + 1
-                pos['option_premium_collected'] += premium
-                
-                # Update capital with premium received
-                self.update_capital(premium, "Put premium collected")
-                self.total_premiums_collected += premium
-                
-                # Log the put sale
-                self.log_trade({
-                    'symbol': symbol,
-                    'action': 'SELL_PUT',
-                    'quantity': 1,  # 1 contract
-                    'price': premium,
-                    'strike': strike_price,
-                    'total_value': premium,
-                    'notes': f'Sold put with strike ${strike_price}'
-                })
-                
-                logger.info(f"{symbol}: Sold put with strike ${strike_price}, premium ${premium}")
-        
-        # Check for assignment at expiration
-        elif self.current_week >= pos['expiration_date']:
-            next_week_price = self._get_next_week_price(symbol)
+            # Log the put sale
+            self.log_trade({
+                'symbol': symbol,
+                'action': 'SELL_PUT',
+                'quantity': 1,  # 1 contract
+                'price': premium,
+                'strike': strike_price,
+                'total_value': premium,
+                'notes': f'Sold put with strike ${strike_price}'
+            })
             
-            if next_week_price < pos['current_strike']:
-                # Put is assigned - buy shares
-                self._assign_put(symbol)
-            else:
-                # Put expires worthless - reset for next cycle
-                logger.info(f"{symbol}: Put expired worthless, keeping premium ${pos['option_premium_collected']}")
-                pos['current_strike'] = None
-                pos['expiration_date'] = None
+            self._log("%s: Sold put with strike $%s, premium $%s", symbol, strike_price, premium)
     
-    def _assign_put(self, symbol):
+    def _assign_put(self, i):
         """Handle put assignment - buy shares at strike price.
         
         Args:
-            symbol (str): ETF symbol
+            i (int): Symbol index
         """
-        pos = self.positions[symbol]
-        strike_price = pos['current_strike']
-        cost = strike_price * 100  # 100 shares
+        symbol = self.symbols[i]
+        strike_price = float(self._strike[i])
+        cost = strike_price * CONTRACT_SIZE
         
-        # Buy the shares
-        pos['shares'] = 100
-        pos['cost_basis'] = strike_price
-        pos['state'] = WheelState.HOLDING_SHARES
-        pos['current_strike'] = None
-        pos['expiration_date'] = None
+        # Buy the shares; the put's reserved capital now backs the shares
+        self._shares[i] = CONTRACT_SIZE
+        self._cost_basis[i] = strike_price
+        self._state[i] = STATE_HOLDING
+        self._strike[i] = np.nan
+        self._exp_week[i] = -1
         
         # Update capital - subtract share cost
         self.update_capital(-cost, "Share purchase (put assignment)")
@@ -486,78 +1220,60 @@ class WheelStrategy:
         self.log_trade({
             'symbol': symbol,
             'action': 'BUY_SHARES',
-            'quantity': 100,
+            'quantity': CONTRACT_SIZE,
             'price': strike_price,
             'total_value': -cost,  # Negative for cash outflow
             'notes': f'Put assigned, bought 100 shares at ${strike_price}'
         })
         
-        logger.info(f"{symbol}: Put assigned! Bought 100 shares at ${strike_price}")
+        self._log("%s: Put assigned! Bought 100 shares at $%s", symbol, strike_price)
     
-    def _handle_covered_call(self, symbol, current_price):
-        """Handle covered call logic.
+    def _sell_call(self, i, strike_price, premium):
+        """Sell a covered call on held shares.
         
         Args:
-            symbol (str): ETF symbol
-            current_price (float): Current price of the ETF
+            i (int): Symbol index
+            strike_price (float): Call strike, call_strike_pct of the current price
+            premium (float): Call premium, call_premium_pct of the strike
         """
-        pos = self.positions[symbol]
+        symbol = self.symbols[i]
         
-        # If no current call position, sell a new call
-        if pos['current_strike'] is None:
-            # Set strike price based on config (default 105% of current)
-            strike_price = round(current_price * self.call_strike_pct, 2)
-            premium = round(strike_price * self.call_premium_pct, 2)  # Premium from config
-            
-            # Sell the call
-            pos['current_strike'] = strike_price
-            pos['expiration_date'] = self.current_week + 1
-            pos['option_premium_collected'] += premium
-            
-            # Update capital with premium received
-            self.update_capital(premium, "Call premium collected")
-            self.total_premiums_collected += premium
-            
-            # Log the call sale
-            self.log_trade({
-                'symbol': symbol,
-                'action': 'SELL_CALL',
-                'quantity': 1,  # 1 contract
-                'price': premium,
-                'strike': strike_price,
-                'total_value': premium,
-                'notes': f'Sold call with strike ${strike_price}'
-            })
-            
-            logger.info(f"{symbol}: Sold call with strike ${strike_price}, premium ${premium}")
+        # Sell the call
+        self._strike[i] = strike_price
+        self._exp_week[i] = self.current_week + 1
+        self._premium[i] += premium
         
-        # Check for exercise at expiration
-        elif self.current_week >= pos['expiration_date']:
-            next_week_price = self._get_next_week_price(symbol)
-            
-            if next_week_price > pos['current_strike']:
-                # Call is exercised - sell shares
-                self._exercise_call(symbol)
-            else:
-                # Call expires worthless - reset for next cycle
-                logger.info(f"{symbol}: Call expired worthless, keeping premium")
-                pos['current_strike'] = None
-                pos['expiration_date'] = None
+        # Update capital with premium received
+        self.update_capital(premium, "Call premium collected")
+        self.total_premiums_collected += premium
+        
+        # Log the call sale
+        self.log_trade({
+            'symbol': symbol,
+            'action': 'SELL_CALL',
+            'quantity': 1,  # 1 contract
+            'price': premium,
+            'strike': strike_price,
+            'total_value': premium,
+            'notes': f'Sold call with strike ${strike_price}'
+        })
+        
+        self._log("%s: Sold call with strike $%s, premium $%s", symbol, strike_price, premium)
     
-    def _exercise_call(self, symbol):
+    def _exercise_call(self, i):
         """Handle call exercise - sell shares at strike price.
         
         Args:
-            symbol (str): ETF symbol
+            i (int): Symbol index
         """
-        pos = self.positions[symbol]
-        strike_price = pos['current_strike']
-        proceeds = strike_price * 100  # 100 shares
+        symbol = self.symbols[i]
+        strike_price = float(self._strike[i])
+        proceeds = strike_price * CONTRACT_SIZE
         
         # Calculate profit/loss
-        total_cost = pos['cost_basis'] * 100
+        total_cost = float(self._cost_basis[i]) * CONTRACT_SIZE
         capital_gain = proceeds - total_cost
-        total_premiums = pos['option_premium_collected']
+        total_premiums = float(self._premium[i])
         
         # Update capital - add proceeds from share sale
         self.update_capital(proceeds, "Share sale (call exercise)")
@@ -566,42 +1282,45 @@ class WheelStrategy:
         self.realized_gains += capital_gain
         
         # Sell the shares
-        pos['shares'] = 0
-        pos['cost_basis'] = 0.0
-        pos['state'] = WheelState.CASH_SECURED_PUT  # Reset to CSP state
-        pos['current_strike'] = None
-        pos['expiration_date'] = None
+        self._reserved_capital -= total_cost
+        self._shares[i] = 0
+        self._cost_basis[i] = 0.0
+        self._state[i] = STATE_CSP  # Reset to CSP state
+        self._strike[i] = np.nan
+        self._exp_week[i] = -1
         
         # Log the share sale
         self.log_trade({
             'symbol': symbol,
             'action': 'SELL_SHARES',
-            'quantity': 100,
+            'quantity': CONTRACT_SIZE,
             'price': strike_price,
             'total_value': proceeds,
             'notes': f'Call exercised, sold 100 shares at ${strike_price}. Capital gain: ${capital_gain:.2f}, Total premiums: ${total_premiums:.2f}'
         })
         
-        logger.info(f"{symbol}: Call exercised! Sold 100 shares at ${strike_price}")
-        logger.info(f"  Capital gain: ${capital_gain:.2f}, Total premiums: ${total_premiums:.2f}")
+        self._log("%s: Call exercised! Sold 100 shares at $%s", symbol, strike_price)
+        self._log("  Capital gain: $%.2f, Total premiums: $%.2f", capital_gain, total_premiums)
         
         # Reset premium tracking for next wheel cycle
-        pos['option_premium_collected'] = 0.0
+        self._premium[i] = 0.0
     
-    def _get_next_week_price(self, symbol):
-        """Get next week's price for assignment/exercise checking.
+    def _expire_option(self, i):
+        """Let an option expire worthless, keeping its premium.
         
         Args:
-            symbol (str): ETF symbol
-            
-        Returns:
-            float: Next week's price
+            i (int): Symbol index
         """
-        next_week = self.current_week + 1
-        if symbol in self.prices and next_week < len(self.prices[symbol]):
-            return self.prices[symbol][next_week]
-        return self.get_current_price(symbol)  # Fallback to current price
+        if self._state[i] == STATE_CSP:
+            self._log("%s: Put expired worthless, keeping premium $%s", self.symbols[i], float(self._premium[i]))
+            self._reserved_capital -= float(self._strike[i]) * CONTRACT_SIZE
+        else:
+            self._log("%s: Call expired worthless, keeping premium", self.symbols[i])
         
+        # Reset for next cycle
+        self._strike[i] = np.nan
+        self._exp_week[i] = -1
+    
     def log_trade(self, trade_data):
         """Log a trade to the trades list with standardized format.
         
@@ -619,10 +1338,35 @@ class WheelStrategy:
             'strike': trade_data.get('strike', ''),
             'cash_flow': trade_data.get('total_value', 0.0),
             'notes': trade_data.get('notes', ''),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self._run_timestamp
         }
         
         self.trades.append(trade_record)
+        
+        self._reserve_trade_capacity(1)
+        self._trade_array[self._trade_count] = (
+            self.current_week,
+            _TRADE_ACTION_CODES.get(trade_record['action'], 0),
+            self.symbol_index.get(trade_record['symbol'], -1),
+            trade_record['quantity'],
+            trade_record['price'],
+            trade_record['strike'] if trade_record['strike'] != '' else np.nan,
+            trade_record['cash_flow'],
+        )
+        self._trade_count += 1
+    
+    def _reserve_trade_capacity(self, extra):
+        """Grow the trade array, at least doubling it, to fit ``extra`` more trades."""
+        needed = self._trade_count + extra
+        if needed > len(self._trade_array):
+            self._trade_array = np.resize(self._trade_array, max(needed, 2 * len(self._trade_array)))
+    
+    def get_trade_array(self) -> np.ndarray:
+        """Get the trades as a structured array with ``TRADE_DTYPE`` fields.
+        
+        Cheaper than the trade dicts for numeric analysis in parameter sweeps.
+        """
+        return self._trade_array[:self._trade_count]
     
     def export_trades_to_csv(self, filename='trades.csv'):
         """Export trades to CSV file.
@@ -634,41 +1378,83 @@ class WheelStrategy:
             logger.info("No trades to export.")
             return
         
-        fieldnames = ['week', 'strategy', 'symbol', 'action', 'quantity', 'price', 'strike', 'cash_flow', 'notes', 'timestamp']
+        # Imported here; only runs that export pay for the csv module
+        import csv
         
-        with open(filename, 'w', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.trades)
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(TRADE_FIELDNAMES)
+            # Pre-ordered row tuples avoid DictWriter's per-row dict lookups
+            writer.writerows(map(itemgetter(*TRADE_FIELDNAMES), self.trades))
         
-        logger.info(f"Exported {len(self.trades)} trades to {filename}")
+        logger.info("Exported %d trades to %s", len(self.trades), filename)
     
     def print_trades_summary(self):
         """Print a summary of all trades."""
+        if not self._log_enabled():
+            return
+        
         if not self.trades:
-            logger.info("No trades recorded.")
+            self._log("No trades recorded.")
             return
         
-        logger.info(f"=== TRADES SUMMARY ({len(self.trades)} trades) ===")
+        self._log("=== TRADES SUMMARY (%d trades) ===", len(self.trades))
         for trade in self.trades:
             cash_flow_str = f"${trade['cash_flow']:+.2f}" if trade['cash_flow'] != 0 else ""
             strike_str = f" @ ${trade['strike']}" if trade['strike'] else ""
-            logger.info(f"{trade['week']}: {trade['action']} {trade['quantity']} {trade['symbol']}{strike_str} - {cash_flow_str}")
+            self._log("%s: %s %s %s%s - %s", trade['week'], trade['action'], trade['quantity'],
+                      trade['symbol'], strike_str, cash_flow_str)
             if trade['notes']:
-                logger.info(f"    Note: {trade['notes']}")
+                self._log("    Note: %s", trade['notes'])
         
         # Summary by action type
-        actions = {}
-        total_cash_flow = 0
-        for trade in self.trades:
-            action = trade['action']
-            actions[action] = actions.get(action, 0) + 1
-            total_cash_flow += trade['cash_flow']
+        actions = Counter(trade['action'] for trade in self.trades)
+        total_cash_flow = math.fsum(trade['cash_flow'] for trade in self.trades)
         
-        logger.info("ACTION SUMMARY:")
+        self._log("ACTION SUMMARY:")
         for action, count in actions.items():
-            logger.info(f"  {action}: {count}")
-        logger.info(f"Net Cash Flow: ${total_cash_flow:.2f}")
+            self._log("  %s: %d", action, count)
+        self._log("Net Cash Flow: $%.2f", total_cash_flow)
+
+
+def run_wheel(params: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """Simulate one wheel configuration numerically.
+    
+    Module-level so it can be shipped to worker processes by ``sweep_wheel``.
+    
+    Args:
+        params (dict): ``WheelStrategy`` keyword arguments (capital, symbols,
+            config), plus an optional ``num_weeks``
+            
+    Returns:
+        tuple: (trade_log, account) arrays, see ``WheelStrategy.simulate``
+    """
+    params = dict(params)
+    num_weeks = params.pop('num_weeks', None)
+    return WheelStrategy(**params).simulate(num_weeks)
+
+
+def sweep_wheel(param_sets: List[Dict], max_workers: Optional[int] = None) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Simulate many independent wheel configurations in parallel.
+    
+    Each configuration runs in its own process, so sweeps over strike/premium
+    grids scale with the number of CPU cores. Uses ``simulate`` rather than
+    ``run`` so workers neither log every trade nor write trades.csv.
+    
+    Workers are spawned rather than forked: numba's parallel threading layer
+    (used by ``simulate_paths``) is not fork-safe, and a forked child of a
+    process that already ran it can hang.
+    
+    Args:
+        param_sets (list): One ``run_wheel`` params dict per configuration
+        max_workers (int): Worker processes; None uses one per CPU
+        
+    Returns:
+        list: ``run_wheel`` results, in the order of ``param_sets``
+    """
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(run_wheel, param_sets))
 
 
 if __name__ == "__main__":
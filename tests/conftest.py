@@ -5,22 +5,26 @@ This module provides common fixtures and test utilities used across
 unit and integration tests.
 """
 
-import os
+import itertools
 import sqlite3
-import tempfile
 import pytest
+import pytest_asyncio
+import pytest_asyncio.plugin
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+from unittest.mock import Mock
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-@pytest.fixture
-def temp_db():
-    """Create a temporary SQLite database for testing."""
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-        db_path = f.name
-    
-    # Initialize database
-    conn = sqlite3.connect(db_path)
+
+@pytest.fixture(scope="session")
+def db_template():
+    """Build the test database schema once, in memory."""
+    conn = sqlite3.connect(':memory:')
     conn.execute('''
         CREATE TABLE IF NOT EXISTS trades (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -44,60 +48,111 @@ def temp_db():
             source TEXT
         )
     ''')
-    conn.close()
+    conn.commit()
     
-    yield db_path
+    yield conn
     
-    # Cleanup
-    os.unlink(db_path)
+    conn.close()
 
 
 @pytest.fixture
-def sample_config() -> Dict[str, Any]:
-    """Provide a sample configuration for testing."""
-    return {
-        'initial_capital': 100000,
-        'data_mode': 'mock',
-        'strategies': {
-            'wheel': True,
-            'rotator': True
-        },
-        'allocation': {
-            'wheel': 0.5,
-            'rotator': 0.5
-        },
-        'wheel_symbols': ['SPY', 'QQQ', 'IWM'],
-        'rotator_symbols': ['BTC', 'ETH', 'SOL'],
-        'simulation': {
-            'weeks_to_simulate': 4,
-            'enable_deterministic_mode': True
-        }
+def temp_db(db_template, tmp_path):
+    """Create a temporary SQLite database for testing.
+    
+    The schema is copied page-by-page from the in-memory template rather
+    than rebuilt, with syncing off since the file is thrown away.
+    """
+    db_path = str(tmp_path / "test.db")
+    
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA synchronous=OFF')
+    db_template.backup(conn)
+    conn.close()
+    
+    return db_path
+
+
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """Inverse of _freeze, for serializers that only accept dicts and lists."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+SAMPLE_CONFIG: Mapping[str, Any] = _freeze({
+    'initial_capital': 100000,
+    'data_mode': 'mock',
+    'strategies': {
+        'wheel': True,
+        'rotator': True
+    },
+    'allocation': {
+        'wheel': 0.5,
+        'rotator': 0.5
+    },
+    'wheel_symbols': ['SPY', 'QQQ', 'IWM'],
+    'rotator_symbols': ['BTC', 'ETH', 'SOL'],
+    'simulation': {
+        'weeks_to_simulate': 4,
+        'enable_deterministic_mode': True
     }
+})
 
 
-@pytest.fixture
-def temp_config_file(sample_config, tmp_path):
-    """Create a temporary YAML config file."""
+@pytest.fixture(scope="session")
+def sample_config() -> Mapping[str, Any]:
+    """Provide a read-only sample configuration for testing.
+    
+    Nested sections are read-only too and symbol lists are tuples, so the
+    session-wide instance cannot be changed by one test.
+    """
+    return SAMPLE_CONFIG
+
+
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory):
+    """Create a temporary YAML config file of SAMPLE_CONFIG.
+    
+    The file is written once per session and shared, so tests must not
+    modify it.
+    """
     import yaml
     
-    config_file = tmp_path / "test_config.yaml"
+    # libyaml's C dumper when available, pure Python otherwise
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    
+    config_file = tmp_path_factory.mktemp("config") / "test_config.yaml"
     with open(config_file, 'w') as f:
-        yaml.dump(sample_config, f)
+        yaml.dump(_thaw(SAMPLE_CONFIG), f, Dumper=dumper)
     
     return str(config_file)
 
 
-@pytest.fixture
-def mock_price_data():
-    """Provide mock price data for testing."""
-    return {
-        'SPY': [450.0, 452.0, 448.0, 455.0, 453.0],
-        'QQQ': [380.0, 382.0, 378.0, 385.0, 383.0],
-        'IWM': [200.0, 202.0, 198.0, 205.0, 203.0],
-        'BTC': [50000.0, 51000.0, 49000.0, 52000.0, 51500.0],
-        'ETH': [3000.0, 3100.0, 2900.0, 3200.0, 3150.0],
-        'SOL': [100.0, 105.0, 95.0, 110.0, 108.0]
-    }
+MOCK_PRICE_DATA: Mapping[str, Tuple[float, ...]] = MappingProxyType({
+    'SPY': (450.0, 452.0, 448.0, 455.0, 453.0),
+    'QQQ': (380.0, 382.0, 378.0, 385.0, 383.0),
+    'IWM': (200.0, 202.0, 198.0, 205.0, 203.0),
+    'BTC': (50000.0, 51000.0, 49000.0, 52000.0, 51500.0),
+    'ETH': (3000.0, 3100.0, 2900.0, 3200.0, 3150.0),
+    'SOL': (100.0, 105.0, 95.0, 110.0, 108.0)
+})
+
+
+@pytest.fixture(scope="session")
+def mock_price_data() -> Mapping[str, Tuple[float, ...]]:
+    """Provide read-only mock price data for testing."""
+    return MOCK_PRICE_DATA
 
 
 @pytest.fixture
@@ -115,15 +170,14 @@ class MockPriceFetcher:
     def __init__(self, mock_data):
         self.mock_data = mock_data
         self.call_count = 0
+        # Each symbol steps through its own series, wrapping at the end
+        self._cycles = {symbol: itertools.cycle(prices) for symbol, prices in mock_data.items()}
+        self._default_cycle = itertools.repeat(100.0)  # Default price
     
     def get_price(self, symbol: str) -> float:
-        """Get mock price for symbol."""
+        """Get the next mock price in the symbol's time series."""
         self.call_count += 1
-        if symbol in self.mock_data:
-            # Return different prices based on call count for time series
-            prices = self.mock_data[symbol]
-            return prices[self.call_count % len(prices)]
-        return 100.0  # Default price
+        return next(self._cycles.get(symbol, self._default_cycle))
     
     async def get_price_async(self, symbol: str) -> float:
         """Async version of get_price."""
@@ -136,6 +190,59 @@ def mock_price_fetcher(mock_price_data):
     return MockPriceFetcher(mock_price_data)
 
 
+@pytest.fixture(scope="module")
+def mock_response_factory():
+    """Provide a factory of prepared mock HTTP responses.
+    
+    Responses are cached by their arguments and shared across a module's
+    tests, so callers must not reconfigure the returned mock.
+    """
+    cache = {}
+    
+    def make(status=200, json_data=None, json_exc=None, raise_exc=None):
+        key = (status, repr(json_data), repr(json_exc), repr(raise_exc))
+        if key not in cache:
+            response = Mock()
+            response.status_code = status
+            if json_exc is not None:
+                response.json.side_effect = json_exc
+            else:
+                response.json.return_value = json_data
+            response.raise_for_status = Mock(side_effect=raise_exc)
+            cache[key] = response
+        return cache[key]
+    
+    return make
+
+
+# Run async tests on uvloop when it is installed. Newer pytest-asyncio picks
+# loops through the pytest_asyncio_loop_factories hook and deprecates
+# overriding event_loop_policy; older versions only support the override.
+if uvloop is not None and hasattr(pytest_asyncio.plugin, 'PytestAsyncioSpecs'):
+    def pytest_asyncio_loop_factories(config, item):
+        """Create event loops with uvloop."""
+        return {'uvloop': uvloop.new_event_loop}
+elif uvloop is not None:
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Create event loops with uvloop."""
+        return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_fetcher():
+    """Provide one open AsyncPriceFetcher shared by a test module."""
+    from data.async_price_fetcher import AsyncPriceFetcher
+
+    async with AsyncPriceFetcher(
+        cache_dir="tests/temp_cache",
+        crypto_rate_limit=10,
+        etf_rate_limit=5,
+        timeout=30.0
+    ) as fetcher:
+        yield fetcher
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Configure pytest with custom markers."""
@@ -147,4 +254,9 @@ def pytest_configure(config):
     )
     config.addinivalue_line(
         "markers", "slow: mark test as slow-running"
+    )
+    # Registered by pytest-timeout when installed; declared here so the
+    # mark is still known (and a no-op) without it
+    config.addinivalue_line(
+        "markers", "timeout(seconds): fail the test if it runs longer than seconds"
     )
\ No newline at end of file
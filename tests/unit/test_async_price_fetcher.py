@@ -15,8 +15,8 @@ import pytest
 import asyncio
 import json
 import httpx
-import pandas as pd
-from unittest.mock import Mock, patch, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock, patch, AsyncMock
 from datetime import datetime, timezone
 
 from data.async_price_fetcher import (
@@ -29,22 +29,13 @@ from data.async_price_fetcher import (
 )
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestAsyncPriceFetcher:
-    """Test suite for AsyncPriceFetcher class."""
+    """Test suite for AsyncPriceFetcher class.
 
-    def setup_method(self):
-        """Set up test fixtures for each test method."""
-        self.fetcher = AsyncPriceFetcher(
-            cache_dir="tests/temp_cache",
-            crypto_rate_limit=10,
-            etf_rate_limit=5,
-            timeout=30.0
-        )
-
-    def teardown_method(self):
-        """Clean up after each test."""
-        # Clean up will be handled by test context managers
+    Tests share one open fetcher (see ``shared_fetcher`` in conftest) and run
+    on the module's event loop, so the HTTP client is built only once.
+    """
 
     async def test_context_manager(self):
         """Test async context manager functionality."""
@@ -54,43 +45,51 @@ class TestAsyncPriceFetcher:
             await fetcher._ensure_client()
             assert isinstance(fetcher._client, httpx.AsyncClient)
 
-    async def test_client_initialization(self):
+    async def test_nested_context_manager(self, shared_fetcher):
+        """Test re-entering an open fetcher keeps its client open."""
+        client = shared_fetcher._client
+
+        async with shared_fetcher:
+            assert shared_fetcher._client is client
+
+        assert shared_fetcher._client is client
+
+    async def test_client_initialization(self, shared_fetcher):
         """Test HTTP client initialization with proper config."""
-        await self.fetcher._ensure_client()
+        await shared_fetcher._ensure_client()
         
-        assert self.fetcher._client is not None
-        assert isinstance(self.fetcher._client, httpx.AsyncClient)
+        assert shared_fetcher._client is not None
+        assert isinstance(shared_fetcher._client, httpx.AsyncClient)
         
         # Check that client was initialized (limits are internal implementation)
-        assert self.fetcher._client.timeout.read == 30.0
+        assert shared_fetcher._client.timeout.read == 30.0
+        assert shared_fetcher._client.timeout.connect == 3.0
 
     async def test_client_cleanup(self):
         """Test proper cleanup of HTTP client."""
-        await self.fetcher._ensure_client()
-        assert self.fetcher._client is not None
+        # Uses its own fetcher so the shared client stays open
+        fetcher = AsyncPriceFetcher(cache_dir="tests/temp_cache")
+        await fetcher._ensure_client()
+        assert fetcher._client is not None
         
-        await self.fetcher.close()
-        assert self.fetcher._client is None
+        await fetcher.close()
+        assert fetcher._client is None
 
     @patch('httpx.AsyncClient.get')
-    async def test_get_crypto_price_success(self, mock_get):
+    async def test_get_crypto_price_success(self, mock_get, shared_fetcher, mock_response_factory):
         """Test successful crypto price fetching."""
         # Mock successful CoinGecko response
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = mock_response_factory(json_data={
             'bitcoin': {'usd': 50000.0}
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        })
 
-        async with self.fetcher:
-            price = await self.fetcher.get_crypto_price_async('bitcoin', 'usd')
+        price = await shared_fetcher.get_crypto_price_async('bitcoin', 'usd')
             
         assert price == 50000.0
         mock_get.assert_called_once()
 
     @patch('httpx.AsyncClient.get')
-    async def test_get_crypto_price_failure(self, mock_get):
+    async def test_get_crypto_price_failure(self, mock_get, shared_fetcher):
         """Test crypto price fetching with API failure."""
         # Mock API failure
         mock_get.side_effect = httpx.HTTPStatusError(
@@ -99,24 +98,23 @@ class TestAsyncPriceFetcher:
             response=Mock(status_code=429)
         )
 
-        async with self.fetcher:
-            price = await self.fetcher.get_crypto_price_async('bitcoin', 'usd')
+        price = await shared_fetcher.get_crypto_price_async('bitcoin', 'usd')
             
         assert price is None
 
     @patch('asyncio.to_thread')
-    async def test_get_etf_price_success(self, mock_to_thread):
+    async def test_get_etf_price_success(self, mock_to_thread, shared_fetcher):
         """Test successful ETF price fetching using yfinance."""
-        # Mock yfinance data structure
-        mock_hist = pd.DataFrame({'Close': [450.0, 452.0, 448.0]})
+        # Mock the parts of the history DataFrame the fetcher reads
+        mock_hist = MagicMock(empty=False)
+        mock_hist.__getitem__.return_value = SimpleNamespace(iloc=[450.0, 452.0, 448.0])
         
         mock_ticker = Mock()
         
         # Mock the two asyncio.to_thread calls
         mock_to_thread.side_effect = [mock_ticker, mock_hist]
 
-        async with self.fetcher:
-            price = await self.fetcher.get_etf_price_async('SPY')
+        price = await shared_fetcher.get_etf_price_async('SPY')
             
         assert price == 448.0  # Last price in mock data
         # Called for: Ticker creation, history call, and database logging
@@ -124,28 +122,26 @@ class TestAsyncPriceFetcher:
 
     @patch('asyncio.to_thread')
     @patch.object(AsyncPriceFetcher, '_get_alpha_vantage_price')
-    async def test_get_etf_price_failure(self, mock_alpha_vantage, mock_to_thread):
+    async def test_get_etf_price_failure(self, mock_alpha_vantage, mock_to_thread, shared_fetcher):
         """Test ETF price fetching with yfinance failure."""
         # Mock yfinance failure
         mock_to_thread.side_effect = Exception("No data found")
         # Mock Alpha Vantage fallback failure
         mock_alpha_vantage.return_value = None
 
-        async with self.fetcher:
-            price = await self.fetcher.get_etf_price_async('SPY')
+        price = await shared_fetcher.get_etf_price_async('SPY')
             
         assert price is None
 
-    async def test_get_multiple_crypto_prices(self):
+    async def test_get_multiple_crypto_prices(self, shared_fetcher):
         """Test concurrent fetching of multiple crypto prices."""
         crypto_ids = ['bitcoin', 'ethereum', 'solana']
         
-        with patch.object(self.fetcher, 'get_crypto_price_async') as mock_get_price:
+        with patch.object(shared_fetcher, 'get_crypto_price_async') as mock_get_price:
             # Mock different prices for each crypto
             mock_get_price.side_effect = [50000.0, 3000.0, 100.0]
             
-            async with self.fetcher:
-                prices = await self.fetcher.get_multiple_crypto_prices_async(crypto_ids)
+            prices = await shared_fetcher.get_multiple_crypto_prices_async(crypto_ids)
             
         assert len(prices) == 3
         assert prices['bitcoin'] == 50000.0
@@ -153,32 +149,30 @@ class TestAsyncPriceFetcher:
         assert prices['solana'] == 100.0
         assert mock_get_price.call_count == 3
 
-    async def test_get_multiple_crypto_prices_with_errors(self):
+    async def test_get_multiple_crypto_prices_with_errors(self, shared_fetcher):
         """Test concurrent fetching with some errors."""
         crypto_ids = ['bitcoin', 'ethereum', 'invalid_coin']
         
-        with patch.object(self.fetcher, 'get_crypto_price_async') as mock_get_price:
+        with patch.object(shared_fetcher, 'get_crypto_price_async') as mock_get_price:
             # Mock success, success, failure
             mock_get_price.side_effect = [50000.0, 3000.0, Exception("Invalid coin")]
             
-            async with self.fetcher:
-                prices = await self.fetcher.get_multiple_crypto_prices_async(crypto_ids)
+            prices = await shared_fetcher.get_multiple_crypto_prices_async(crypto_ids)
             
         assert len(prices) == 3
         assert prices['bitcoin'] == 50000.0
         assert prices['ethereum'] == 3000.0
         assert prices['invalid_coin'] is None
 
-    async def test_get_multiple_etf_prices(self):
+    async def test_get_multiple_etf_prices(self, shared_fetcher):
         """Test concurrent fetching of multiple ETF prices."""
         symbols = ['SPY', 'QQQ', 'IWM']
         
-        with patch.object(self.fetcher, 'get_etf_price_async') as mock_get_price:
+        with patch.object(shared_fetcher, 'get_etf_price_async') as mock_get_price:
             # Mock different prices for each ETF
             mock_get_price.side_effect = [450.0, 380.0, 200.0]
             
-            async with self.fetcher:
-                prices = await self.fetcher.get_multiple_etf_prices_async(symbols)
+            prices = await shared_fetcher.get_multiple_etf_prices_async(symbols)
             
         assert len(prices) == 3
         assert prices['SPY'] == 450.0
@@ -186,11 +180,11 @@ class TestAsyncPriceFetcher:
         assert prices['IWM'] == 200.0
 
     @patch('asyncio.to_thread')
-    async def test_log_price_async(self, mock_to_thread):
+    async def test_log_price_async(self, mock_to_thread, shared_fetcher):
         """Test async price logging to database."""
         mock_to_thread.return_value = None  # log_price_to_db returns None
         
-        await self.fetcher._log_price_async('SPY', 450.0, 'test')
+        await shared_fetcher._log_price_async('SPY', 450.0, 'test')
         
         mock_to_thread.assert_called_once()
         args, kwargs = mock_to_thread.call_args
@@ -198,113 +192,136 @@ class TestAsyncPriceFetcher:
         assert kwargs['price'] == 450.0
         assert kwargs['source'] == 'test'
 
-    async def test_rate_limiting_semaphores(self):
+    async def test_rate_limiting_semaphores(self, shared_fetcher):
         """Test that rate limiting semaphores are respected."""
         # Test crypto semaphore
-        assert self.fetcher._crypto_semaphore._value == 10
+        assert shared_fetcher._crypto_semaphore._value == 10
         
         # Test ETF semaphore  
-        assert self.fetcher._etf_semaphore._value == 5
+        assert shared_fetcher._etf_semaphore._value == 5
         
         # Test acquiring semaphore
-        async with self.fetcher._crypto_semaphore:
-            assert self.fetcher._crypto_semaphore._value == 9
+        async with shared_fetcher._crypto_semaphore:
+            assert shared_fetcher._crypto_semaphore._value == 9
 
     @patch('httpx.AsyncClient.get')
-    async def test_health_check_coingecko_success(self, mock_get):
+    async def test_health_check_coingecko_success(self, mock_get, shared_fetcher, mock_response_factory):
         """Test health check for CoinGecko API."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        mock_get.return_value = mock_response_factory(status=200)
 
-        async with self.fetcher:
-            health = await self.fetcher.health_check_async()
+        health = await shared_fetcher.health_check_async()
             
         assert 'coingecko' in health
         assert health['coingecko'] == '✅ Working'
 
     @patch('httpx.AsyncClient.get')
-    async def test_health_check_coingecko_failure(self, mock_get):
+    async def test_health_check_coingecko_failure(self, mock_get, shared_fetcher):
         """Test health check with CoinGecko API failure."""
         mock_get.side_effect = Exception("Connection failed")
 
-        async with self.fetcher:
-            health = await self.fetcher.health_check_async()
+        health = await shared_fetcher.health_check_async()
             
         assert 'coingecko' in health
         assert 'Error' in health['coingecko']
 
     @patch('httpx.AsyncClient.get')
-    async def test_health_check_alpha_vantage(self, mock_get):
+    async def test_health_check_alpha_vantage(self, mock_get, shared_fetcher, monkeypatch,
+                                              mock_response_factory):
         """Test health check for Alpha Vantage API."""
         # Set API key for testing
-        self.fetcher.alpha_vantage_api_key = "test_key"
+        monkeypatch.setattr(shared_fetcher, 'alpha_vantage_api_key', "test_key")
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+        mock_get.return_value = mock_response_factory(status=200)
 
-        async with self.fetcher:
-            health = await self.fetcher.health_check_async()
+        health = await shared_fetcher.health_check_async()
             
         assert 'alpha_vantage' in health
         assert health['alpha_vantage'] == '✅ Working'
 
     @patch('asyncio.to_thread')
-    async def test_health_check_yfinance(self, mock_to_thread):
+    async def test_health_check_yfinance(self, mock_to_thread, shared_fetcher):
         """Test health check for yfinance."""
         # Mock successful yfinance call
         mock_hist = Mock()
         mock_hist.empty = False
         mock_to_thread.side_effect = [Mock(), mock_hist]  # Ticker, then history
 
-        async with self.fetcher:
-            health = await self.fetcher.health_check_async()
+        health = await shared_fetcher.health_check_async()
             
         assert 'yfinance' in health
         assert health['yfinance'] == '✅ Working'
 
+    async def test_health_check_probes_concurrently(self, shared_fetcher):
+        """Test health check probes all sources at once."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def probe():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)  # Yield so the other probes can start
+            in_flight -= 1
+            return '✅ Working'
+
+        with patch.object(shared_fetcher, '_check_coingecko', side_effect=probe), \
+             patch.object(shared_fetcher, '_check_alpha_vantage', side_effect=probe), \
+             patch.object(shared_fetcher, '_check_yfinance', side_effect=probe):
+            health = await shared_fetcher.health_check_async()
+
+        assert max_in_flight == 3  # All probes were in flight together
+        assert list(health) == ['coingecko', 'alpha_vantage', 'yfinance']
+
+    async def test_health_check_isolates_probe_errors(self, shared_fetcher):
+        """Test an unexpected probe error does not hide the other results."""
+        with patch.object(shared_fetcher, '_check_coingecko', side_effect=RuntimeError("boom")), \
+             patch.object(shared_fetcher, '_check_alpha_vantage', return_value='✅ Working'), \
+             patch.object(shared_fetcher, '_check_yfinance', return_value='✅ Working'):
+            health = await shared_fetcher.health_check_async()
+
+        assert health['coingecko'] == '❌ Error: boom'
+        assert health['alpha_vantage'] == '✅ Working'
+        assert health['yfinance'] == '✅ Working'
+
     @patch('httpx.AsyncClient.get')
-    async def test_alpha_vantage_fallback(self, mock_get):
+    async def test_alpha_vantage_fallback(self, mock_get, shared_fetcher, monkeypatch,
+                                          mock_response_factory):
         """Test Alpha Vantage fallback functionality."""
-        self.fetcher.alpha_vantage_api_key = "test_key"
+        monkeypatch.setattr(shared_fetcher, 'alpha_vantage_api_key', "test_key")
         
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_get.return_value = mock_response_factory(json_data={
             'Global Quote': {
                 '05. price': '450.50'
             }
-        }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        })
 
-        async with self.fetcher:
-            price = await self.fetcher._get_alpha_vantage_price('SPY')
+        price = await shared_fetcher._get_alpha_vantage_price('SPY')
             
         assert price == 450.50
 
-    async def test_concurrent_operations_performance(self):
+    async def test_concurrent_operations_performance(self, shared_fetcher):
         """Test performance of concurrent operations."""
         crypto_ids = ['bitcoin', 'ethereum', 'litecoin']
         
-        with patch.object(self.fetcher, 'get_crypto_price_async') as mock_get_price:
-            # Mock async delay to simulate real API calls
+        in_flight = 0
+        max_in_flight = 0
+        
+        with patch.object(shared_fetcher, 'get_crypto_price_async') as mock_get_price:
+            # Track overlapping calls instead of sleeping through real delays
             async def mock_fetch(crypto_id, vs_currency='usd'):
-                await asyncio.sleep(0.1)  # Simulate network delay
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0)  # Yield as a network call would
+                in_flight -= 1
                 return 1000.0
             
             mock_get_price.side_effect = mock_fetch
             
-            start_time = asyncio.get_event_loop().time()
-            
-            async with self.fetcher:
-                prices = await self.fetcher.get_multiple_crypto_prices_async(crypto_ids)
-            
-            end_time = asyncio.get_event_loop().time()
-            duration = end_time - start_time
+            prices = await shared_fetcher.get_multiple_crypto_prices_async(crypto_ids)
             
-        # Concurrent execution should be faster than sequential
-        assert duration < 0.25  # Should be close to 0.1s, not 0.3s
+        # Concurrent execution overlaps every fetch; sequential would peak at 1
+        assert max_in_flight == 3
         assert len(prices) == 3
 
 
@@ -324,9 +341,6 @@ class TestAsyncPriceFetcherWrapper:
     @patch.object(AsyncPriceFetcher, 'get_crypto_price_async')
     def test_sync_get_crypto_price(self, mock_async_method):
         """Test sync wrapper for crypto price fetching."""
-        mock_async_method.return_value = asyncio.Future()
-        mock_async_method.return_value.set_result(50000.0)
-        
         with patch.object(self.wrapper, '_run_async') as mock_run_async:
             mock_run_async.return_value = 50000.0
             
@@ -382,6 +396,21 @@ class TestGlobalInstances:
         )
         
         assert isinstance(fetcher, AsyncPriceFetcher)
+        assert fetcher.crypto_rate_limit == 5
+        assert get_async_price_fetcher(cache_dir="test_cache", crypto_rate_limit=5) is fetcher
+        assert get_async_price_fetcher(cache_dir="test_cache", crypto_rate_limit=3) is not fetcher
+
+    def test_get_async_price_fetcher_normalizes_defaults(self):
+        """Explicit default arguments share the instance of a bare call."""
+        assert get_async_price_fetcher(timeout=30.0) is get_async_price_fetcher()
+        assert get_sync_price_fetcher(cache_dir="data/cache") is get_sync_price_fetcher()
+
+    def test_get_async_price_fetcher_keeps_every_instance(self):
+        """Asking for another configuration does not evict the earlier one."""
+        fetcher = get_async_price_fetcher(etf_rate_limit=2)
+        get_async_price_fetcher(etf_rate_limit=3)
+
+        assert get_async_price_fetcher(etf_rate_limit=2) is fetcher
 
 
 @pytest.mark.asyncio
@@ -411,7 +440,7 @@ class TestFastAPIIntegration:
         assert result == {'SPY': 450.0, 'QQQ': 380.0}
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestErrorHandling:
     """Test comprehensive error handling scenarios."""
 
@@ -427,30 +456,24 @@ class TestErrorHandling:
                 
         assert price is None
 
-    async def test_invalid_json_response(self):
+    async def test_invalid_json_response(self, shared_fetcher, mock_response_factory):
         """Test handling of invalid JSON responses."""
-        fetcher = AsyncPriceFetcher()
-        
         with patch('httpx.AsyncClient.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-            mock_response.raise_for_status = Mock()
-            mock_get.return_value = mock_response
+            mock_get.return_value = mock_response_factory(
+                json_exc=json.JSONDecodeError("Invalid JSON", "", 0)
+            )
             
-            async with fetcher:
-                price = await fetcher.get_crypto_price_async('bitcoin')
+            price = await shared_fetcher.get_crypto_price_async('bitcoin')
                 
         assert price is None
 
-    async def test_database_logging_failure(self):
+    async def test_database_logging_failure(self, shared_fetcher):
         """Test graceful handling of database logging failures."""
-        fetcher = AsyncPriceFetcher()
-        
         with patch('asyncio.to_thread') as mock_to_thread:
             mock_to_thread.side_effect = Exception("Database error")
             
             # Should not raise exception, just log error
-            await fetcher._log_price_async('SPY', 450.0, 'test')
+            await shared_fetcher._log_price_async('SPY', 450.0, 'test')
             
             mock_to_thread.assert_called_once()
 
@@ -480,6 +503,32 @@ class TestCacheOperations:
             
             assert cached_data == test_data
 
+    async def test_cache_data_without_orjson(self, tmp_path):
+        """Test caching falls back to the stdlib encoder without orjson."""
+        fetcher = AsyncPriceFetcher()
+        cache_file = tmp_path / "test_cache.json"
+        test_data = {"SPY": {"price": 450.5, "history": [448.0, 450.5]}}
+
+        with patch('data.async_price_fetcher.orjson', None):
+            await fetcher._cache_data_async(cache_file, test_data)
+
+        with open(cache_file, 'r') as f:
+            assert json.load(f) == test_data
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_cache_data_int_keys(self, tmp_path, use_orjson):
+        """Test non-str keys are cached as strings with and without orjson."""
+        fetcher = AsyncPriceFetcher()
+        cache_file = tmp_path / "test_cache.json"
+        test_data = {1: {"price": 450.5}, 2: {"price": 451.0}}
+        orjson_module = pytest.importorskip("orjson") if use_orjson else None
+
+        with patch('data.async_price_fetcher.orjson', orjson_module):
+            await fetcher._cache_data_async(cache_file, test_data)
+
+        with open(cache_file, 'r') as f:
+            assert json.load(f) == {"1": {"price": 450.5}, "2": {"price": 451.0}}
+
     async def test_cache_data_failure_handling(self):
         """Test cache operation failure handling."""
         from pathlib import Path
@@ -5,6 +5,7 @@ Basic tests to verify the testing infrastructure is working correctly.
 import pytest
 import sys
 import os
+from collections.abc import Mapping
 
 
 def test_basic_assertions():
@@ -35,14 +36,28 @@ def test_imports():
 def test_fixtures(sample_config, mock_price_data):
     """Test that fixtures are working correctly."""
     assert sample_config is not None
-    assert isinstance(sample_config, dict)
+    assert isinstance(sample_config, Mapping)
     assert 'initial_capital' in sample_config
+    with pytest.raises(TypeError):
+        sample_config['simulation']['weeks_to_simulate'] = 1
+    assert isinstance(sample_config['wheel_symbols'], tuple)
     
     assert mock_price_data is not None
-    assert isinstance(mock_price_data, dict)
+    assert isinstance(mock_price_data, Mapping)
     assert 'SPY' in mock_price_data
 
 
+def test_temp_config_file_fixture(temp_config_file, sample_config):
+    """Test that the config file holds the sample configuration."""
+    import yaml
+    
+    with open(temp_config_file) as f:
+        config = yaml.safe_load(f)
+    
+    assert config['wheel_symbols'] == list(sample_config['wheel_symbols'])
+    assert config['simulation'] == dict(sample_config['simulation'])
+
+
 def test_temp_db_fixture(temp_db):
     """Test that temporary database fixture works."""
     import sqlite3
@@ -12,170 +12,75 @@ Tests cover:
 import pytest
 import sys
 import logging
+from argparse import Namespace
 from io import StringIO
 from unittest.mock import Mock, patch
 
 from core.cli import TradingCLI, CLIError, parse_args, configure_logging
 
 
+@pytest.fixture(scope="class")
+def cli():
+    """Provide one TradingCLI shared by a test class; parsing is stateless."""
+    return TradingCLI()
+
+
 class TestTradingCLI:
     """Test suite for TradingCLI class."""
 
-    def setup_method(self):
-        """Set up test fixtures for each test method."""
-        self.cli = TradingCLI()
-
-    def test_cli_initialization(self):
+    def test_cli_initialization(self, cli):
         """Test CLI initialization."""
-        assert self.cli.prog_name == "Trading MVP"
-        assert self.cli.parser is not None
-
-    def test_basic_argument_parsing(self):
-        """Test parsing basic arguments."""
-        args = self.cli.parse_args(['--backtest'])
-        
-        assert args.backtest is True
-        assert args.config == 'config/config.yaml'  # Default value
-
-    def test_strategy_flags(self):
-        """Test strategy enable/disable flags."""
-        # Test enabling wheel strategy
-        args = self.cli.parse_args(['--wheel'])
-        assert args.wheel is True
-        
-        # Test disabling wheel strategy
-        args = self.cli.parse_args(['--no-wheel'])
-        assert args.wheel is False
-        
-        # Test enabling rotator strategy
-        args = self.cli.parse_args(['--rotator'])
-        assert args.rotator is True
-        
-        # Test disabling rotator strategy
-        args = self.cli.parse_args(['--no-rotator'])
-        assert args.rotator is False
+        assert cli.prog_name == "Trading MVP"
+        assert cli.parser is not None
 
-    def test_strategy_flags_default_none(self):
-        """Test that strategy flags default to None when not specified."""
-        args = self.cli.parse_args(['--backtest'])
-        
-        assert args.wheel is None
-        assert args.rotator is None
-
-    def test_config_file_override(self):
-        """Test configuration file path override."""
-        args = self.cli.parse_args(['--config', 'custom/config.yaml'])
-        
-        assert args.config == 'custom/config.yaml'
-
-    def test_output_file_options(self):
-        """Test output file configuration options."""
-        args = self.cli.parse_args([
+    def test_parser_built_lazily(self):
+        """Test the parser is only built when first needed, then reused."""
+        cli = TradingCLI()
+        assert 'parser' not in vars(cli)
+
+        parser = cli.parser
+        assert cli.parser is parser
+
+    @pytest.mark.parametrize("argv,expected", [
+        # Basic arguments and defaults
+        (['--backtest'], {'backtest': True, 'config': 'config/config.yaml'}),
+        # Strategy flags default to None when not specified
+        (['--backtest'], {'wheel': None, 'rotator': None}),
+        # Strategy enable/disable flags
+        (['--wheel'], {'wheel': True}),
+        (['--no-wheel'], {'wheel': False}),
+        (['--rotator'], {'rotator': True}),
+        (['--no-rotator'], {'rotator': False}),
+        # Configuration file override
+        (['--config', 'custom/config.yaml'], {'config': 'custom/config.yaml'}),
+        # Output file options
+        ([
             '--output', 'custom_trades.csv',
             '--detailed-output', 'custom_detailed.csv',
             '--consolidated-output', 'custom_consolidated.csv'
-        ])
-        
-        assert args.output == 'custom_trades.csv'
-        assert args.detailed_output == 'custom_detailed.csv'
-        assert args.consolidated_output == 'custom_consolidated.csv'
-
-    def test_output_disable_flags(self):
-        """Test flags to disable output files."""
-        args = self.cli.parse_args(['--no-detailed', '--no-consolidated'])
-        
-        assert args.no_detailed is True
-        assert args.no_consolidated is True
-
-    def test_verbosity_levels(self):
-        """Test verbosity level options."""
-        # Test single verbose flag
-        args = self.cli.parse_args(['-v'])
-        assert args.verbose == 1
-        
-        # Test multiple verbose flags
-        args = self.cli.parse_args(['-vvv'])
-        assert args.verbose == 3
-        
-        # Test quiet flag
-        args = self.cli.parse_args(['-q'])
-        assert args.quiet is True
-
-    def test_data_mode_options(self):
-        """Test data mode selection."""
-        for mode in ['mock', 'live', 'hybrid']:
-            args = self.cli.parse_args(['--data-mode', mode])
-            assert args.data_mode == mode
-
-    def test_health_check_options(self):
-        """Test health check related options."""
-        args = self.cli.parse_args(['--health-check'])
-        assert args.health_check is True
-        
-        args = self.cli.parse_args(['--skip-health-check'])
-        assert args.skip_health_check is True
-
-    def test_simulation_parameters(self):
-        """Test simulation parameter options."""
-        args = self.cli.parse_args([
-            '--weeks', '26',
-            '--initial-capital', '250000'
-        ])
-        
-        assert args.weeks == 26
-        assert args.initial_capital == 250000.0
-
-    def test_dry_run_flag(self):
-        """Test dry run option."""
-        args = self.cli.parse_args(['--dry-run'])
-        assert args.dry_run is True
-
-    def test_log_file_option(self):
-        """Test log file specification."""
-        args = self.cli.parse_args(['--log-file', 'trading.log'])
-        assert args.log_file == 'trading.log'
-
-    def test_help_flag(self):
-        """Test that help flag works without error."""
-        with pytest.raises(SystemExit) as exc_info:
-            self.cli.parse_args(['--help'])
-        
-        # Help should exit with code 0
-        assert exc_info.value.code == 0
-
-    def test_invalid_data_mode(self):
-        """Test invalid data mode raises error."""
-        with pytest.raises((SystemExit, CLIError)):
-            self.cli.parse_args(['--data-mode', 'invalid'])
-
-    def test_validation_conflicting_verbosity(self):
-        """Test validation of conflicting verbosity flags."""
-        with pytest.raises(CLIError, match="Cannot use both --quiet and --verbose"):
-            self.cli.parse_args(['--quiet', '--verbose'])
-
-    def test_validation_negative_weeks(self):
-        """Test validation of negative weeks."""
-        with pytest.raises(CLIError, match="Number of weeks must be positive"):
-            self.cli.parse_args(['--weeks', '-5'])
-
-    def test_validation_large_weeks(self):
-        """Test validation of unreasonably large weeks."""
-        with pytest.raises(CLIError, match="Number of weeks seems unreasonably large"):
-            self.cli.parse_args(['--weeks', '2000'])
-
-    def test_validation_negative_capital(self):
-        """Test validation of negative initial capital."""
-        with pytest.raises(CLIError, match="Initial capital must be positive"):
-            self.cli.parse_args(['--initial-capital', '-1000'])
-
-    def test_validation_all_strategies_disabled(self):
-        """Test validation when all strategies are disabled."""
-        with pytest.raises(CLIError, match="Cannot disable all strategies"):
-            self.cli.parse_args(['--no-wheel', '--no-rotator'])
-
-    def test_complex_argument_combination(self):
-        """Test complex combination of arguments."""
-        args = self.cli.parse_args([
+        ], {
+            'output': 'custom_trades.csv',
+            'detailed_output': 'custom_detailed.csv',
+            'consolidated_output': 'custom_consolidated.csv'
+        }),
+        (['--no-detailed', '--no-consolidated'], {'no_detailed': True, 'no_consolidated': True}),
+        # Verbosity levels
+        (['-v'], {'verbose': 1}),
+        (['-vvv'], {'verbose': 3}),
+        (['-q'], {'quiet': True}),
+        # Data modes
+        (['--data-mode', 'mock'], {'data_mode': 'mock'}),
+        (['--data-mode', 'live'], {'data_mode': 'live'}),
+        (['--data-mode', 'hybrid'], {'data_mode': 'hybrid'}),
+        # Health check options
+        (['--health-check'], {'health_check': True}),
+        (['--skip-health-check'], {'skip_health_check': True}),
+        # Simulation parameters
+        (['--weeks', '26', '--initial-capital', '250000'], {'weeks': 26, 'initial_capital': 250000.0}),
+        (['--dry-run'], {'dry_run': True}),
+        (['--log-file', 'trading.log'], {'log_file': 'trading.log'}),
+        # Complex combination of arguments
+        ([
             '--backtest',
             '--wheel',
             '--no-rotator',
@@ -184,30 +89,81 @@ class TestTradingCLI:
             '--weeks', '13',
             '--verbose',
             '--data-mode', 'live'
-        ])
+        ], {
+            'backtest': True,
+            'wheel': True,
+            'rotator': False,
+            'config': 'test.yaml',
+            'output': 'test_trades.csv',
+            'weeks': 13,
+            'verbose': 1,
+            'data_mode': 'live'
+        }),
+    ])
+    def test_argument_parsing(self, cli, argv, expected):
+        """Test each argv parses to the expected attribute values."""
+        args = cli.parse_args(argv)
+        
+        for attr, value in expected.items():
+            assert getattr(args, attr) == value, attr
+            if isinstance(value, bool) or value is None:
+                assert getattr(args, attr) is value, attr
+
+    def test_help_flag(self, cli):
+        """Test that help flag works without error."""
+        with pytest.raises(SystemExit) as exc_info:
+            cli.parse_args(['--help'])
         
-        assert args.backtest is True
-        assert args.wheel is True
-        assert args.rotator is False
-        assert args.config == 'test.yaml'
-        assert args.output == 'test_trades.csv'
-        assert args.weeks == 13
-        assert args.verbose == 1
-        assert args.data_mode == 'live'
-
+        # Help should exit with code 0
+        assert exc_info.value.code == 0
 
+    def test_invalid_data_mode(self, cli):
+        """Test invalid data mode raises error."""
+        with pytest.raises((SystemExit, CLIError)):
+            cli.parse_args(['--data-mode', 'invalid'])
+
+    @pytest.mark.parametrize("argv,message", [
+        (['--quiet', '--verbose'], "Cannot use both --quiet and --verbose"),
+        (['--weeks', '-5'], "Number of weeks must be positive"),
+        (['--weeks', '2000'], "Number of weeks seems unreasonably large"),
+        (['--initial-capital', '-1000'], "Initial capital must be positive"),
+        (['--no-wheel', '--no-rotator'], "Cannot disable all strategies"),
+    ])
+    def test_validation_errors(self, cli, argv, message):
+        """Test validation rejects invalid argument combinations."""
+        with pytest.raises(CLIError, match=message):
+            cli.parse_args(argv)
+
+
+def _cli_handlers():
+    """Root logger handlers added by configure_logging."""
+    return [h for h in logging.getLogger().handlers if getattr(h, '_trading_mvp', False)]
+
+
+@pytest.fixture
+def isolated_logging():
+    """Run a test against an empty root logger, restoring it afterwards."""
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    saved_level = root.level
+    root.handlers.clear()
+    
+    yield root
+    
+    for handler in root.handlers:
+        if handler not in saved_handlers:
+            handler.close()
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+
+
+@pytest.mark.usefixtures("isolated_logging")
 class TestLoggingConfiguration:
     """Test logging configuration functionality."""
 
     def test_configure_logging_quiet(self):
         """Test logging configuration in quiet mode."""
-        args = Mock()
-        args.quiet = True
-        args.verbose = 0
-        args.log_file = None
-        
-        # Clear any existing handlers
-        logging.getLogger().handlers.clear()
+        args = Namespace(quiet=True, verbose=0, log_file=None)
         
         configure_logging(args)
         
@@ -216,13 +172,7 @@ class TestLoggingConfiguration:
 
     def test_configure_logging_verbose(self):
         """Test logging configuration in verbose mode."""
-        args = Mock()
-        args.quiet = False
-        args.verbose = 1
-        args.log_file = None
-        
-        # Clear any existing handlers
-        logging.getLogger().handlers.clear()
+        args = Namespace(quiet=False, verbose=1, log_file=None)
         
         configure_logging(args)
         
@@ -231,13 +181,7 @@ class TestLoggingConfiguration:
 
     def test_configure_logging_very_verbose(self):
         """Test logging configuration in very verbose mode."""
-        args = Mock()
-        args.quiet = False
-        args.verbose = 2
-        args.log_file = None
-        
-        # Clear any existing handlers
-        logging.getLogger().handlers.clear()
+        args = Namespace(quiet=False, verbose=2, log_file=None)
         
         configure_logging(args)
         
@@ -245,19 +189,13 @@ class TestLoggingConfiguration:
         assert logging.getLogger().level == logging.DEBUG
         
         # Check that format includes filename and line number
-        handler = logging.getLogger().handlers[0]
+        handler = _cli_handlers()[0]
         formatter = handler.formatter
         assert 'filename' in formatter._fmt
 
     def test_configure_logging_default(self):
         """Test default logging configuration."""
-        args = Mock()
-        args.quiet = False
-        args.verbose = 0
-        args.log_file = None
-        
-        # Clear any existing handlers
-        logging.getLogger().handlers.clear()
+        args = Namespace(quiet=False, verbose=0, log_file=None)
         
         configure_logging(args)
         
@@ -267,13 +205,7 @@ class TestLoggingConfiguration:
     @patch('logging.FileHandler')
     def test_configure_logging_with_file(self, mock_file_handler):
         """Test logging configuration with file output."""
-        args = Mock()
-        args.quiet = False
-        args.verbose = 0
-        args.log_file = 'test.log'
-        
-        # Clear any existing handlers
-        logging.getLogger().handlers.clear()
+        args = Namespace(quiet=False, verbose=0, log_file='test.log')
         
         # Mock file handler with proper level attribute
         mock_handler = Mock()
@@ -289,13 +221,7 @@ class TestLoggingConfiguration:
 
     def test_configure_logging_file_error(self):
         """Test logging configuration handles file errors gracefully."""
-        args = Mock()
-        args.quiet = False
-        args.verbose = 0
-        args.log_file = '/invalid/path/test.log'
-        
-        # Clear any existing handlers
-        logging.getLogger().handlers.clear()
+        args = Namespace(quiet=False, verbose=0, log_file='/invalid/path/test.log')
         
         # Should not raise exception even if file can't be created
         configure_logging(args)
@@ -303,6 +229,29 @@ class TestLoggingConfiguration:
         # Should still have console handler
         assert len(logging.getLogger().handlers) >= 1
 
+    def test_configure_logging_reuses_handler(self):
+        """Test reconfiguring logging updates the existing handler in place."""
+        args = Namespace(quiet=False, verbose=0, log_file=None)
+        
+        configure_logging(args)
+        handler = _cli_handlers()[0]
+        
+        args.verbose = 2
+        configure_logging(args)
+        
+        assert _cli_handlers() == [handler]
+        assert 'filename' in handler.formatter._fmt
+
+    def test_configure_logging_shares_formatter(self):
+        """Test formatters are shared instances rather than rebuilt per call."""
+        args = Namespace(quiet=False, verbose=2, log_file=None)
+        
+        configure_logging(args)
+        formatter = _cli_handlers()[0].formatter
+        configure_logging(args)
+        
+        assert _cli_handlers()[0].formatter is formatter
+
 
 class TestConvenienceFunctions:
     """Test convenience functions for CLI operations."""
@@ -347,8 +296,8 @@ class TestCLIHelp:
             
         # Check that version info was printed
         assert mock_print.call_count >= 1
-        call_args = str(mock_print.call_args_list)
-        assert 'Trading MVP' in call_args
+        printed = [str(c.args[0]) for c in mock_print.call_args_list if c.args]
+        assert any('Trading MVP' in text for text in printed)
 
     def test_print_config_help(self):
         """Test configuration help printing."""
@@ -359,9 +308,9 @@ class TestCLIHelp:
             
         # Check that config help was printed
         assert mock_print.call_count >= 1
-        call_args = str(mock_print.call_args_list)
-        assert 'initial_capital' in call_args
-        assert 'strategies' in call_args
+        printed = [str(c.args[0]) for c in mock_print.call_args_list if c.args]
+        assert any('initial_capital' in text for text in printed)
+        assert any('strategies' in text for text in printed)
 
 
 class TestErrorHandling:
@@ -379,13 +328,14 @@ class TestErrorHandling:
         cli = TradingCLI()
         
         # Create valid args object
-        args = Mock()
-        args.quiet = False
-        args.verbose = 1
-        args.weeks = 52
-        args.initial_capital = 100000
-        args.wheel = True
-        args.rotator = None
+        args = Namespace(
+            quiet=False,
+            verbose=1,
+            weeks=52,
+            initial_capital=100000,
+            wheel=True,
+            rotator=None
+        )
         
         # Should not raise exception
         cli._validate_args(args)
@@ -10,13 +10,29 @@ Tests cover:
 """
 
 import pytest
-import tempfile
 import yaml
-from pathlib import Path
-from unittest.mock import Mock
+from argparse import Namespace
 
 from core.config import ConfigManager, ConfigError, load_config, get_default_config
 
+VALID_CONFIG_DATA = {
+    'initial_capital': 50000,
+    'strategies': {'wheel': True, 'rotator': False},
+    'allocation': {'wheel': 1.0, 'rotator': 0.0}
+}
+
+# libyaml's C dumper when available, pure Python otherwise
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+SERIALIZED_VALID_CONFIG = yaml.dump(VALID_CONFIG_DATA, Dumper=YAML_DUMPER)
+
+
+@pytest.fixture(scope="session")
+def valid_yaml_path(tmp_path_factory):
+    """Write VALID_CONFIG_DATA to a YAML file once and share its path."""
+    config_path = tmp_path_factory.mktemp("config") / "valid.yaml"
+    config_path.write_text(SERIALIZED_VALID_CONFIG)
+    return str(config_path)
+
 
 class TestConfigManager:
     """Test suite for ConfigManager class."""
@@ -50,50 +66,45 @@ class TestConfigManager:
         assert len(default_config['wheel_symbols']) > 0
         assert len(default_config['rotator_symbols']) > 0
 
-    def test_load_valid_config(self):
+    def test_load_valid_config(self, valid_yaml_path):
         """Test loading valid configuration file."""
-        # Create temporary config file
-        config_data = {
-            'initial_capital': 50000,
-            'strategies': {'wheel': True, 'rotator': False},
-            'allocation': {'wheel': 1.0, 'rotator': 0.0}
-        }
+        config = self.config_manager.load_config(valid_yaml_path)
+        
+        # Check loaded values
+        assert config['initial_capital'] == 50000
+        assert config['strategies']['wheel'] is True
+        assert config['strategies']['rotator'] is False
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
-        
-        try:
-            config = self.config_manager.load_config(config_path)
-            
-            # Check loaded values
-            assert config['initial_capital'] == 50000
-            assert config['strategies']['wheel'] is True
-            assert config['strategies']['rotator'] is False
-            
-            # Check defaults were applied
-            assert 'wheel_symbols' in config
-            assert 'data_mode' in config
-            
-        finally:
-            Path(config_path).unlink()
+        # Check defaults were applied
+        assert 'wheel_symbols' in config
+        assert 'data_mode' in config
+
+    def test_load_config_reparses_changed_file(self, tmp_path):
+        """Test repeated loads share a parse but see edits and stay independent."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(SERIALIZED_VALID_CONFIG)
+        
+        first = self.config_manager.load_config(str(config_path))
+        first['strategies']['wheel'] = False
+        second = self.config_manager.load_config(str(config_path))
+        assert second['strategies']['wheel'] is True
+        
+        config_data = dict(VALID_CONFIG_DATA, initial_capital=125000)
+        config_path.write_text(yaml.dump(config_data, Dumper=YAML_DUMPER))
+        assert self.config_manager.load_config(str(config_path))['initial_capital'] == 125000
 
     def test_load_nonexistent_config(self):
         """Test loading nonexistent configuration file."""
         with pytest.raises(ConfigError, match="Config file .* not found"):
             self.config_manager.load_config("/nonexistent/config.yaml")
 
-    def test_load_invalid_yaml(self):
+    def test_load_invalid_yaml(self, tmp_path):
         """Test loading invalid YAML file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("invalid: yaml: content: [unclosed")
-            config_path = f.name
+        config_path = tmp_path / "invalid.yaml"
+        config_path.write_text("invalid: yaml: content: [unclosed")
         
-        try:
-            with pytest.raises(ConfigError, match="Error parsing config file"):
-                self.config_manager.load_config(config_path)
-        finally:
-            Path(config_path).unlink()
+        with pytest.raises(ConfigError, match="Error parsing config file"):
+            self.config_manager.load_config(str(config_path))
 
     def test_validate_missing_required_field(self):
         """Test validation with missing required fields."""
@@ -171,11 +182,8 @@ class TestConfigManager:
             'allocation': {'wheel': 0.5, 'rotator': 0.5}
         }
         
-        # Mock CLI args
-        args = Mock()
-        args.wheel = False
-        args.rotator = True
-        args.config = 'custom.yaml'
+        # CLI args
+        args = Namespace(wheel=False, rotator=True, config='custom.yaml')
         
         updated_config = self.config_manager.apply_cli_overrides(config, args)
         
@@ -185,6 +193,7 @@ class TestConfigManager:
         
         # Original config should be unchanged
         assert config['strategies']['wheel'] is True
+        assert updated_config['allocation'] is config['allocation']  # Untouched parts shared
 
     def test_apply_cli_overrides_none_values(self):
         """Test CLI overrides with None values (no override)."""
@@ -192,16 +201,15 @@ class TestConfigManager:
             'strategies': {'wheel': True, 'rotator': False}
         }
         
-        # Mock CLI args with None values
-        args = Mock()
-        args.wheel = None
-        args.rotator = None
+        # CLI args with None values
+        args = Namespace(wheel=None, rotator=None)
         
         updated_config = self.config_manager.apply_cli_overrides(config, args)
         
         # Values should remain unchanged
         assert updated_config['strategies']['wheel'] is True
         assert updated_config['strategies']['rotator'] is False
+        assert updated_config is config  # Nothing to override, nothing copied
 
     def test_get_enabled_strategies(self):
         """Test getting enabled strategies."""
@@ -305,28 +313,18 @@ class TestConfigManager:
         assert result['e'] == 4      # Unchanged
         assert result['g'] == 6      # Added top-level
 
+        # Inputs are left untouched
+        assert base['b'] == {'c': 2, 'd': 3}
+        assert 'g' not in base
+
 
 class TestConfigConvenienceFunctions:
     """Test convenience functions for configuration management."""
 
-    def test_load_config_function(self):
+    def test_load_config_function(self, valid_yaml_path):
         """Test load_config convenience function."""
-        # Create temporary config file
-        config_data = {
-            'initial_capital': 75000,
-            'strategies': {'wheel': True, 'rotator': False},
-            'allocation': {'wheel': 1.0, 'rotator': 0.0}
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
-        
-        try:
-            config = load_config(config_path)
-            assert config['initial_capital'] == 75000
-        finally:
-            Path(config_path).unlink()
+        config = load_config(valid_yaml_path)
+        assert config['initial_capital'] == 50000
 
     def test_get_default_config_function(self):
         """Test get_default_config convenience function."""
@@ -10,31 +10,81 @@ Tests cover:
 """
 
 import pytest
-import tempfile
 import json
-from datetime import datetime, timezone, timedelta
-from pathlib import Path
+from datetime import datetime, timezone
+from types import MappingProxyType
 
+from data import database
 from data.database import TradingDatabase, DatabaseError, get_database, log_trade_to_db
 
+# Speed regression guard: these tests run in milliseconds, so a slowdown in
+# the database layer fails here instead of quietly growing the suite's runtime
+pytestmark = pytest.mark.timeout(2.0)
+
+TABLES = ('trades', 'price_cache', 'strategy_runs', 'portfolio_snapshots')
+
+FIXED_TIME = datetime(2023, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+# Canonical trades; insert_trade adds a timestamp in place, so pass copies
+WHEEL_TRADE = MappingProxyType({
+    'strategy': 'wheel',
+    'symbol': 'SPY',
+    'action': 'SELL_PUT',
+    'quantity': 1.0,
+    'price': 450.0,
+    'cash_flow': 5.50
+})
+ROTATOR_TRADE = MappingProxyType({
+    'strategy': 'rotator',
+    'symbol': 'BTC',
+    'action': 'BUY_CRYPTO',
+    'quantity': 0.5,
+    'price': 50000.0,
+    'cash_flow': -25000.0
+})
+
+
+@pytest.fixture(scope="class")
+def trading_db(tmp_path_factory):
+    """Provide one TradingDatabase per test class, so the schema is built once."""
+    db = TradingDatabase(tmp_path_factory.mktemp("db") / "test_trading.db")
+    # The file is thrown away, so skip fsyncs on commit and keep temp data in memory
+    db._get_connection().executescript("PRAGMA synchronous=OFF; PRAGMA temp_store=MEMORY;")
+    
+    yield db
+    
+    db.close()
+
+
+@pytest.fixture(scope="class")
+def db_tables(trading_db):
+    """Names of the tables in the shared database, read once per class."""
+    cursor = trading_db._get_connection().execute(
+        "SELECT name FROM sqlite_master WHERE type='table'"
+    )
+    return frozenset(row[0] for row in cursor.fetchall())
+
 
 class TestTradingDatabase:
     """Test suite for TradingDatabase class."""
 
-    def setup_method(self):
-        """Set up test fixtures for each test method."""
-        # Create temporary database for each test
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test_trading.db"
-        self.db = TradingDatabase(self.db_path)
-
-    def teardown_method(self):
-        """Clean up after each test."""
-        self.db.close()
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _db(self, trading_db):
+        """Give each test the shared database, emptied again afterwards."""
+        self.db = trading_db
+        self.db_path = trading_db.db_path
+        
+        yield
+        
+        # TradingDatabase commits every write, so tests can't be wrapped in
+        # a transaction; delete the rows and reset the id counters instead
+        conn = trading_db._get_connection()
+        with conn:
+            for table in TABLES:
+                conn.execute(f"DELETE FROM {table}")
+            conn.execute("DELETE FROM sqlite_sequence")
 
-    def test_database_initialization(self):
+    def test_database_initialization(self, db_tables):
         """Test that database initializes correctly with proper schema."""
         # Database file should exist
         assert self.db_path.exists()
@@ -44,26 +94,11 @@ class TestTradingDatabase:
         assert conn is not None
         
         # Check that all required tables exist
-        cursor = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table'"
-        )
-        tables = {row[0] for row in cursor.fetchall()}
-        
-        expected_tables = {'trades', 'price_cache', 'strategy_runs', 'portfolio_snapshots'}
-        assert expected_tables.issubset(tables)
+        assert db_tables.issuperset(TABLES)
 
     def test_insert_trade_success(self):
         """Test successful trade insertion."""
-        trade_data = {
-            'strategy': 'wheel',
-            'symbol': 'SPY',
-            'action': 'SELL_PUT',
-            'quantity': 1.0,
-            'price': 450.0,
-            'cash_flow': 5.50,
-            'week': 'Week0',
-            'notes': 'Test trade'
-        }
+        trade_data = {**WHEEL_TRADE, 'week': 'Week0', 'notes': 'Test trade'}
         
         trade_id = self.db.insert_trade(trade_data)
         assert isinstance(trade_id, int)
@@ -80,82 +115,43 @@ class TestTradingDatabase:
         with pytest.raises(DatabaseError, match="Missing required field"):
             self.db.insert_trade(incomplete_trade)
 
-    def test_insert_trade_auto_timestamp(self):
+    def test_insert_trade_auto_timestamp(self, monkeypatch):
         """Test that timestamp is automatically added if not provided."""
-        trade_data = {
-            'strategy': 'wheel',
-            'symbol': 'SPY',
-            'action': 'SELL_PUT',
-            'quantity': 1.0,
-            'price': 450.0,
-            'cash_flow': 5.50
-        }
+        monkeypatch.setattr(self.db, 'clock', lambda: FIXED_TIME)
         
-        before_time = datetime.now(timezone.utc)
-        trade_id = self.db.insert_trade(trade_data)
-        after_time = datetime.now(timezone.utc)
+        self.db.insert_trade(dict(WHEEL_TRADE))
         
         # Retrieve the trade and check timestamp
         trades = self.db.get_trades(limit=1)
         assert len(trades) == 1
-        
-        trade_timestamp = datetime.fromisoformat(trades[0]['timestamp'])
-        assert before_time <= trade_timestamp <= after_time
+        assert trades[0]['timestamp'] == FIXED_TIME.isoformat()
 
     def test_get_trades_no_filter(self):
         """Test retrieving all trades without filters."""
         # Insert multiple trades
-        trades_data = [
-            {
-                'strategy': 'wheel',
-                'symbol': 'SPY',
-                'action': 'SELL_PUT',
-                'quantity': 1.0,
-                'price': 450.0,
-                'cash_flow': 5.50
-            },
-            {
-                'strategy': 'rotator',
-                'symbol': 'BTC',
-                'action': 'BUY_CRYPTO',
-                'quantity': 0.5,
-                'price': 50000.0,
-                'cash_flow': -25000.0
-            }
-        ]
+        trades_data = [dict(WHEEL_TRADE), dict(ROTATOR_TRADE)]
         
-        for trade_data in trades_data:
-            self.db.insert_trade(trade_data)
+        self.db.insert_trades_bulk(trades_data)
         
         # Retrieve all trades
         all_trades = self.db.get_trades()
         assert len(all_trades) == 2
 
+    def test_insert_trades_bulk_all_or_nothing(self):
+        """Test bulk insertion rejects the whole batch if any trade is invalid."""
+        with pytest.raises(DatabaseError, match="Missing required field"):
+            self.db.insert_trades_bulk([dict(WHEEL_TRADE), {'strategy': 'wheel'}])
+        
+        assert self.db.get_trades() == []
+
     def test_get_trades_with_filters(self):
         """Test retrieving trades with various filters."""
         # Insert test trades
-        wheel_trade = {
-            'strategy': 'wheel',
-            'symbol': 'SPY',
-            'action': 'SELL_PUT',
-            'quantity': 1.0,
-            'price': 450.0,
-            'cash_flow': 5.50,
-            'timestamp': '2023-01-01T10:00:00+00:00'
-        }
+        wheel_trade = {**WHEEL_TRADE, 'timestamp': '2023-01-01T10:00:00+00:00'}
         
-        rotator_trade = {
-            'strategy': 'rotator',
-            'symbol': 'BTC',
-            'action': 'BUY_CRYPTO',
-            'quantity': 0.5,
-            'price': 50000.0,
-            'cash_flow': -25000.0,
-            'timestamp': '2023-01-02T10:00:00+00:00'
-        }
+        rotator_trade = {**ROTATOR_TRADE, 'timestamp': '2023-01-02T10:00:00+00:00'}
         
-        self.db.insert_trade(wheel_trade)
-        self.db.insert_trade(rotator_trade)
+        self.db.insert_trades_bulk([wheel_trade, rotator_trade])
         
         # Test strategy filter
         wheel_trades = self.db.get_trades(strategy='wheel')
@@ -311,16 +307,12 @@ class TestTradingDatabase:
         """Test strategy performance summary."""
         # Insert trades for different strategies
         trades = [
-            {'strategy': 'wheel', 'symbol': 'SPY', 'action': 'SELL_PUT', 
-             'quantity': 1, 'price': 450, 'cash_flow': 5.5},
-            {'strategy': 'wheel', 'symbol': 'SPY', 'action': 'BUY_SHARES', 
-             'quantity': 100, 'price': 445, 'cash_flow': -44500},
-            {'strategy': 'rotator', 'symbol': 'BTC', 'action': 'BUY_CRYPTO', 
-             'quantity': 0.5, 'price': 50000, 'cash_flow': -25000}
+            dict(WHEEL_TRADE),
+            {**WHEEL_TRADE, 'action': 'BUY_SHARES', 'quantity': 100, 'price': 445, 'cash_flow': -44500},
+            dict(ROTATOR_TRADE)
         ]
         
-        for trade in trades:
-            self.db.insert_trade(trade)
+        self.db.insert_trades_bulk(trades)
         
         # Get performance summary
         performance = self.db.get_strategy_performance()
@@ -339,10 +331,7 @@ class TestTradingDatabase:
     def test_database_stats(self):
         """Test database statistics."""
         # Insert some test data
-        self.db.insert_trade({
-            'strategy': 'wheel', 'symbol': 'SPY', 'action': 'SELL_PUT',
-            'quantity': 1, 'price': 450, 'cash_flow': 5.5
-        })
+        self.db.insert_trade(dict(WHEEL_TRADE))
         
         self.db.insert_price_data('SPY', '2023-01-01T10:00:00+00:00', 450.0)
         
@@ -374,11 +363,14 @@ class TestTradingDatabase:
     def test_thread_safety(self):
         """Test that database operations are thread-safe."""
         import threading
-        import queue
         
-        results = queue.Queue()
+        thread_count = 5
+        results = []  # list.append is atomic, so threads can share it
+        barrier = threading.Barrier(thread_count)
         
         def insert_trade(trade_num):
+            # Release all threads together so their inserts actually contend
+            barrier.wait()
             try:
                 trade_id = self.db.insert_trade({
                     'strategy': 'test',
@@ -388,15 +380,16 @@ class TestTradingDatabase:
                     'price': 100 + trade_num,
                     'cash_flow': -100 - trade_num
                 })
-                results.put(('success', trade_id))
+                results.append(('success', trade_id))
             except Exception as e:
-                results.put(('error', str(e)))
+                results.append(('error', str(e)))
         
         # Start multiple threads
-        threads = []
-        for i in range(5):
-            thread = threading.Thread(target=insert_trade, args=(i,))
-            threads.append(thread)
+        threads = [
+            threading.Thread(target=insert_trade, args=(i,))
+            for i in range(thread_count)
+        ]
+        for thread in threads:
             thread.start()
         
         # Wait for all threads to complete
@@ -404,31 +397,33 @@ class TestTradingDatabase:
             thread.join()
         
         # Check results
-        success_count = 0
-        while not results.empty():
-            status, result = results.get()
-            if status == 'success':
-                success_count += 1
-        
-        assert success_count == 5
+        assert [status for status, _ in results] == ['success'] * thread_count, results
         
         # Verify all trades were inserted
         all_trades = self.db.get_trades()
-        assert len(all_trades) == 5
+        assert len(all_trades) == thread_count
+
+
+@pytest.fixture(scope="module")
+def utility_db_path(tmp_path_factory):
+    """Database path shared by the module-level helper tests."""
+    return tmp_path_factory.mktemp("utility_db") / "test_trading.db"
 
 
 class TestDatabaseUtilityFunctions:
     """Test utility functions for database operations."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test_trading.db"
-
-    def teardown_method(self):
-        """Clean up after tests."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _fresh_singleton(self, utility_db_path, monkeypatch):
+        """Start each test without a global database and remove the file after."""
+        self.db_path = utility_db_path
+        monkeypatch.setattr(database, '_db_instance', None)
+        
+        yield
+        
+        if database._db_instance is not None:
+            database._db_instance.close()
+        utility_db_path.unlink(missing_ok=True)
 
     def test_get_database_singleton(self):
         """Test that get_database returns the same instance."""
@@ -440,14 +435,7 @@ class TestDatabaseUtilityFunctions:
 
     def test_log_trade_to_db_convenience(self):
         """Test convenience function for logging trades."""
-        trade_data = {
-            'strategy': 'wheel',
-            'symbol': 'SPY',
-            'action': 'SELL_PUT',
-            'quantity': 1.0,
-            'price': 450.0,
-            'cash_flow': 5.50
-        }
+        trade_data = dict(WHEEL_TRADE)
         
         trade_id = log_trade_to_db(trade_data, self.db_path)
         assert isinstance(trade_id, int)
@@ -9,324 +9,296 @@ Tests cover:
 - Data validation
 """
 
+import inspect
+import os
+import time
 import pytest
-import responses
+import requests
 import json
-import tempfile
-import os
-from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
-from datetime import datetime, timedelta
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from data.price_fetcher import (
+    PriceFetcher, DataSourceError, DataValidationError, InsufficientDataError, RateLimitError
+)
+
+# Canned API data, built once; tests hand out shallow copies of the frames
+COINGECKO_BTC_RESPONSE = {
+    "prices": [[1672531200000, 50000.0], [1672617600000, 50500.0]]  # [timestamp, price]
+}
+HISTORY_DATES = pd.date_range('2023-01-01', periods=5)
+SPY_HISTORY = pd.DataFrame({
+    'Close': [450.0, 452.0, 448.0, 455.0, 453.0]
+}, index=HISTORY_DATES)
+ETF_HISTORY = pd.DataFrame({
+    'Close': [100.0, 101.0, 99.0]
+}, index=HISTORY_DATES[:3])
+
+
+@pytest.fixture(scope="module")
+def module_fetcher(tmp_path_factory):
+    """One PriceFetcher shared by the tests that leave its cache alone."""
+    # PriceFetcher reads its cache location from the environment
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('CACHE_DIRECTORY', str(tmp_path_factory.mktemp("cache")))
+        return PriceFetcher()
+
+
+@pytest.fixture
+def fresh_fetcher(tmp_path, monkeypatch):
+    """A PriceFetcher with its own empty cache, for tests that write to it."""
+    monkeypatch.setenv('CACHE_DIRECTORY', str(tmp_path))
+    return PriceFetcher()
+
+
+@pytest.fixture
+def ok_response():
+    """A successful HTTP response; tests fill in the JSON body they need."""
+    response = Mock(spec=requests.Response)
+    response.status_code = 200
+    response.json.return_value = {}
+    return response
+
+
+@pytest.fixture
+def unthrottled(monkeypatch):
+    """Let requests skip the per-minute rate limiter and retries skip their backoff wait."""
+    # The limiter counts calls across the whole session, so stubbed requests
+    # would otherwise start sleeping after the tenth
+    monkeypatch.setattr(PriceFetcher, '_rate_limited_request',
+                        inspect.unwrap(PriceFetcher._rate_limited_request))
+    monkeypatch.setattr(time, 'sleep', lambda seconds: None)
 
-from data.price_fetcher import PriceFetcher, DataSourceError
+
+@pytest.fixture(scope="session")
+def thread_pool():
+    """Worker threads shared by tests that make concurrent calls."""
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
 
 
 class TestPriceFetcher:
     """Test suite for PriceFetcher class."""
 
-    def setup_method(self):
-        """Set up test fixtures for each test method."""
-        # Create a temporary directory for cache during tests
-        self.temp_dir = tempfile.mkdtemp()
-        self.cache_dir = Path(self.temp_dir) / "cache"
-        self.cache_dir.mkdir(exist_ok=True)
-        
-        # Initialize price fetcher with test cache directory
-        self.fetcher = PriceFetcher(cache_dir=str(self.cache_dir))
+    @pytest.fixture(autouse=True)
+    def _fetcher(self, module_fetcher):
+        """Use the shared price fetcher unless a test swaps in its own."""
+        self.fetcher = module_fetcher
+        self.cache_dir = module_fetcher.cache_directory
 
-    def teardown_method(self):
-        """Clean up after each test."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    def _use_fresh_fetcher(self, fetcher):
+        """Point the test at a fetcher whose cache it may modify."""
+        self.fetcher = fetcher
+        self.cache_dir = fetcher.cache_directory
 
-    @responses.activate
-    def test_coingecko_api_success(self):
+    @pytest.mark.usefixtures("unthrottled")
+    def test_coingecko_api_success(self, monkeypatch, ok_response):
         """Test successful CoinGecko API response."""
         # Mock CoinGecko API response
-        mock_response = {
-            "bitcoin": {
-                "usd": 50000.0,
-                "usd_24h_change": 2.5
-            }
-        }
-        
-        responses.add(
-            responses.GET,
-            "https://api.coingecko.com/api/v3/simple/price",
-            json=mock_response,
-            status=200
-        )
+        ok_response.json.return_value = COINGECKO_BTC_RESPONSE
+        mock_get = Mock(return_value=ok_response)
+        monkeypatch.setattr('data.price_fetcher.requests.get', mock_get)
         
         # Test crypto price fetching
-        if hasattr(self.fetcher, 'get_crypto_price'):
-            price = self.fetcher.get_crypto_price('bitcoin', 'usd')
-            assert price == 50000.0
-        elif hasattr(self.fetcher, '_fetch_crypto_price'):
-            price = self.fetcher._fetch_crypto_price('bitcoin')
-            assert price == 50000.0
-
-    @responses.activate
-    def test_coingecko_api_failure(self):
+        prices = self.fetcher.get_crypto_prices_coingecko('bitcoin', 2)
+        assert prices == [50000.0, 50500.0]
+        assert mock_get.call_args.args[0].endswith('/coins/bitcoin/market_chart')
+        assert mock_get.call_args.kwargs['params'] == {'vs_currency': 'usd', 'days': 2}
+
+    @pytest.mark.usefixtures("unthrottled")
+    def test_coingecko_api_failure(self, monkeypatch):
         """Test CoinGecko API failure and fallback behavior."""
         # Mock API failure
-        responses.add(
-            responses.GET,
-            "https://api.coingecko.com/api/v3/simple/price",
-            json={"error": "Rate limit exceeded"},
-            status=429
+        error_response = Mock(
+            status_code=429,
+            json=Mock(return_value={"error": "Rate limit exceeded"}),
+            raise_for_status=Mock(side_effect=requests.exceptions.HTTPError("429 Too Many Requests"))
         )
+        mock_get = Mock(return_value=error_response)
+        monkeypatch.setattr('data.price_fetcher.requests.get', mock_get)
         
-        # Should handle error gracefully
-        with pytest.raises((DataSourceError, Exception)):
-            if hasattr(self.fetcher, 'get_crypto_price'):
-                self.fetcher.get_crypto_price('bitcoin', 'usd')
+        # A 429 surfaces as a rate limit error once the retries are used up
+        with pytest.raises(RateLimitError):
+            self.fetcher.get_crypto_prices_coingecko('bitcoin', 7)
+        assert mock_get.call_count == 3
 
-    @patch('yfinance.Ticker')
-    def test_yahoo_finance_success(self, mock_ticker_class):
+    @pytest.mark.usefixtures("unthrottled")
+    def test_yahoo_finance_success(self, monkeypatch):
         """Test successful Yahoo Finance data retrieval."""
         # Mock yfinance Ticker
         mock_ticker = Mock()
-        mock_ticker.history.return_value = pd.DataFrame({
-            'Close': [450.0, 452.0, 448.0, 455.0, 453.0]
-        }, index=pd.date_range('2023-01-01', periods=5))
-        mock_ticker_class.return_value = mock_ticker
+        mock_ticker.history.return_value = SPY_HISTORY.copy(deep=False)
+        monkeypatch.setattr('yfinance.Ticker', Mock(return_value=mock_ticker))
         
         # Test ETF price fetching
-        if hasattr(self.fetcher, 'get_etf_price'):
-            prices = self.fetcher.get_etf_price('SPY', days=5)
-            assert len(prices) == 5
-            assert prices[-1] == 453.0  # Last price
-        elif hasattr(self.fetcher, '_fetch_etf_price'):
-            price = self.fetcher._fetch_etf_price('SPY')
-            assert isinstance(price, (int, float))
-
-    @patch('yfinance.Ticker')
-    def test_yahoo_finance_failure(self, mock_ticker_class):
+        prices = self.fetcher.get_etf_prices_yfinance('SPY', days=5)
+        assert prices == SPY_HISTORY['Close'].tolist()
+        assert mock_ticker.history.call_args.kwargs['period'] == '7d'
+
+    @pytest.mark.usefixtures("unthrottled")
+    def test_yahoo_finance_failure(self, monkeypatch):
         """Test Yahoo Finance failure and fallback."""
         # Mock yfinance failure
         mock_ticker = Mock()
         mock_ticker.history.side_effect = Exception("No data found")
-        mock_ticker_class.return_value = mock_ticker
+        monkeypatch.setattr('yfinance.Ticker', Mock(return_value=mock_ticker))
+        monkeypatch.setattr(self.fetcher, 'alpha_vantage_api_key', None)
         
-        # Should handle error gracefully or use fallback
-        try:
-            if hasattr(self.fetcher, 'get_etf_price'):
-                self.fetcher.get_etf_price('SPY')
-            elif hasattr(self.fetcher, '_fetch_etf_price'):
-                self.fetcher._fetch_etf_price('SPY')
-        except Exception as e:
-            # Should be a meaningful error
-            assert isinstance(e, (DataSourceError, Exception))
-
-    def test_cache_functionality(self):
+        # Without an Alpha Vantage key there is no backup source
+        with pytest.raises(DataSourceError, match="No data found"):
+            self.fetcher.get_etf_prices_yfinance('SPY')
+        with pytest.raises(DataSourceError, match="Alpha Vantage key missing"):
+            self.fetcher.get_prices('SPY', 'etf')
+
+    def test_cache_functionality(self, fresh_fetcher, monkeypatch):
         """Test caching of price data."""
-        # Create a mock cache file
-        crypto_cache_dir = self.cache_dir / "crypto"
-        crypto_cache_dir.mkdir(exist_ok=True)
+        self._use_fresh_fetcher(fresh_fetcher)
         
-        cache_file = crypto_cache_dir / "bitcoin_7d_2023-01-01.json"
+        # Create a cache file where get_prices looks for it
+        cache_file = self.fetcher.get_cache_path('crypto', 'bitcoin', 7)
         mock_data = {
-            "prices": [[1672531200000, 50000.0]],  # Timestamp, price
-            "timestamp": "2023-01-01T00:00:00Z"
+            "symbol": "bitcoin",
+            "prices": [50000.0, 50500.0],
+            "fetched_at": "2023-01-01T00:00:00"
         }
         
-        with open(cache_file, 'w') as f:
-            json.dump(mock_data, f)
+        cache_file.write_text(json.dumps(mock_data))
         
-        # Test cache reading (if implemented)
-        if hasattr(self.fetcher, '_read_cache'):
-            cached_data = self.fetcher._read_cache('bitcoin', 7, cache_file.parent)
-            assert cached_data is not None
+        # Test cache reading
+        assert self.fetcher.load_from_cache('crypto', 'bitcoin', 7) == [50000.0, 50500.0]
         
-        # Test that cache is used when available
-        if hasattr(self.fetcher, 'get_crypto_prices'):
-            # Should use cache if available and recent
-            try:
-                prices = self.fetcher.get_crypto_prices('bitcoin', 7)
-                assert isinstance(prices, list)
-            except Exception:
-                # Cache might not be implemented or accessible in this way
-                pass
+        # get_prices should answer from the cache without any request
+        monkeypatch.setattr('requests.get', Mock(side_effect=AssertionError("cache not used")))
+        assert self.fetcher.get_prices('bitcoin', 'crypto', 7) == [50000.0, 50500.0]
 
     def test_rate_limiting(self):
         """Test that rate limiting is applied."""
-        # This test verifies that rate limiting decorators are in place
-        # We can't easily test the actual rate limiting without waiting,
-        # but we can verify the decorators exist
-        
-        if hasattr(self.fetcher, 'get_crypto_prices'):
-            method = getattr(self.fetcher.get_crypto_prices, '__wrapped__', None)
-            # If rate limiting is applied, there should be a wrapped method
-            # This is implementation-dependent
-        
-        # Alternative: test that multiple rapid calls don't cause issues
-        start_time = time.time()
-        try:
-            for i in range(3):
-                if hasattr(self.fetcher, '_make_request'):
-                    # Mock a simple request
-                    pass
-        except Exception:
-            pass
-        end_time = time.time()
-        
-        # Should complete reasonably quickly but respect any rate limits
-        assert end_time - start_time < 10  # Shouldn't take too long
+        # Actual throttling can't be checked without waiting, so verify that
+        # outgoing requests go through the ratelimit decorators instead
+        request = self.fetcher._rate_limited_request
+        assert getattr(request, '__wrapped__', None) is not None
 
     def test_data_validation(self):
         """Test validation of price data."""
-        # Test with invalid data
-        invalid_prices = [-100, 0, float('inf'), None]
-        
-        for invalid_price in invalid_prices:
-            if hasattr(self.fetcher, '_validate_price'):
-                is_valid = self.fetcher._validate_price(invalid_price)
-                if invalid_price in [-100, 0, float('inf'), None]:
-                    assert not is_valid
-            else:
-                # If no explicit validation method, prices should be handled gracefully
-                pass
+        # Invalid entries are dropped
+        prices = self.fetcher.validate_prices([450.50, None, -100, 0, 451.0], 'SPY', 'etf')
+        assert prices == [450.50, 451.0]
         
-        # Test with valid data
-        valid_price = 450.50
-        if hasattr(self.fetcher, '_validate_price'):
-            is_valid = self.fetcher._validate_price(valid_price)
-            assert is_valid
+        # Nothing valid left, or nothing at all, is an error
+        with pytest.raises(DataValidationError):
+            self.fetcher.validate_prices([-100, 0, None], 'SPY', 'etf')
+        with pytest.raises(InsufficientDataError):
+            self.fetcher.validate_prices([], 'SPY', 'etf')
 
-    def test_health_check(self):
+    @pytest.mark.usefixtures("unthrottled")
+    def test_health_check(self, monkeypatch, ok_response):
         """Test health check functionality."""
-        if hasattr(self.fetcher, 'health_check'):
-            health_status = self.fetcher.health_check()
-            assert isinstance(health_status, dict)
-            
-            # Should have status for different data sources
-            expected_sources = ['coingecko', 'yfinance', 'alpha_vantage']
-            for source in expected_sources:
-                if source in health_status:
-                    assert 'status' in health_status[source]
-
-    @pytest.mark.parametrize("symbol", ['bitcoin', 'ethereum', 'solana'])
-    def test_crypto_symbols(self, symbol):
+        # Both free sources answer; Alpha Vantage has no key configured
+        ok_response.json.return_value = {"prices": [[1672531200000, 50000.0]]}
+        monkeypatch.setattr('requests.get', Mock(return_value=ok_response))
+        mock_ticker = Mock()
+        mock_ticker.history.return_value = SPY_HISTORY.copy(deep=False)
+        monkeypatch.setattr('yfinance.Ticker', Mock(return_value=mock_ticker))
+        monkeypatch.setattr(self.fetcher, 'alpha_vantage_api_key', None)
+        
+        health_status = self.fetcher.health_check()
+        
+        assert health_status == {'coingecko': True, 'yfinance': True, 'alpha_vantage': None}
+
+    @pytest.mark.usefixtures("unthrottled")
+    def test_crypto_symbols(self, monkeypatch, ok_response):
         """Test fetching different crypto symbols."""
-        # Mock successful response for each symbol
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = {
-                symbol: {"usd": 1000.0}
-            }
-            mock_response.status_code = 200
-            mock_get.return_value = mock_response
+        mock_get = Mock(return_value=ok_response)
+        monkeypatch.setattr('requests.get', mock_get)
+        
+        for price, symbol in enumerate(('bitcoin', 'ethereum', 'solana'), start=1000):
+            # Mock successful response for each symbol
+            ok_response.json.return_value = {"prices": [[1672531200000, float(price)]]}
             
-            try:
-                if hasattr(self.fetcher, 'get_crypto_prices'):
-                    prices = self.fetcher.get_crypto_prices(symbol, 1)
-                    assert isinstance(prices, list)
-                elif hasattr(self.fetcher, '_fetch_crypto_price'):
-                    price = self.fetcher._fetch_crypto_price(symbol)
-                    assert isinstance(price, (int, float))
-            except Exception:
-                # Method might not be implemented or might require different parameters
-                pass
-
-    @pytest.mark.parametrize("symbol", ['SPY', 'QQQ', 'IWM'])
-    def test_etf_symbols(self, symbol):
+            assert self.fetcher.get_crypto_prices_coingecko(symbol, 1) == [float(price)]
+            assert f"/coins/{symbol}/" in mock_get.call_args.args[0]
+
+    @pytest.mark.usefixtures("unthrottled")
+    def test_etf_symbols(self, monkeypatch):
         """Test fetching different ETF symbols."""
-        with patch('yfinance.Ticker') as mock_ticker_class:
-            mock_ticker = Mock()
-            mock_ticker.history.return_value = pd.DataFrame({
-                'Close': [100.0, 101.0, 99.0]
-            }, index=pd.date_range('2023-01-01', periods=3))
-            mock_ticker_class.return_value = mock_ticker
-            
-            try:
-                if hasattr(self.fetcher, 'get_etf_prices'):
-                    prices = self.fetcher.get_etf_prices(symbol, 3)
-                    assert isinstance(prices, list)
-                    assert len(prices) == 3
-                elif hasattr(self.fetcher, '_fetch_etf_price'):
-                    price = self.fetcher._fetch_etf_price(symbol)
-                    assert isinstance(price, (int, float))
-            except Exception:
-                # Method might not be implemented or might require different parameters
-                pass
-
-    def test_error_handling_network_timeout(self):
+        mock_ticker = Mock()
+        mock_ticker.history.return_value = ETF_HISTORY.copy(deep=False)
+        mock_ticker_class = Mock(return_value=mock_ticker)
+        monkeypatch.setattr('yfinance.Ticker', mock_ticker_class)
+        
+        for symbol in ('SPY', 'QQQ', 'IWM'):
+            prices = self.fetcher.get_etf_prices_yfinance(symbol, 3)
+            assert prices == [100.0, 101.0, 99.0]
+            mock_ticker_class.assert_called_with(symbol)
+
+    @pytest.mark.usefixtures("unthrottled")
+    def test_error_handling_network_timeout(self, monkeypatch):
         """Test handling of network timeouts."""
-        with patch('requests.get') as mock_get:
-            mock_get.side_effect = requests.exceptions.Timeout("Request timed out")
-            
-            with pytest.raises((DataSourceError, requests.exceptions.Timeout, Exception)):
-                if hasattr(self.fetcher, '_make_request'):
-                    self.fetcher._make_request('https://example.com')
+        monkeypatch.setattr('requests.get', Mock(side_effect=requests.exceptions.Timeout("Request timed out")))
+        
+        with pytest.raises(DataSourceError, match="Request timeout"):
+            self.fetcher._rate_limited_request('https://example.com')
 
-    def test_error_handling_invalid_response(self):
+    @pytest.mark.usefixtures("unthrottled")
+    def test_error_handling_invalid_response(self, monkeypatch, ok_response):
         """Test handling of invalid API responses."""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-            mock_response.status_code = 200
-            mock_get.return_value = mock_response
-            
-            with pytest.raises((DataSourceError, json.JSONDecodeError, Exception)):
-                if hasattr(self.fetcher, '_make_request'):
-                    self.fetcher._make_request('https://example.com')
+        monkeypatch.setattr('requests.get', Mock(return_value=ok_response))
+        
+        # A body without price data is rejected
+        ok_response.json.return_value = {"error": "unexpected"}
+        with pytest.raises(DataValidationError):
+            self.fetcher.get_crypto_prices_coingecko('bitcoin', 7)
+        
+        # A body that is not JSON at all is not retried
+        ok_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+        with pytest.raises(json.JSONDecodeError):
+            self.fetcher.get_crypto_prices_coingecko('bitcoin', 7)
 
-    def test_initialization_with_custom_parameters(self):
+    def test_initialization_with_custom_parameters(self, tmp_path, monkeypatch):
         """Test PriceFetcher initialization with custom parameters."""
-        custom_fetcher = PriceFetcher(
-            cache_dir="/tmp/test_cache",
-            rate_limit_crypto=5,
-            rate_limit_etf=3
-        )
+        # PriceFetcher takes its settings from the environment
+        cache_dir = tmp_path / "custom_cache"
+        monkeypatch.setenv('CACHE_DIRECTORY', str(cache_dir))
+        monkeypatch.setenv('CRYPTO_API_RATE_LIMIT', '5')
+        monkeypatch.setenv('ETF_API_RATE_LIMIT', '3')
+        
+        custom_fetcher = PriceFetcher()
         
-        assert custom_fetcher is not None
-        # Verify custom parameters are set (if accessible)
-        if hasattr(custom_fetcher, 'cache_dir'):
-            assert custom_fetcher.cache_dir == "/tmp/test_cache"
+        assert custom_fetcher.cache_directory == cache_dir
+        assert (cache_dir / 'crypto').is_dir()
+        assert (cache_dir / 'etf').is_dir()
+        assert custom_fetcher.crypto_rate_limit == 5
+        assert custom_fetcher.etf_rate_limit == 3
 
-    def test_concurrent_requests_handling(self):
+    @pytest.mark.usefixtures("unthrottled")
+    def test_concurrent_requests_handling(self, thread_pool, monkeypatch, ok_response):
         """Test handling of concurrent requests."""
-        import threading
-        import queue
+        ok_response.json.return_value = COINGECKO_BTC_RESPONSE
+        monkeypatch.setattr('requests.get', Mock(return_value=ok_response))
         
-        results = queue.Queue()
+        def fetch_price(_):
+            return self.fetcher.get_crypto_prices_coingecko('bitcoin', 2)
         
-        def fetch_price():
-            try:
-                if hasattr(self.fetcher, 'get_crypto_prices'):
-                    result = self.fetcher.get_crypto_prices('bitcoin', 1)
-                    results.put(('success', result))
-                else:
-                    results.put(('success', 'method_not_found'))
-            except Exception as e:
-                results.put(('error', str(e)))
+        # Run the fetches on pooled threads
+        results = list(thread_pool.map(fetch_price, range(3), timeout=5))
         
-        # Start multiple threads
-        threads = []
-        for _ in range(3):
-            thread = threading.Thread(target=fetch_price)
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all to complete
-        for thread in threads:
-            thread.join(timeout=5)
-        
-        # Check results
-        while not results.empty():
-            status, result = results.get()
-            # Should handle concurrent requests gracefully
-            assert status in ['success', 'error']
+        assert results == [[50000.0, 50500.0]] * 3
 
-    def test_cache_expiry(self):
+    def test_cache_expiry(self, fresh_fetcher):
         """Test cache expiry functionality."""
-        if hasattr(self.fetcher, '_is_cache_valid'):
-            # Test with old timestamp
-            old_time = datetime.now() - timedelta(hours=2)
-            is_valid = self.fetcher._is_cache_valid(old_time, 60)  # 60 min expiry
-            assert not is_valid
-            
-            # Test with recent timestamp
-            recent_time = datetime.now() - timedelta(minutes=30)
-            is_valid = self.fetcher._is_cache_valid(recent_time, 60)
-            assert is_valid
\ No newline at end of file
+        self._use_fresh_fetcher(fresh_fetcher)
+        self.fetcher.save_to_cache('crypto', 'bitcoin', 7, [50000.0])
+        cache_file = self.fetcher.get_cache_path('crypto', 'bitcoin', 7)
+        expiry_seconds = self.fetcher.cache_expiry_minutes * 60
+        
+        now = time.time()
+        
+        # Test with recent file
+        os.utime(cache_file, (now, now - expiry_seconds / 2))
+        assert self.fetcher.load_from_cache('crypto', 'bitcoin', 7) == [50000.0]
+        
+        # Test with old file; expired entries are deleted
+        os.utime(cache_file, (now, now - 2 * expiry_seconds))
+        assert self.fetcher.load_from_cache('crypto', 'bitcoin', 7) is None
+        assert not cache_file.exists()
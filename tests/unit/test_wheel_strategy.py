@@ -8,48 +8,90 @@ Tests cover:
 - Edge cases and error handling
 """
 
+import copy
+import csv
+import numpy as np
 import pytest
-from unittest.mock import Mock, patch
-from strategies.wheel_strategy import WheelStrategy, WheelState
+from types import MappingProxyType
+from unittest.mock import Mock, create_autospec, patch
+from data.price_fetcher import PriceFetcher
+from strategies.wheel_strategy import (
+    WheelStrategy, WheelState, Position, run_wheel, sweep_wheel, ACTION_NAMES, ACCOUNT_CAPITAL, ACCOUNT_PREMIUMS,
+    ACCOUNT_REALIZED, TRADE_FIELDNAMES, LOG_ACTION, LOG_CASH_FLOW, LOG_SYMBOL, LOG_WEEK,
+    _round_cents_array
+)
 from tests.conftest import MockPriceFetcher
 
 
-class TestWheelStrategy:
-    """Test suite for WheelStrategy class."""
+INITIAL_CAPITAL = 50000
+SYMBOLS = ['SPY', 'QQQ']
+WEEK_0_PRICES = MappingProxyType({'SPY': 450.0, 'QQQ': 370.0})
 
-    def setup_method(self):
-        """Set up test fixtures for each test method."""
-        self.initial_capital = 50000
-        self.symbols = ['SPY', 'QQQ']
-        self.mock_fetcher = Mock()
-        
-        # Create strategy instance
-        self.strategy = WheelStrategy(
-            symbols=self.symbols,
-            initial_capital=self.initial_capital,
-            price_fetcher=self.mock_fetcher
+# Position fields for seeding tests, e.g. Position(state=..., **SHARES_POSITION)
+SHARES_POSITION = MappingProxyType({
+    'shares': 100,
+    'cost_basis': 440.0,
+})
+COVERED_CALL_POSITION = MappingProxyType({
+    'shares': 100,
+    'cost_basis': 440.0,
+    'premium': 5.0,
+    'strike': 450.0,
+    'exp': 1,
+})
+
+
+@pytest.fixture
+def mock_fetcher():
+    """Price fetcher stub shared by a test and the strategies it builds."""
+    # Autospec'd so calls must match PriceFetcher's real methods and signatures
+    return create_autospec(PriceFetcher, instance=True)
+
+
+@pytest.fixture
+def strategy_factory(mock_fetcher):
+    """Build fresh strategies wired to the test's mock fetcher.
+    
+    Strategies load one week of mock prices, so tests feed later weeks'
+    prices to execute_week themselves.
+    """
+    def make(capital=INITIAL_CAPITAL, data_mode='mock'):
+        return WheelStrategy(
+            capital=capital,
+            symbols=list(SYMBOLS),
+            config={'test_mode': True, 'data_mode': data_mode, 'simulation': {'weeks_to_simulate': 1}},
+            price_fetcher=mock_fetcher
         )
+    return make
+
+
+@pytest.fixture
+def strategy(strategy_factory):
+    """A strategy instance for each test."""
+    return strategy_factory()
+
+
+class TestWheelStrategy:
+    """Test suite for WheelStrategy class."""
 
-    def test_initialization(self):
+    def test_initialization(self, strategy):
         """Test strategy initialization with correct parameters."""
-        assert self.strategy.symbols == self.symbols
-        assert self.strategy.initial_capital == self.initial_capital
-        assert self.strategy.available_capital == self.initial_capital
-        assert len(self.strategy.positions) == len(self.symbols)
-        
-        # Check initial state for each symbol
-        for symbol in self.symbols:
-            assert symbol in self.strategy.positions
-            assert self.strategy.positions[symbol]['state'] == WheelState.READY
+        assert strategy.symbols == SYMBOLS
+        assert strategy.initial_capital == INITIAL_CAPITAL
+        assert strategy.capital == INITIAL_CAPITAL
+        assert strategy.available_capital == INITIAL_CAPITAL
+        assert list(strategy.positions) == SYMBOLS
+        
+        # Every symbol starts out ready to sell a put
+        for symbol in SYMBOLS:
+            assert strategy.get_position(symbol) == Position(state=WheelState.CASH_SECURED_PUT)
 
-    def test_state_transitions_cash_secured_put(self):
-        """Test state transition from READY to PUT_SOLD."""
+    def test_state_transitions_cash_secured_put(self, strategy):
+        """Test selling a cash-secured put opens an option on the position."""
         symbol = 'SPY'
-        mock_price = 450.0
-        self.mock_fetcher.get_current_price.return_value = mock_price
         
         # Execute first step (should sell put)
-        trades = self.strategy.execute_week(0, {symbol: mock_price})
+        trades = strategy.execute_week(0, dict(WEEK_0_PRICES))
         
         # Verify trade was executed
         assert len(trades) == 1
@@ -58,50 +100,45 @@ class TestWheelStrategy:
         assert trade['action'] == 'SELL_PUT'
         assert trade['cash_flow'] > 0  # Premium received
         
-        # Verify state transition
-        assert self.strategy.positions[symbol]['state'] == WheelState.PUT_SOLD
+        # The put stays open until next week
+        position = strategy.get_position(symbol)
+        assert position.state == WheelState.CASH_SECURED_PUT
+        assert position.strike == 427.5
+        assert position.exp == 1
 
-    def test_assignment_scenario(self):
+    def test_assignment_scenario(self, strategy):
         """Test assignment scenario when put is in-the-money."""
         symbol = 'SPY'
-        initial_price = 450.0
-        assignment_price = 440.0  # Lower than strike, triggering assignment
+        assignment_price = 400.0  # Lower than strike, triggering assignment
         
         # First, sell a put
-        self.mock_fetcher.get_current_price.return_value = initial_price
-        trades1 = self.strategy.execute_week(0, {symbol: initial_price})
+        strategy.execute_week(0, dict(WEEK_0_PRICES))
         
         # Simulate assignment scenario
-        self.mock_fetcher.get_current_price.return_value = assignment_price
-        trades2 = self.strategy.execute_week(1, {symbol: assignment_price})
+        trades = strategy.execute_week(1, dict(WEEK_0_PRICES, SPY=assignment_price))
         
         # Should have assignment trade
         assignment_trade = next(
-            (t for t in trades2 if t['action'] == 'BUY_SHARES'), None
+            (t for t in trades if t['action'] == 'BUY_SHARES'), None
         )
         assert assignment_trade is not None
         assert assignment_trade['symbol'] == symbol
-        assert assignment_trade['cash_flow'] < 0  # Money spent on shares
+        assert assignment_trade['cash_flow'] == pytest.approx(-427.5 * 100)  # Money spent on shares
         
-        # State should transition to SHARES_OWNED
-        assert self.strategy.positions[symbol]['state'] == WheelState.SHARES_OWNED
+        # State should transition to HOLDING_SHARES
+        position = strategy.get_position(symbol)
+        assert position.state == WheelState.HOLDING_SHARES
+        assert position.shares == 100
+        assert position.cost_basis == 427.5
 
-    def test_covered_call_scenario(self):
+    def test_covered_call_scenario(self, strategy):
         """Test covered call after owning shares."""
         symbol = 'SPY'
         
         # Set up position with owned shares
-        self.strategy.positions[symbol] = {
-            'state': WheelState.SHARES_OWNED,
-            'shares': 100,
-            'cost_basis': 440.0,
-            'option_premium': 0
-        }
-        
-        current_price = 445.0
-        self.mock_fetcher.get_current_price.return_value = current_price
+        strategy.set_position(symbol, Position(state=WheelState.HOLDING_SHARES, **SHARES_POSITION))
         
-        trades = self.strategy.execute_week(2, {symbol: current_price})
+        trades = strategy.execute_week(0, dict(WEEK_0_PRICES, SPY=445.0))
         
         # Should sell covered call
         call_trade = next(
@@ -110,110 +147,93 @@ class TestWheelStrategy:
         assert call_trade is not None
         assert call_trade['cash_flow'] > 0  # Premium received
         
-        # State should transition to CALL_SOLD
-        assert self.strategy.positions[symbol]['state'] == WheelState.CALL_SOLD
+        # The shares stay held with the call open against them
+        position = strategy.get_position(symbol)
+        assert position.state == WheelState.HOLDING_SHARES
+        assert position.strike == 467.25
 
-    def test_capital_management(self):
+    def test_capital_management(self, strategy):
         """Test that capital is properly managed across trades."""
-        symbol = 'SPY'
-        initial_available = self.strategy.available_capital
+        trades = strategy.execute_week(0, dict(WEEK_0_PRICES))
         
-        # Mock price and execute trade
-        self.mock_fetcher.get_current_price.return_value = 450.0
-        trades = self.strategy.execute_week(0, {symbol: 450.0})
+        # Cash flow should be accounted for
+        total_cash_flow = sum(trade['cash_flow'] for trade in trades)
+        assert strategy.capital == pytest.approx(INITIAL_CAPITAL + total_cash_flow)
         
-        if trades:
-            # Available capital should be updated
-            assert self.strategy.available_capital != initial_available
-            
-            # Cash flow should be accounted for
-            total_cash_flow = sum(trade['cash_flow'] for trade in trades)
-            expected_capital = initial_available + total_cash_flow
-            assert abs(self.strategy.available_capital - expected_capital) < 0.01
-
-    def test_multiple_symbols_execution(self):
+        # The open put's strike is reserved
+        reserved = strategy.get_position('SPY').strike * 100
+        assert strategy.available_capital == pytest.approx(strategy.capital - reserved)
+
+    def test_multiple_symbols_execution(self, strategy_factory):
         """Test execution with multiple symbols."""
-        prices = {'SPY': 450.0, 'QQQ': 380.0}
+        strategy = strategy_factory(capital=100000)  # Enough to secure both puts
         
-        self.mock_fetcher.get_current_price.side_effect = lambda symbol: prices[symbol]
+        trades = strategy.execute_week(0, dict(WEEK_0_PRICES))
         
-        trades = self.strategy.execute_week(0, prices)
-        
-        # Should have trades for both symbols (if capital allows)
-        symbols_traded = {trade['symbol'] for trade in trades}
-        assert len(symbols_traded) >= 1  # At least one symbol should trade
+        assert {trade['symbol'] for trade in trades} == set(SYMBOLS)
 
-    def test_insufficient_capital_scenario(self):
+    def test_insufficient_capital_scenario(self, strategy_factory):
         """Test behavior when insufficient capital for trades."""
-        # Reduce available capital significantly
-        self.strategy.available_capital = 1000  # Very low
-        
-        symbol = 'SPY'
-        self.mock_fetcher.get_current_price.return_value = 450.0
+        strategy = strategy_factory(capital=1000)  # Too little to secure any put
         
-        trades = self.strategy.execute_week(0, {symbol: 450.0})
+        trades = strategy.execute_week(0, dict(WEEK_0_PRICES))
         
-        # Should handle gracefully - either no trades or appropriate sizing
-        for trade in trades:
-            # Any executed trade should not exceed available capital
-            if trade['cash_flow'] < 0:  # Outflow
-                assert abs(trade['cash_flow']) <= self.strategy.available_capital + 100
+        assert trades == []
+        assert strategy.capital == 1000
 
-    def test_get_current_portfolio_value(self):
+    def test_get_current_portfolio_value(self, strategy):
         """Test portfolio value calculation."""
         # Set up a position with shares
         symbol = 'SPY'
-        shares = 100
+        shares = SHARES_POSITION['shares']
         current_price = 450.0
         
-        self.strategy.positions[symbol] = {
-            'state': WheelState.SHARES_OWNED,
-            'shares': shares,
-            'cost_basis': 440.0,
-            'option_premium': 0
-        }
+        strategy.set_position(symbol, Position(state=WheelState.HOLDING_SHARES, **SHARES_POSITION))
+        strategy.prices = {symbol: [current_price], 'QQQ': [WEEK_0_PRICES['QQQ']]}
         
-        self.mock_fetcher.get_current_price.return_value = current_price
+        portfolio_value = strategy.get_current_portfolio_value()
         
-        portfolio_value = self.strategy.get_current_portfolio_value({symbol: current_price})
-        
-        # Should include cash + share value
-        expected_value = self.strategy.available_capital + (shares * current_price)
+        # Should include cash + unrealized gain on the shares
+        expected_value = strategy.capital + shares * (current_price - SHARES_POSITION['cost_basis'])
         assert abs(portfolio_value - expected_value) < 0.01
 
-    def test_error_handling_missing_price(self):
-        """Test error handling when price data is missing."""
-        symbol = 'SPY'
+    def test_live_prices_come_from_fetcher(self, strategy_factory, mock_fetcher):
+        """In live mode each symbol's prices are fetched through get_prices."""
+        history = {'SPY': [440.0], 'QQQ': [360.0]}
+        mock_fetcher.get_prices.side_effect = lambda symbol, asset_type, days: list(history[symbol])
         
-        # Mock fetcher to raise exception
-        self.mock_fetcher.get_current_price.side_effect = Exception("Price not available")
+        strategy = strategy_factory(data_mode='live')
         
-        # Should handle gracefully without crashing
-        try:
-            trades = self.strategy.execute_week(0, {})
-            # If it returns, should be empty or handle the error
-            assert isinstance(trades, list)
-        except Exception as e:
-            # If it raises, should be a meaningful error
-            assert "Price not available" in str(e) or "price" in str(e).lower()
-
-    def test_deterministic_behavior(self):
+        assert strategy.prices == {symbol: tuple(p) for symbol, p in history.items()}
+        mock_fetcher.get_prices.assert_any_call('SPY', 'etf', 7)
+
+    def test_prices_view_is_read_only(self, strategy):
+        """In-place edits of the prices view raise; the setter is the write path."""
+        with pytest.raises(TypeError):
+            strategy.prices['SPY'][0] = 1.0
+        with pytest.raises(TypeError):
+            strategy.prices['SPY'] = [1.0]
+
+        strategy.prices = {'SPY': [1.0], 'QQQ': [2.0]}
+        assert strategy.prices['SPY'] == (1.0,)
+
+    def test_error_handling_missing_price(self, strategy):
+        """Symbols without a price passed in trade at their loaded mock price."""
+        trades = strategy.execute_week(0, {'QQQ': WEEK_0_PRICES['QQQ']})
+        
+        # SPY still trades, priced from the mock data loaded at startup
+        assert [t['symbol'] for t in trades] == ['SPY']
+        assert trades[0]['strike'] == 427.5
+
+    def test_deterministic_behavior(self, strategy):
         """Test that strategy behavior is deterministic given same inputs."""
-        symbol = 'SPY'
-        price = 450.0
         week = 0
         
-        self.mock_fetcher.get_current_price.return_value = price
-        
         # Execute same scenario twice
-        strategy2 = WheelStrategy(
-            symbols=self.symbols,
-            initial_capital=self.initial_capital,
-            price_fetcher=self.mock_fetcher
-        )
+        strategy2 = copy.deepcopy(strategy)
         
-        trades1 = self.strategy.execute_week(week, {symbol: price})
-        trades2 = strategy2.execute_week(week, {symbol: price})
+        trades1 = strategy.execute_week(week, dict(WEEK_0_PRICES))
+        trades2 = strategy2.execute_week(week, dict(WEEK_0_PRICES))
         
         # Results should be identical
         assert len(trades1) == len(trades2)
@@ -227,32 +247,334 @@ class TestWheelStrategy:
         WheelState.HOLDING_SHARES,
         WheelState.COVERED_CALL
     ])
-    def test_all_state_transitions(self, state):
+    def test_all_state_transitions(self, strategy, state):
         """Test behavior from all possible states."""
         symbol = 'SPY'
-        price = 450.0
         
         # Set up specific state
         if state == WheelState.HOLDING_SHARES:
-            self.strategy.positions[symbol] = {
-                'state': state,
-                'shares': 100,
-                'cost_basis': 440.0,
-                'option_premium': 0
-            }
+            strategy.set_position(symbol, Position(state=state, **SHARES_POSITION))
         elif state == WheelState.COVERED_CALL:
-            self.strategy.positions[symbol] = {
-                'state': state,
-                'shares': 100,
-                'cost_basis': 440.0,
-                'call_strike': 450.0,
-                'option_premium': 5.0
-            }
+            strategy.set_position(symbol, Position(state=state, **COVERED_CALL_POSITION))
         else:
-            self.strategy.positions[symbol]['state'] = state
-        
-        self.mock_fetcher.get_current_price.return_value = price
+            strategy.set_position(symbol, Position(state=state))
         
         # Should handle any state without crashing
-        trades = self.strategy.execute_week(0, {symbol: price})
-        assert isinstance(trades, list)
\ No newline at end of file
+        trades = strategy.execute_week(0, dict(WEEK_0_PRICES))
+        assert isinstance(trades, list)
+
+
+class TestWheelKernel:
+    """Test suite for the numeric wheel kernel used by parameter sweeps."""
+
+    def setup_method(self):
+        """Set up a deterministic strategy instance."""
+        self.strategy = WheelStrategy(
+            capital=150000,
+            symbols=['SPY', 'QQQ', 'IWM'],
+            config={'test_mode': True, 'simulation': {'weeks_to_simulate': 8}}
+        )
+
+    def test_round_cents_array_matches_round(self):
+        """Array rounding agrees with Python's round, including near half cents."""
+        prices = np.array([369.075, 427.5 * 0.95, 0.125, 1.005, 445.0 * 1.05, 2.675, 100.0])
+
+        assert _round_cents_array(prices).tolist() == [round(p, 2) for p in prices.tolist()]
+
+    def test_simulate_matches_run(self, tmp_path, monkeypatch):
+        """Kernel trade log and account should match the full run() simulation."""
+        monkeypatch.chdir(tmp_path)
+        trade_log, account = self.strategy.simulate(8)
+
+        trades = self.strategy.run(backtest=True, num_weeks=8)
+
+        assert len(trade_log) == len(trades)
+        for row, trade in zip(trade_log, trades):
+            assert trade['week'] == f"Week{int(row[LOG_WEEK])}"
+            assert trade['symbol'] == self.strategy.symbols[int(row[LOG_SYMBOL])]
+            assert trade['action'] == ACTION_NAMES[int(row[LOG_ACTION])]
+            assert trade['cash_flow'] == pytest.approx(row[LOG_CASH_FLOW])
+        assert account[ACCOUNT_CAPITAL] == pytest.approx(self.strategy.capital)
+        assert account[ACCOUNT_PREMIUMS] == pytest.approx(self.strategy.total_premiums_collected)
+        assert account[ACCOUNT_REALIZED] == pytest.approx(self.strategy.realized_gains)
+
+    def test_quiet_run_matches_verbose_run(self, tmp_path, monkeypatch):
+        """Quiet runs replay kernel trades into the same trades and positions."""
+        monkeypatch.chdir(tmp_path)
+        quiet = WheelStrategy(
+            capital=150000,
+            symbols=['SPY', 'QQQ', 'IWM'],
+            config={'test_mode': True, 'verbose': False}
+        )
+
+        verbose_trades = self.strategy.run(backtest=True, num_weeks=8)
+        quiet_trades = quiet.run(backtest=True, num_weeks=8)
+
+        def without_timestamps(trades):
+            return [{k: v for k, v in t.items() if k != 'timestamp'} for t in trades]
+
+        assert without_timestamps(quiet_trades) == without_timestamps(verbose_trades)
+        assert quiet.positions == self.strategy.positions
+        assert quiet.current_week == self.strategy.current_week
+        assert quiet.available_capital == pytest.approx(self.strategy.available_capital)
+        assert quiet.get_total_pnl() == pytest.approx(self.strategy.get_total_pnl())
+
+    def test_long_deterministic_horizon(self, tmp_path, monkeypatch):
+        """Deterministic prices cover horizons past 8 weeks by repeating the cycle."""
+        monkeypatch.chdir(tmp_path)
+        strategy = WheelStrategy(
+            capital=150000,
+            symbols=['SPY'],
+            config={'test_mode': True, 'verbose': False, 'simulation': {'weeks_to_simulate': 20}}
+        )
+
+        prices = strategy.prices['SPY']
+        assert len(prices) == 20
+        assert prices[8:16] == prices[:8]
+
+        trades = strategy.run(backtest=True)
+        assert strategy.current_week == 19
+        assert all(t['price'] > 0 for t in trades)
+
+    def test_simulate_paths_matches_simulate(self):
+        """Each Monte-Carlo path gives the same account as simulate() on its own prices."""
+        paths = np.stack([self.strategy.price_matrix, self.strategy.price_matrix * 1.1])
+
+        accounts, trade_counts, values = self.strategy.simulate_paths(paths)
+
+        for p in range(len(paths)):
+            strategy = WheelStrategy(
+                capital=150000,
+                symbols=['SPY', 'QQQ', 'IWM'],
+                config={'test_mode': True, 'simulation': {'weeks_to_simulate': 8}}
+            )
+            strategy._set_price_matrix(paths[p].copy())
+            trade_log, account = strategy.simulate(8)
+            np.testing.assert_array_equal(accounts[p], account)
+            assert trade_counts[p] == len(trade_log)
+        assert not np.array_equal(accounts[0], accounts[1])
+        assert values[0] != values[1]
+
+    def test_simulate_paths_then_sweep_in_one_process(self):
+        """Sweeps still work after parallel Monte-Carlo runs in the same process."""
+        self.strategy.simulate_paths(self.strategy.random_price_paths(4, seed=1))
+
+        params = {'capital': 150000, 'symbols': ['SPY'], 'config': {'test_mode': True}, 'num_weeks': 8}
+        results = sweep_wheel([params], max_workers=1)
+
+        np.testing.assert_array_equal(results[0][1], run_wheel(params)[1])
+
+    def test_random_price_paths(self):
+        """Random paths start at the base prices and are reproducible by seed."""
+        paths = self.strategy.random_price_paths(50, num_weeks=12, seed=3)
+
+        assert paths.shape == (50, 3, 12)
+        assert paths[:, :, 0].tolist() == [[450.0, 370.0, 210.0]] * 50
+        np.testing.assert_array_equal(paths, self.strategy.random_price_paths(50, num_weeks=12, seed=3))
+
+        with pytest.raises(ValueError):
+            self.strategy.random_price_paths(5, num_weeks=0)
+
+    def test_sweep_matches_individual_runs(self):
+        """Parallel sweeps return the same results as simulating each config."""
+        param_sets = [
+            {
+                'capital': 150000,
+                'symbols': ['SPY', 'QQQ'],
+                'config': {'test_mode': True, 'wheel_strategy': {'put_strike_pct': pct}},
+                'num_weeks': 8,
+            }
+            for pct in (0.95, 0.97)
+        ]
+
+        results = sweep_wheel(param_sets, max_workers=2)
+
+        assert len(results) == len(param_sets)
+        for params, (trade_log, account) in zip(param_sets, results):
+            expected_log, expected_account = run_wheel(params)
+            np.testing.assert_array_equal(trade_log, expected_log)
+            np.testing.assert_array_equal(account, expected_account)
+
+    def test_simulate_leaves_strategy_untouched(self):
+        """simulate() works on copies of the positions and capital."""
+        self.strategy.simulate(8)
+
+        assert self.strategy.trades == []
+        assert self.strategy.capital == 150000
+        assert self.strategy.get_position_info('SPY')['current_strike'] is None
+
+
+class TestWheelPositions:
+    """Test suite for the array-backed wheel positions."""
+
+    def setup_method(self):
+        """Set up a single-symbol strategy fed prices week by week."""
+        self.strategy = WheelStrategy(
+            capital=50000,
+            symbols=['SPY'],
+            config={'test_mode': True, 'simulation': {'weeks_to_simulate': 1}}
+        )
+
+    def test_put_assignment_updates_position_info(self):
+        """A put sold in week 0 is assigned when the price falls below its strike."""
+        self.strategy.execute_week(0, {'SPY': 450.0})
+        position = self.strategy.get_position_info('SPY')
+        assert position['state'] == WheelState.CASH_SECURED_PUT
+        assert position['current_strike'] == 427.5
+        assert position['expiration_date'] == 1
+
+        trades = self.strategy.execute_week(1, {'SPY': 400.0})
+        position = self.strategy.get_position_info('SPY')
+        assert [t['action'] for t in trades] == ['BUY_SHARES']
+        assert position['state'] == WheelState.HOLDING_SHARES
+        assert position['shares'] == 100
+        assert position['cost_basis'] == 427.5
+        assert position['current_strike'] is None
+        assert self.strategy.positions == {'SPY': position}
+
+    def test_unrealized_pnl_counts_only_holders(self):
+        """Unrealized P&L is zero until shares are held, then marks them to market."""
+        self.strategy.execute_week(0, {'SPY': 450.0})
+        assert self.strategy.calculate_unrealized_pnl() == 0.0
+
+        self.strategy.execute_week(1, {'SPY': 400.0})
+        assert self.strategy.calculate_unrealized_pnl() == pytest.approx((400.0 - 427.5) * 100)
+        assert self.strategy.get_current_portfolio_value() == pytest.approx(
+            self.strategy.capital + self.strategy.unrealized_pnl)
+
+    def test_get_position_snapshot(self):
+        """get_position returns a slotted snapshot matching get_position_info."""
+        self.strategy.execute_week(0, {'SPY': 450.0})
+        position = self.strategy.get_position('SPY')
+
+        assert position == Position(state=WheelState.CASH_SECURED_PUT, premium=position.premium,
+                                    strike=427.5, exp=1)
+        assert position.premium > 0
+        assert not hasattr(position, '__dict__')
+        assert self.strategy.get_position_info('SPY')['current_strike'] == position.strike
+
+    def test_set_position_seeds_arrays(self):
+        """set_position round-trips through get_position and reserves the shares' cost."""
+        position = Position(state=WheelState.HOLDING_SHARES, **SHARES_POSITION)
+
+        self.strategy.set_position('SPY', position)
+
+        assert self.strategy.get_position('SPY') == position
+        assert self.strategy.positions['SPY']['shares'] == 100
+        assert self.strategy.available_capital == pytest.approx(50000 - 100 * 440.0)
+        with pytest.raises(KeyError):
+            self.strategy.set_position('QQQ', position)
+
+    def test_positions_view_is_read_only(self):
+        """Writes through the positions view raise instead of being dropped."""
+        with pytest.raises(TypeError):
+            self.strategy.positions['SPY']['shares'] = 100
+        with pytest.raises(TypeError):
+            self.strategy.positions['SPY'] = dict(SHARES_POSITION)
+
+        assert self.strategy.get_position('SPY').shares == 0
+
+    def test_unknown_symbol_has_no_position(self):
+        """get_position_info returns an empty dict for symbols not traded."""
+        assert self.strategy.get_position_info('QQQ') == {}
+        assert self.strategy.get_position('QQQ') is None
+
+
+class TestWheelLiveData:
+    """Test suite for loading live prices through a PriceFetcher."""
+
+    def test_fetch_live_prices_keeps_symbol_order_and_falls_back(self):
+        """Concurrent fetches keep symbol order; failed symbols use mock prices."""
+        def get_prices(symbol, asset_type, days):
+            if symbol == 'QQQ':
+                raise ValueError("no data")
+            return [100.0, 101.0, 102.0]
+
+        fetcher = Mock()
+        fetcher.get_prices.side_effect = get_prices
+        strategy = WheelStrategy(
+            capital=50000,
+            symbols=['SPY', 'QQQ', 'IWM'],
+            config={'data_mode': 'live', 'test_mode': True, 'simulation': {'weeks_to_simulate': 3}},
+            price_fetcher=fetcher
+        )
+
+        assert list(strategy.prices) == ['SPY', 'QQQ', 'IWM']
+        assert strategy.prices['SPY'] == (100.0, 101.0, 102.0)
+        assert strategy.prices['IWM'] == (100.0, 101.0, 102.0)
+        assert strategy.prices['QQQ'] == tuple(strategy._generate_mock_prices_for_symbol('QQQ'))
+
+
+class TestWheelOutput:
+    """Test suite for wheel trade records and exports."""
+
+    def setup_method(self):
+        """Set up a deterministic strategy instance."""
+        self.strategy = WheelStrategy(
+            capital=150000,
+            symbols=['SPY', 'QQQ'],
+            config={'test_mode': True, 'simulation': {'weeks_to_simulate': 8}}
+        )
+
+    def test_trade_array_matches_trades(self, tmp_path, monkeypatch):
+        """The structured trade array mirrors the trade dicts."""
+        monkeypatch.chdir(tmp_path)
+        trades = self.strategy.run(backtest=True, num_weeks=8)
+        trade_array = self.strategy.get_trade_array()
+
+        assert len(trade_array) == len(trades)
+        for record, trade in zip(trade_array, trades):
+            assert trade['week'] == f"Week{record['week']}"
+            assert trade['symbol'] == self.strategy.symbols[record['symbol_idx']]
+            assert trade['action'] == ACTION_NAMES[record['action']]
+            assert trade['cash_flow'] == pytest.approx(record['cash_flow'])
+
+    def test_quiet_mode_buffers_log(self, tmp_path, monkeypatch, caplog):
+        """With verbose off, simulation messages are buffered instead of logged."""
+        monkeypatch.chdir(tmp_path)
+        strategy = WheelStrategy(
+            capital=150000,
+            symbols=['SPY', 'QQQ'],
+            config={'test_mode': True, 'verbose': False}
+        )
+
+        with caplog.at_level('INFO', logger='strategies.wheel_strategy'):
+            strategy.run(backtest=True, num_weeks=8)
+
+        log = strategy.get_log()
+        assert "=== SIMULATION COMPLETE ===" in log
+        assert "SPY: Sold put with strike" in log
+        assert "SIMULATION COMPLETE" not in caplog.text
+
+    def test_summary_reflects_edited_trades(self, tmp_path, monkeypatch):
+        """Action counts and the net cash flow both come from the trade dicts."""
+        monkeypatch.chdir(tmp_path)
+        strategy = WheelStrategy(
+            capital=150000,
+            symbols=['SPY', 'QQQ'],
+            config={'test_mode': True, 'verbose': False}
+        )
+        strategy.run(backtest=True, num_weeks=2)
+        del strategy.trades[1:]
+        strategy.trades[0]['cash_flow'] = 123.0
+
+        strategy.print_trades_summary()
+
+        assert strategy.get_log().endswith("Net Cash Flow: $123.00\n")
+
+    def test_export_trades_to_csv(self, tmp_path, monkeypatch):
+        """Exported rows follow the trade record fields, with one header."""
+        monkeypatch.chdir(tmp_path)
+        self.strategy.run(backtest=True, num_weeks=8)
+
+        csv_path = tmp_path / "wheel_trades.csv"
+        self.strategy.export_trades_to_csv(str(csv_path))
+
+        with open(csv_path, newline='') as f:
+            rows = list(csv.reader(f))
+
+        assert tuple(rows[0]) == TRADE_FIELDNAMES
+        assert len(rows) == 1 + len(self.strategy.trades)
+        first = dict(zip(TRADE_FIELDNAMES, rows[1]))
+        assert first['action'] == self.strategy.trades[0]['action']
+        assert float(first['cash_flow']) == pytest.approx(self.strategy.trades[0]['cash_flow'])